@@ -0,0 +1,11 @@
+"""
+Benchmarks for python-validator.
+
+Run a benchmark as a module from the root of the repository, e.g.::
+
+    python -m benchmarks.bench_plan
+
+`benchmarks.suite` runs all field types and schema shapes and emits JSON results::
+
+    python -m benchmarks.suite --output results.json
+"""
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals
+import timeit
+from validator import Validator, StringField, IntegerField, EnumField
+
+
+def make_flat_validator(n_fields, name='FlatValidator', compiled=None):
+    """
+    create a Validator with `n_fields` fields, cycling over string, integer and enum fields
+    """
+    attrs = {'COMPILED': compiled}
+    for i in range(n_fields):
+        kind = i % 3
+        if kind == 0:
+            attrs['f{}'.format(i)] = StringField(max_length=50, required=True)
+        elif kind == 1:
+            attrs['f{}'.format(i)] = IntegerField(min_value=0, max_value=1000, default=1)
+        else:
+            attrs['f{}'.format(i)] = EnumField(choices=['a', 'b', 'c'])
+    return type(str(name), (Validator, ), attrs)
+
+
+def make_flat_record(n_fields, valid=True):
+    record = {}
+    for i in range(n_fields):
+        kind = i % 3
+        if kind == 0:
+            record['f{}'.format(i)] = 'value-{}'.format(i)
+        elif kind == 1:
+            record['f{}'.format(i)] = i if valid else 'not an integer'
+        else:
+            record['f{}'.format(i)] = 'a'
+    return record
+
+
+def per_call_us(func, number=2000, repeat=5):
+    """
+    return the best time of one `func()` call in microseconds
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def report(title, rows):
+    print(title)
+    width = max(len(row[0]) for row in rows)
+    for label, value in rows:
+        print('  {0:<{1}} {2:10.2f} us/record'.format(label, width, value))
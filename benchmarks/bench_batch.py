@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+Compare `Validator.validate_many` with a loop of `Validator(data).is_valid()`.
+"""
+from __future__ import print_function, unicode_literals
+from ._utils import make_flat_validator, make_flat_record, per_call_us, report
+
+N_FIELDS = 10
+BATCH_SIZE = 1000
+
+
+def main():
+    V = make_flat_validator(N_FIELDS)
+    records = [make_flat_record(N_FIELDS, valid=i % 10 != 0) for i in range(BATCH_SIZE)]
+
+    def loop():
+        for record in records:
+            V(record).is_valid()
+
+    looped = per_call_us(loop, number=50) / BATCH_SIZE
+    batched = per_call_us(lambda: V.validate_many(records), number=50) / BATCH_SIZE
+    report('{} fields, batches of {} records, 10% invalid'.format(N_FIELDS, BATCH_SIZE), [
+        ('is_valid() loop', looped),
+        ('validate_many', batched),
+    ])
+    print('  speedup: {:.2f}x'.format(looped / batched))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Compare `Validator.validate_columns` with `validate_many` over the same data as row dicts.
+NumPy columns are measured too when NumPy is installed.
+"""
+from __future__ import print_function, unicode_literals
+import random
+from validator import Validator, StringField, IntegerField, FloatField, EnumField
+from ._utils import per_call_us, report
+
+N_ROWS = 100000
+
+
+class TelemetryValidator(Validator):
+    device = StringField(max_length=20, required=True)
+    count = IntegerField(min_value=0, max_value=10000)
+    value = FloatField(min_value=-100, max_value=100)
+    level = EnumField(choices=['debug', 'info', 'warning', 'error'])
+
+
+def main():
+    random.seed(0)
+    columns = {
+        'device': ['dev-{}'.format(i % 500) for i in range(N_ROWS)],
+        'count': [random.randint(0, 10000) for _ in range(N_ROWS)],
+        'value': [random.uniform(-100, 100) for _ in range(N_ROWS)],
+        'level': [random.choice(['debug', 'info', 'warning', 'error']) for _ in range(N_ROWS)],
+    }
+    rows = [dict((name, column[i]) for name, column in columns.items()) for i in range(N_ROWS)]
+    rows_us = per_call_us(lambda: TelemetryValidator.validate_many(rows), number=1, repeat=3) / N_ROWS
+    columns_us = per_call_us(lambda: TelemetryValidator.validate_columns(columns), number=1, repeat=3) / N_ROWS
+    results = [('validate_many (rows)', rows_us), ('validate_columns (lists)', columns_us)]
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        arrays = dict((name, numpy.array(column)) for name, column in columns.items())
+        arrays_us = per_call_us(lambda: TelemetryValidator.validate_columns(arrays), number=1, repeat=3) / N_ROWS
+        results.append(('validate_columns (numpy)', arrays_us))
+    report('{} rows, 4 fields, per row'.format(N_ROWS), results)
+
+
+if __name__ == '__main__':
+    main()
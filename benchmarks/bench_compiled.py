@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the interpreted and the compiled validate path on flat schemas of
+StringField/IntegerField/EnumField.
+"""
+from __future__ import print_function, unicode_literals
+from ._utils import make_flat_validator, make_flat_record, per_call_us, report
+
+
+def main():
+    for n_fields in (10, 30, 100):
+        Interpreted = make_flat_validator(n_fields, 'Interpreted', compiled=False)
+        Compiled = make_flat_validator(n_fields, 'Compiled', compiled=True)
+        record = make_flat_record(n_fields)
+        assert Interpreted(record).is_valid() and Compiled(record).is_valid()
+
+        interpreted = per_call_us(lambda: Interpreted(record).is_valid(), number=1000)
+        compiled = per_call_us(lambda: Compiled(record).is_valid(), number=1000)
+        report('{} fields, valid records'.format(n_fields), [
+            ('interpreted', interpreted),
+            ('compiled', compiled),
+        ])
+        print('  speedup: {:.2f}x'.format(interpreted / compiled))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the time and the memory allocated by the copy modes of DictField
+on a document carrying a large free-form blob.
+"""
+from __future__ import print_function, unicode_literals
+import tracemalloc
+from validator import Validator, DictField, StringField
+from ._utils import per_call_us
+
+
+def make_blob():
+    return {'events': [{'id': i, 'tags': ['a', 'b', 'c'], 'payload': {'x': i, 'y': [i] * 5}}
+                       for i in range(2000)]}
+
+
+def main():
+    record = {'name': 'doc', 'blob': make_blob()}
+    print('document with a blob of {} events'.format(len(record['blob']['events'])))
+    for mode in ('deep', 'shallow', 'none'):
+        V = type(str('V'), (Validator, ), {'name': StringField(), 'blob': DictField(copy=mode)})
+        us = per_call_us(lambda: V(record).is_valid(), number=10, repeat=3)
+
+        tracemalloc.start()
+        v = V(record)
+        v.is_valid()
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print('  {0:<8} {1:12.2f} us/record {2:12d} bytes allocated'.format(mode, us, size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the fast parsers of `DatetimeField`/`DateField` (`validator.dtparse`) with `strptime`.
+"""
+from __future__ import print_function, unicode_literals
+from validator import DatetimeField, DateField
+from ._utils import per_call_us
+
+CASES = [
+    (DatetimeField, '%Y/%m/%d %H:%M:%S', '2018/07/01 17:01:20'),
+    (DatetimeField, '%Y-%m-%dT%H:%M:%S', '2018-07-01T17:01:20'),
+    (DatetimeField, '%Y-%m-%d %H:%M:%S.%f', '2018-07-01 17:01:20.123456'),
+    (DateField, '%Y/%m/%d', '2018/07/01'),
+    (DateField, '%Y-%m-%d', '2018-07-01'),
+    (DateField, '%d.%m.%Y', '01.07.2018'),
+]
+
+
+def main():
+    print('{0:<10} {1:<24} {2:>12} {3:>12} {4:>12}'.format(
+        'field', 'format', 'strptime us', 'field us', 'speedup'))
+    for field_class, dt_format, value in CASES:
+        fast = field_class(dt_format=dt_format)
+        slow = field_class(dt_format=dt_format)
+        slow._parse = None
+        strptime_us = per_call_us(lambda: slow._check_value(value), number=20000)
+        field_us = per_call_us(lambda: fast._check_value(value), number=20000)
+        assert fast._check_value(value) == slow._check_value(value)
+        print('{0:<10} {1:<24} {2:12.2f} {3:12.2f} {4:11.2f}x'.format(
+            field_class.__name__, dt_format, strptime_us, field_us, strptime_us / field_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the linear-time email matcher (`validator.fields._match_email`) with a match of
+`EmailField.REGEX`, on normal and pathological inputs. `EmailField._match` uses the regex for
+values of at most `EmailField.REGEX_MAX_LENGTH` characters and the matcher for longer values.
+"""
+from __future__ import print_function, unicode_literals
+import re
+from validator import EmailField
+from validator.fields import _match_email
+from ._utils import per_call_us
+
+INPUTS = [
+    ('valid', 'foo.bar@mail.example.com'),
+    ('invalid', '<foo>@example.com'),
+    ('long label', 'a@' + 'a' * 5000 + '!'),
+    ('many labels', 'a@' + 'ab.' * 4000 + '!'),
+    ('long labels', 'a@' + ('a' * 61 + '.') * 200 + '-'),
+    ('long local', 'a' * 5000 + '@'),
+]
+
+
+def main():
+    regex = re.compile(EmailField.REGEX)
+    field = EmailField()
+    print('{0:<12} {1:>7} {2:>12} {3:>12} {4:>12}'.format('input', 'length', 'regex us', 'matcher us', 'field us'))
+    for label, value in INPUTS:
+        number = 20000 if len(value) < 100 else 50
+        regex_us = per_call_us(lambda: regex.match(value), number=number)
+        matcher_us = per_call_us(lambda: _match_email(value), number=number)
+        field_us = per_call_us(lambda: field._match(value), number=number)
+        print('{0:<12} {1:>7} {2:12.2f} {3:12.2f} {4:12.2f}'.format(label, len(value), regex_us, matcher_us, field_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the exception-free `_check_value` protocol used by Validator with
+raising `FieldValidationError` from `field.validate`, on a 99% invalid and a
+99% valid workload.
+"""
+from __future__ import print_function, unicode_literals
+from validator import exceptions
+from ._utils import make_flat_validator, make_flat_record, per_call_us, report
+
+N_FIELDS = 30
+BATCH_SIZE = 100
+
+
+def raising_validate_fields(v, raw_data):
+    """
+    the field loop of Validator calling `field.validate` and catching FieldValidationError
+    """
+    data = {}
+    errors = {}
+    for name, field in v._FIELDS_MAP.items():
+        if name not in raw_data:
+            continue
+        try:
+            data[name] = field.to_internal(field.validate(raw_data[name]))
+        except exceptions.FieldValidationError as e:
+            errors[name] = e
+    return data, errors
+
+
+def main():
+    V = make_flat_validator(N_FIELDS)
+    valid = make_flat_record(N_FIELDS, valid=True)
+    invalid = make_flat_record(N_FIELDS, valid=False)
+    v = V(valid)
+    for invalid_ratio in (0.99, 0.01):
+        n_invalid = int(BATCH_SIZE * invalid_ratio)
+        records = [invalid] * n_invalid + [valid] * (BATCH_SIZE - n_invalid)
+
+        def raising():
+            for record in records:
+                raising_validate_fields(v, record)
+
+        def checking():
+            for record in records:
+                v._interpreted_validate_fields(record)
+
+        raised = per_call_us(raising, number=100) / BATCH_SIZE
+        checked = per_call_us(checking, number=100) / BATCH_SIZE
+        report('{} fields, {:.0%} invalid records'.format(N_FIELDS, invalid_ratio), [
+            ('raise FieldValidationError', raised),
+            ('_check_value', checked),
+        ])
+        print('  speedup: {:.2f}x'.format(raised / checked))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of IPAddressField with the IPy and ipaddress engines.
+"""
+from __future__ import print_function, unicode_literals
+import random
+from validator import IPAddressField
+from ._utils import per_call_us
+
+N_VALUES = 1000
+
+
+def make_values(version):
+    values = []
+    for _ in range(N_VALUES):
+        if version == 'ipv4':
+            values.append('.'.join(str(random.randint(0, 255)) for _ in range(4)))
+        else:
+            values.append(':'.join('{:x}'.format(random.randint(0, 0xffff)) for _ in range(8)))
+    return values
+
+
+def main():
+    random.seed(0)
+    print('{0:<8} {1:<10} {2:>10} {3:>14}'.format('version', 'engine', 'us', 'values/second'))
+    for version in ('ipv4', 'ipv6'):
+        values = make_values(version)
+        for engine in IPAddressField.SUPPORT_ENGINES:
+            field = IPAddressField(version=version, engine=engine)
+            assert all(field._check(value)[1] is None for value in values)
+
+            def run():
+                for value in values:
+                    field._check(value)
+
+            us = per_call_us(run, number=5) / N_VALUES
+            print('{0:<8} {1:<10} {2:10.2f} {3:14.0f}'.format(version, engine, us, 1e6 / us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Compare IPFilterField with a linear scan of the networks in `validators`,
+for allowlists of thousands of CIDR networks.
+"""
+from __future__ import print_function, unicode_literals
+import ipaddress
+import random
+from validator import IPAddressField, IPFilterField, FieldValidationError
+from ._utils import per_call_us
+
+N_VALUES = 200
+
+
+def make_networks(n):
+    networks = set()
+    while len(networks) < n:
+        prefix = random.randint(16, 28)
+        address = random.randint(0, 2 ** 32 - 1)
+        networks.add(ipaddress.ip_network((address, prefix), strict=False).with_prefixlen)
+    return sorted(networks)
+
+
+def linear_scan_field(networks):
+    parsed = [ipaddress.ip_network(n) for n in networks]
+
+    def in_networks(value):
+        if not any(value in network for network in parsed):
+            raise FieldValidationError('{} is not in the allowed networks'.format(value))
+
+    return IPAddressField(engine='ipaddress', validators=[in_networks])
+
+
+def main():
+    random.seed(0)
+    print('{0:>9} {1:>16} {2:>16} {3:>10}'.format('networks', 'linear scan us', 'ip filter us', 'speedup'))
+    for n in (10, 100, 1000, 5000):
+        networks = make_networks(n)
+        values = [ipaddress.IPv4Address(random.randint(0, 2 ** 32 - 1)).exploded for _ in range(N_VALUES)]
+        scan = linear_scan_field(networks)
+        fast = IPFilterField(allow=networks, engine='ipaddress')
+        for value in values:
+            assert (scan._check_value(value)[1] is None) == (fast._check_value(value)[1] is None)
+
+        def run(field):
+            for value in values:
+                field._check_value(value)
+
+        scan_us = per_call_us(lambda: run(scan), number=1, repeat=3) / N_VALUES
+        fast_us = per_call_us(lambda: run(fast), number=1, repeat=3) / N_VALUES
+        print('{0:>9} {1:16.2f} {2:16.2f} {3:9.1f}x'.format(n, scan_us, fast_us, scan_us / fast_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the whole-list check of `ListField` with scalar items against the item by item loop.
+"""
+from __future__ import print_function, unicode_literals
+import random
+from validator import ListField, IntegerField, FloatField, StringField
+from ._utils import per_call_us, report
+
+N_ITEMS = 100000
+
+
+def main():
+    random.seed(0)
+    cases = [
+        ('integer', IntegerField(min_value=0, max_value=10 ** 6), [random.randint(0, 10 ** 6) for _ in range(N_ITEMS)]),
+        ('float', FloatField(min_value=0, max_value=1), [random.random() for _ in range(N_ITEMS)]),
+        ('string', StringField(max_length=10), ['s{}'.format(i % 1000) for i in range(N_ITEMS)]),
+    ]
+    for label, field, items in cases:
+        fast = ListField(field=field)
+        slow = ListField(field=field)
+        slow._items_valid = None
+        rows = [
+            ('item by item', per_call_us(lambda: slow._check_value(items), number=5) / N_ITEMS),
+            ('whole list', per_call_us(lambda: fast._check_value(items), number=5) / N_ITEMS),
+        ]
+        report('{} list of {} items, per item'.format(label, N_ITEMS), rows)
+        print('  speedup: {:.2f}x'.format(rows[0][1] / rows[1][1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the memory and lookup time of `EnumField` and `MembershipField` for a huge allowlist.
+`MembershipField` uses less memory, but its lookups are slower: a binary search in python
+instead of a set lookup.
+"""
+from __future__ import print_function, unicode_literals
+import gc
+import os
+import tempfile
+import tracemalloc
+from validator import EnumField, MembershipField
+from ._utils import per_call_us
+
+N_VALUES = 1000000
+
+
+def allocated(factory):
+    gc.collect()
+    tracemalloc.start()
+    field = factory()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return field, size
+
+
+def main():
+    ids = list(range(0, N_VALUES * 2, 2))
+    names = sorted('user-{:08d}'.format(i) for i in ids)
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(fd, 'w') as f:
+        f.write('\n'.join(names) + '\n')
+    try:
+        cases = [
+            ('enum int', lambda: EnumField(choices=list(ids)), 123456, 123457),
+            ('membership int', lambda: MembershipField(values=ids, value_type='int'), 123456, 123457),
+            ('enum str', lambda: EnumField(choices=list(names)), 'user-00123456', 'user-00123457'),
+            ('membership str', lambda: MembershipField(source=path), 'user-00123456', 'user-00123457'),
+            ('membership str mmap', lambda: MembershipField(source=path, use_mmap=True), 'user-00123456', 'user-00123457'),
+            ('membership str bloom', lambda: MembershipField(source=path, bloom_bits=10),
+             'user-00123456', 'user-00123457'),
+        ]
+        print('{} values'.format(N_VALUES))
+        print('{0:<22} {1:>12} {2:>10} {3:>10}'.format('field', 'MB', 'hit us', 'miss us'))
+        for label, factory, hit, miss in cases:
+            field, size = allocated(factory)
+            hit_us = per_call_us(lambda: field._check_value(hit), number=20000)
+            miss_us = per_call_us(lambda: field._check_value(miss), number=20000)
+            print('{0:<22} {1:12.1f} {2:10.2f} {3:10.2f}'.format(label, size / 1e6, hit_us, miss_us))
+            del field
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Report the memory of fields and of a validation:
+
+- bytes per field instance, for every class in FIELDS_NAME_MAP
+- bytes allocated (peak) and kept by one validation of a valid and an invalid record
+"""
+from __future__ import print_function, unicode_literals
+import gc
+import tracemalloc
+from validator import EnumField, MembershipField
+from validator.fields import FIELDS_NAME_MAP
+from ._utils import make_flat_validator, make_flat_record
+
+N_INSTANCES = 10000
+N_FIELDS = 30
+
+# params needed to create an instance of a field class
+FIELD_PARAMS = {
+    EnumField: {'choices': ['a', 'b']},
+    MembershipField: {'values': ['a', 'b']},
+}
+
+
+def bytes_per_field(field_class):
+    params = FIELD_PARAMS.get(field_class, {})
+    gc.collect()
+    tracemalloc.start()
+    fields = [field_class(**params) for _ in range(N_INSTANCES)]
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del fields
+    return size / float(N_INSTANCES)
+
+
+def validation_memory(validator_class, record):
+    validator_class(record).is_valid()
+    gc.collect()
+    tracemalloc.start()
+    v = validator_class(record)
+    v.is_valid()
+    if v.errors:
+        v.str_errors
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak
+
+
+def main():
+    print('bytes per field')
+    for name, field_class in sorted(FIELDS_NAME_MAP.items()):
+        print('  {0:<14} {1:8.1f}'.format(name, bytes_per_field(field_class)))
+
+    V = make_flat_validator(N_FIELDS)
+    print('bytes per validation, {} fields'.format(N_FIELDS))
+    for valid in (True, False):
+        size, peak = validation_memory(V, make_flat_record(N_FIELDS, valid=valid))
+        print('  {0:<14} kept {1:8d}  peak {2:8d}'.format('valid' if valid else 'invalid', size, peak))
+
+
+if __name__ == '__main__':
+    main()
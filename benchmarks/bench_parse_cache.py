@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Compare fields with and without the parse cache (`cache_size`) on low-cardinality values,
+e.g. the dates, client IPs and tenant UUIDs repeated by the rows of a log.
+"""
+from __future__ import print_function, unicode_literals
+import random
+import uuid
+from validator import DatetimeField, DateField, UUIDField, IPAddressField
+from ._utils import per_call_us
+
+N_VALUES = 10000
+CARDINALITY = 100
+CACHE_SIZE = 1000
+
+
+def make_values(make_one):
+    distinct = [make_one(i) for i in range(CARDINALITY)]
+    return [random.choice(distinct) for _ in range(N_VALUES)]
+
+
+CASES = [
+    (DateField, {}, lambda i: '2018/{:02d}/{:02d}'.format(i % 12 + 1, i % 28 + 1)),
+    (DatetimeField, {}, lambda i: '2018/07/01 {:02d}:{:02d}:00'.format(i % 24, i % 60)),
+    (UUIDField, {}, lambda i: str(uuid.UUID(int=i))),
+    (IPAddressField, {}, lambda i: '10.0.{}.{}'.format(i // 256, i % 256)),
+]
+
+
+def main():
+    random.seed(0)
+    print('{0:<16} {1:>12} {2:>12} {3:>10} {4:>10}'.format(
+        'field', 'no cache us', 'cache us', 'speedup', 'hit rate'))
+    for field_class, params, make_one in CASES:
+        values = make_values(make_one)
+        plain = field_class(**params)
+        cached = field_class(cache_size=CACHE_SIZE, **params)
+
+        def run(field):
+            for value in values:
+                field._check(value)
+
+        plain_us = per_call_us(lambda: run(plain), number=3) / N_VALUES
+        cached_us = per_call_us(lambda: run(cached), number=3) / N_VALUES
+        info = cached.cache_info()
+        print('{0:<16} {1:12.2f} {2:12.2f} {3:9.2f}x {4:9.1%}'.format(
+            field_class.__name__, plain_us, cached_us, plain_us / cached_us,
+            info.hits / float(info.hits + info.misses)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite, emit the results as JSON so that releases can be compared.
+
+Measure records/second and the memory allocated (peak bytes) by one validation for:
+
+- every class in FIELDS_NAME_MAP (validators of 10 fields of the same class)
+- flat schemas of 10, 100 and 500 fields, interpreted and compiled
+- nested DictField documents and ListField of documents/lists
+
+each case is run with valid and invalid records. Records are generated by `mock_data`
+with a fixed random seed, invalid records replace some values by values of a wrong type.
+
+Usage::
+
+    python -m benchmarks.suite [--output results.json] [--quick] [--seed 0]
+
+records are validated with `Validator(data).is_valid()`.
+"""
+from __future__ import print_function, unicode_literals
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+import validator
+from validator import (
+    Validator, StringField, IntegerField, FloatField, BoolField, EnumField, DictField, ListField,
+    MembershipField,
+)
+from validator.fields import FIELDS_NAME_MAP
+from ._utils import make_flat_validator
+
+FIELDS_PER_VALIDATOR = 10
+FLAT_SIZES = (10, 100, 500)
+DICT_DEPTHS = (1, 4, 8)
+LIST_LENGTHS = (10, 100)
+
+# params needed to create an instance of a field class
+FIELD_PARAMS = {
+    EnumField: {'choices': ['a', 'b', 'c']},
+    MembershipField: {'values': ['user-{}'.format(i) for i in range(1000)]},
+}
+
+
+def invalid_value(field):
+    """
+    return a value which `field` rejects
+    """
+    if type(field) is StringField:
+        return 12345
+    return 'not valid!'
+
+
+def make_invalid(validator_class, record, every=1):
+    """
+    return a copy of `record` in which every `every`-th field is invalid.
+    the error is put into the deepest document of DictField and ListField of DictField.
+    """
+    record = dict(record)
+    for i, (name, field) in enumerate(sorted(validator_class._FIELDS_MAP.items())):
+        if i % every:
+            continue
+        value = record.get(name)
+        if isinstance(field, DictField) and field.validator is not None and value:
+            record[name] = make_invalid(field.validator, value, every)
+        elif isinstance(field, ListField) and isinstance(field.field, DictField) and value:
+            record[name] = value[:-1] + [make_invalid(field.field.validator, value[-1], every)]
+        else:
+            record[name] = invalid_value(field)
+    return record
+
+
+def make_nested_dict_validator(depth):
+    """
+    a document with `depth` levels of DictField, every level has some scalar fields
+    """
+    clazz = None
+    for level in range(depth, 0, -1):
+        attrs = {
+            'name': StringField(max_length=50, required=True),
+            'count': IntegerField(min_value=0, max_value=10000),
+            'ratio': FloatField(min_value=0, max_value=1000),
+            'active': BoolField(),
+        }
+        if clazz is not None:
+            attrs['child'] = DictField(validator=clazz, required=True)
+        clazz = type(str('Level{}Validator'.format(level)), (Validator, ), attrs)
+    return clazz
+
+
+def make_list_validator(length, inner):
+    if inner == 'dict':
+        field = DictField(validator=make_nested_dict_validator(1))
+    else:
+        field = ListField(field=IntegerField(min_value=0, max_value=10000), min_length=3, max_length=4)
+    attrs = {
+        'items': ListField(field=field, min_length=length, max_length=length + 1, required=True),
+        'tag': EnumField(choices=['a', 'b', 'c']),
+    }
+    return type(str('List{}Validator'.format(length)), (Validator, ), attrs)
+
+
+def make_field_validator(field_class):
+    params = FIELD_PARAMS.get(field_class, {})
+    attrs = {}
+    for i in range(FIELDS_PER_VALIDATOR):
+        attrs['f{}'.format(i)] = field_class(**params)
+    return type(str('{}Validator'.format(field_class.__name__)), (Validator, ), attrs)
+
+
+def iter_cases():
+    """
+    yield (group, name, params, validator_class, invalid_every)
+    """
+    for type_name, field_class in sorted(FIELDS_NAME_MAP.items()):
+        yield 'field', type_name, {}, make_field_validator(field_class), 1
+
+    for n_fields in FLAT_SIZES:
+        for compiled in (False, True):
+            V = make_flat_validator(n_fields, compiled=compiled)
+            params = {'fields': n_fields, 'compiled': compiled}
+            yield 'flat', '{}_fields'.format(n_fields), params, V, 10
+
+    for depth in DICT_DEPTHS:
+        yield 'nested', 'dict_depth_{}'.format(depth), {'depth': depth}, make_nested_dict_validator(depth), 1
+
+    for length in LIST_LENGTHS:
+        for inner in ('dict', 'list'):
+            params = {'length': length, 'inner': inner}
+            yield 'nested', 'list_of_{}_{}'.format(inner, length), params, make_list_validator(length, inner), 1
+
+
+def records_per_second(validator_class, records, repeat, min_time):
+    def run():
+        for record in records:
+            validator_class(record).is_valid()
+
+    number = 1
+    # run at least `min_time` seconds per measurement
+    while min(timeit.repeat(run, number=number, repeat=1)) < min_time:
+        number *= 2
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return len(records) * number / best
+
+
+def peak_bytes(validator_class, records):
+    """
+    average peak of memory allocated while validating one record
+    """
+    gc.collect()
+    total = 0
+    tracemalloc.start()
+    try:
+        for record in records:
+            tracemalloc.clear_traces()
+            base = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            validator_class(record).is_valid()
+            total += tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return total / float(len(records))
+
+
+def run_case(validator_class, invalid_every, n_records, repeat, min_time):
+    valid_records = [validator_class.mock_data() for _ in range(n_records)]
+    invalid_records = [make_invalid(validator_class, r, invalid_every) for r in valid_records]
+    results = {}
+    for label, records in (('valid', valid_records), ('invalid', invalid_records)):
+        expected = label == 'valid'
+        assert all(validator_class(r).is_valid() == expected for r in records), \
+            '{} records of {} are not {}'.format(label, validator_class.__name__, label)
+        results[label] = {
+            'records_per_second': records_per_second(validator_class, records, repeat, min_time),
+            'peak_bytes_per_record': peak_bytes(validator_class, records[:20]),
+        }
+    return results
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'validator': validator.__version__,
+    }
+
+
+def run_suite(seed=0, n_records=100, repeat=5, min_time=0.1, log=None):
+    random.seed(seed)
+    results = []
+    for group, name, params, validator_class, invalid_every in iter_cases():
+        if log is not None:
+            log('{}/{} {}'.format(group, name, params or ''))
+        case = {'group': group, 'name': name, 'params': params}
+        case.update(run_case(validator_class, invalid_every, n_records, repeat, min_time))
+        results.append(case)
+    return {
+        'environment': environment(),
+        'seed': seed,
+        'records': n_records,
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', '-o', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('--seed', type=int, default=0, help='random seed used by mock_data')
+    parser.add_argument('--records', type=int, default=100, help='number of records per case')
+    parser.add_argument('--repeat', type=int, default=5, help='repeat count of every timing')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum seconds of one timing')
+    parser.add_argument('--quick', action='store_true', help='few records and repeats, for a smoke test')
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.records, args.repeat, args.min_time = 5, 1, 0.01
+
+    def log(message):
+        print(message, file=sys.stderr)
+
+    results = run_suite(seed=args.seed, n_records=args.records, repeat=args.repeat,
+                        min_time=args.min_time, log=log)
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import asyncio
+import pytest
+from validator import (Validator, StringField, IntegerField, ListField, DictField, FieldValidationError,
+                       ValidationError)
+
+EXISTING_NAMES = {'foo', 'bar'}
+
+
+async def not_negative(value):
+    await asyncio.sleep(0)
+    if value < 0:
+        raise FieldValidationError('negative')
+
+
+class V(Validator):
+    name = StringField(max_length=50, required=True)
+    age = IntegerField(min_value=-100, max_value=120, validators=[not_negative])
+    nick = StringField()
+
+    async def validate_name(self, value):
+        await asyncio.sleep(0)
+        if value in EXISTING_NAMES:
+            raise FieldValidationError('name exists')
+
+    def validate_nick(self, value):
+        if value == 'foo':
+            raise FieldValidationError('"foo" is invalid')
+
+    async def validate(self, data):
+        await asyncio.sleep(0)
+        if data['name'] == 'Bob' and data.get('age', 0) > 60:
+            raise ValidationError('Bob is too old')
+        return data
+
+
+def run(coro):
+    # asyncio.run needs python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_has_async():
+    class V2(Validator):
+        name = StringField()
+
+    assert V._HAS_ASYNC
+    assert not V2._HAS_ASYNC
+    assert run(V2({'name': 'foo'}).is_valid_async())
+
+
+def test_ok():
+    v = V({'name': 'Bob', 'age': 20})
+    assert run(v.is_valid_async())
+    assert v.validated_data == {'name': 'Bob', 'age': 20}
+
+
+def test_wrong_value():
+    v = V({'name': 'foo', 'age': -1, 'nick': 'foo'})
+    assert not run(v.is_valid_async())
+    assert sorted(v.errors) == ['age', 'name', 'nick']
+
+    v = V({'name': 'Alice', 'age': 200})
+    assert not run(v.is_valid_async())
+    assert 'age' in v.errors
+
+    v = V({'name': 'Bob', 'age': 70})
+    assert not run(v.is_valid_async())
+    assert '__data_error__' in v.errors
+
+    with pytest.raises(ValidationError):
+        run(V({'age': 1}).is_valid_async(raise_error=True))
+
+
+def test_concurrency():
+    running = []
+    max_running = []
+
+    async def slow(value):
+        running.append(value)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(value)
+
+    attrs = {'f{}'.format(i): IntegerField(validators=[slow]) for i in range(6)}
+    V2 = type('V2', (Validator, ), attrs)
+    data = {'f{}'.format(i): i for i in range(6)}
+
+    assert run(V2(data).is_valid_async())
+    assert max(max_running) == 6
+
+    del max_running[:]
+    assert run(V2(data).is_valid_async(concurrency=2))
+    assert max(max_running) == 2
+
+
+class UpperStringField(StringField):
+    def validate(self, value):
+        value = super(UpperStringField, self).validate(value)
+        if value != value.upper():
+            raise FieldValidationError('lowercase is not allowed')
+        return value
+
+
+def test_custom_field_validate():
+    # async validation is not more permissive than sync validation
+    class V2(Validator):
+        code = UpperStringField(max_length=5)
+        name = StringField()
+
+        async def validate_name(self, value):
+            await asyncio.sleep(0)
+
+    for data in [{'code': 'ABC'}, {'code': 'abc'}, {'code': 'ABCDEF'}, {'code': 1}]:
+        v = V2(data)
+        sync_v = V2(data)
+        assert run(v.is_valid_async()) == sync_v.is_valid()
+        assert v.errors.keys() == sync_v.errors.keys()
+        assert v.validated_data == sync_v.validated_data
+
+    v = V2({'code': 'abc'})
+    assert not run(v.is_valid_async())
+    assert str(v.errors['code']) == 'lowercase is not allowed'
+
+
+def test_custom_field_validate_async_validator():
+    class FakeUpperStringField(UpperStringField):
+        def validate(self, value):
+            # doesn't call the validators
+            return self._validate(value)
+
+    class V2(Validator):
+        code = FakeUpperStringField(validators=[async_reject_x])
+
+    assert run(V2({'code': 'ABC'}).is_valid_async())
+    v = V2({'code': 'X'})
+    assert not run(v.is_valid_async())
+    assert str(v.errors['code']) == 'x is invalid'
+
+
+async def async_reject_x(value):
+    await asyncio.sleep(0)
+    if value == 'X':
+        raise FieldValidationError('x is invalid')
+
+
+def test_custom_field_validate_calls_super():
+    calls = []
+
+    async def count_calls(value):
+        calls.append(value)
+        await asyncio.sleep(0)
+        if value == 'X':
+            raise FieldValidationError('x is invalid')
+
+    def not_empty(value):
+        calls.append('sync')
+        if not value:
+            raise FieldValidationError('empty')
+
+    class V2(Validator):
+        # UpperStringField.validate calls super().validate, which calls the validators
+        code = UpperStringField(validators=[not_empty, count_calls])
+
+    assert V2._HAS_ASYNC
+    assert run(V2({'code': 'ABC'}).is_valid_async())
+    # every validator runs once
+    assert calls == ['sync', 'ABC']
+
+    del calls[:]
+    v = V2({'code': 'X'})
+    assert not run(v.is_valid_async())
+    assert str(v.errors['code']) == 'x is invalid'
+    assert calls == ['sync', 'X']
+
+    del calls[:]
+    v = V2({'code': ''})
+    assert not run(v.is_valid_async())
+    assert str(v.errors['code']) == 'empty'
+    assert calls == ['sync']
+
+
+def test_nested_async_validators():
+    class Inner(Validator):
+        name = StringField()
+
+        async def validate_name(self, value):
+            await asyncio.sleep(0)
+
+    nested_fields = [
+        ListField(field=StringField(validators=[async_reject_x])),
+        ListField(field=ListField(field=StringField(validators=[async_reject_x]))),
+        DictField(validator=Inner),
+        ListField(field=DictField(validator=Inner)),
+    ]
+    for field in nested_fields:
+        with pytest.raises(ValueError):
+            type(str('V2'), (Validator, ), {'items': field})
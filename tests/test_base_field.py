@@ -66,3 +66,51 @@ def test_validators():
     data = {'name': 'foo'}
     v = V(data)
     assert not v.is_valid()
+
+
+def test_check_value():
+    from validator import StringField, IntegerField
+
+    value, error = StringField(max_length=3)._check_value('abc')
+    assert value == 'abc' and error is None
+    value, error = StringField(max_length=3)._check_value('abcd')
+    assert value is None and isinstance(error, FieldValidationError)
+
+    def validate(value):
+        raise FieldValidationError('field is invalid')
+
+    value, error = IntegerField(validators=[validate])._check_value(1)
+    assert error.detail == 'field is invalid'
+
+
+def test_custom_validate():
+    from validator import StringField
+
+    class LowerField(StringField):
+        def _validate(self, value):
+            value = super(LowerField, self)._validate(value)
+            if value != value.lower():
+                raise FieldValidationError('not lower')
+            return value
+
+    class PositiveField(BaseField):
+        INTERNAL_TYPE = int
+
+        def _validate_type(self, value):
+            value = super(PositiveField, self)._validate_type(value)
+            if value <= 0:
+                raise FieldValidationError('not positive')
+            return value
+
+    assert StringField._NATIVE_CHECK
+    assert not LowerField._NATIVE_CHECK
+    assert PositiveField._NATIVE_CHECK
+
+    class V(Validator):
+        name = LowerField(max_length=5)
+        age = PositiveField()
+
+    assert V({'name': 'bob', 'age': 1}).is_valid()
+    for data in ({'name': 'Bob'}, {'name': 'bobbobbob'}, {'age': 0}, {'age': '1'}):
+        v = V(data)
+        assert not v.is_valid()
@@ -0,0 +1,155 @@
+import random
+from array import array
+import pytest
+from validator import (Validator, StringField, IntegerField, FloatField, NumberField, BoolField,
+                       EnumField, TimestampField, ListField, FieldValidationError, ValidationError)
+
+
+class V(Validator):
+    name = StringField(min_length=1, max_length=5, required=True)
+    age = IntegerField(min_value=0, max_value=120, default=20)
+    score = FloatField(min_value=0, max_value=1)
+    amount = NumberField(min_value=-10, max_value=10)
+    active = BoolField()
+    sex = EnumField(choices=['f', 'm', [1]])
+    ts = TimestampField()
+    tags = ListField(field=StringField(), max_length=2)
+
+
+POOL = {
+    'name': ['a', 'abcde', '', 'abcdef', 1, None],
+    'age': [0, 120, 121, -1, True, 1.5, '1', None],
+    'score': [0.0, 1.0, 0.5, float('nan'), 1.5, 1, None],
+    'amount': [-10, 10, 0.5, 11, -10.5, 'x', None],
+    'active': [True, False, 1, None],
+    'sex': ['f', 'm', [1], 'x', [2], {}, None],
+    'ts': [0, 2 ** 32 - 1, 2 ** 32, -1, None],
+    'tags': [[], ['a'], ['a', 'b', 'c'], [1], None],
+}
+
+
+def _rows_result(validator_class, rows):
+    mask = []
+    errors = {}
+    for row, data in enumerate(rows):
+        v = validator_class(data)
+        mask.append(v.is_valid())
+        for name, error in v.errors.items():
+            errors[(row, name)] = error
+    return mask, errors
+
+
+def _assert_same(validator_class, columns, rows):
+    result = validator_class.validate_columns(columns)
+    mask, errors = _rows_result(validator_class, rows)
+    assert result.mask == mask
+    assert sorted(result.errors) == sorted(errors)
+    for key, error in errors.items():
+        assert type(result.errors[key]) is type(error)
+        assert str(result.errors[key]) == str(error)
+
+
+def _random_columns(rnd, n_rows, names, valid_ratio):
+    columns = {}
+    for name in names:
+        good = POOL[name][:2]
+        columns[name] = [rnd.choice(good if rnd.random() < valid_ratio else POOL[name]) for _ in range(n_rows)]
+    return columns
+
+
+def test_same_as_rows():
+    rnd = random.Random(0)
+    names = list(POOL)
+    for _ in range(200):
+        subset = [name for name in names if rnd.random() < 0.8]
+        n_rows = rnd.randint(0, 20)
+        columns = _random_columns(rnd, n_rows, subset, rnd.choice([0.0, 0.9, 1.0]))
+        rows = [dict((name, columns[name][row]) for name in subset) for row in range(n_rows)]
+        _assert_same(V, columns, rows)
+
+
+def test_missing_columns():
+    result = V.validate_columns({'age': [1, 2, 300]})
+    assert result.mask == [False, False, False]
+    assert sorted(result.errors) == [(0, 'name'), (1, 'name'), (2, 'age'), (2, 'name')]
+
+    result = V.validate_columns({'name': array('u', 'ab')})
+    assert result.mask == [True, True]
+    assert V.validate_columns({}) == ([], {})
+
+
+def test_different_lengths():
+    with pytest.raises(ValueError):
+        V.validate_columns({'name': ['a'], 'age': [1, 2]})
+
+
+def test_hooks():
+    class V2(Validator):
+        name = StringField(max_length=5, required=True)
+        age = IntegerField(min_value=0, max_value=120)
+
+        def validate_name(self, value):
+            if value == self.raw_data.get('forbidden'):
+                raise FieldValidationError('forbidden')
+
+        def validate(self, data):
+            if data.get('age') == 1:
+                raise ValidationError('age 1')
+            return data
+
+    columns = {'name': ['a', 'b', 'c', 'toolong'], 'age': [1, 2, 3, 4], 'forbidden': ['x', 'b', 'x', 'x']}
+    rows = [dict((name, columns[name][row]) for name in columns) for row in range(4)]
+    _assert_same(V2, columns, rows)
+    assert V2.validate_columns(columns).mask == [False, False, True, False]
+
+
+def test_field_named_columns():
+    # `validate_columns` of Validator is not the hook of a field named `columns`
+    class W(Validator):
+        columns = StringField(max_length=3)
+
+    assert W._FIELDS_PLAN[0][3] is None
+    assert W({'columns': 'x'}).is_valid()
+    assert not W({'columns': 'xxxx'}).is_valid()
+    result = W.validate_columns({'columns': ['x', 'xxxx']})
+    assert result.mask == [True, False]
+    assert list(result.errors) == [(1, 'columns')]
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+    rnd = random.Random(1)
+    columns = {
+        'name': numpy.array(['a', 'abcde', '', 'abcdef'] * 5),
+        'age': numpy.array([rnd.randint(-5, 130) for _ in range(20)]),
+        'score': numpy.array([rnd.choice([0.1, 1.5, float('nan'), -1.0]) for _ in range(20)]),
+        'amount': numpy.array([rnd.randint(0, 12) for _ in range(20)], dtype='uint8'),
+        'active': numpy.array([True, False] * 10),
+        'sex': numpy.array(['f', 'x', 'm', 'm'] * 5),
+        'ts': numpy.array([0, 2 ** 32, -1, 5] * 5, dtype='int64'),
+    }
+    rows = [dict((name, columns[name].item(row)) for name in columns) for row in range(20)]
+    _assert_same(V, columns, rows)
+
+    columns['age'] = numpy.array([1.0] * 20)
+    rows = [dict((name, columns[name].item(row)) for name in columns) for row in range(20)]
+    _assert_same(V, columns, rows)
+
+
+def test_numpy_float32():
+    numpy = pytest.importorskip('numpy')
+
+    class W(Validator):
+        score = FloatField(min_value=-1.0, max_value=0.1)
+        level = NumberField(min_value=0, max_value=2 ** 53 + 3)
+        kind = EnumField(choices=[0.1, 2 ** 53 + 1])
+
+    # 0.1 of float32 is greater than 0.1, and 2 ** 53 + 3 is not a float64
+    columns = {
+        'score': numpy.array([0.1, -1.0, 0.05] * 3, dtype=numpy.float32),
+        'level': numpy.array([2 ** 53 + 4, 0, 1] * 3, dtype=numpy.float64),
+        'kind': numpy.array([0.1, 2 ** 53, 2 ** 53] * 3, dtype=numpy.float32),
+    }
+    rows = [dict((name, columns[name].item(row)) for name in columns) for row in range(9)]
+    _assert_same(W, columns, rows)
+    assert W.validate_columns(columns).mask == [False] * 9
@@ -0,0 +1,90 @@
+from validator import (Validator, BaseField, StringField, IntegerField, FloatField, NumberField, BoolField,
+                       EnumField, ListField, UUIDField, FieldValidationError, create_validator)
+
+
+def is_positive(value):
+    if value <= 0:
+        raise FieldValidationError('must be positive')
+
+
+class V(Validator):
+    name = StringField(min_length=2, max_length=10, regex='^[a-z]+$', required=True)
+    nick = StringField(strict=False, default='anonymous')
+    age = IntegerField(min_value=1, max_value=120, default=20)
+    score = FloatField(min_value=0.0, validators=[is_positive])
+    amount = NumberField(min_value=0, max_value=100)
+    active = BoolField(default=None)
+    sex = EnumField(choices=['f', 'm'])
+    extra = BaseField()
+    tags = ListField(field=IntegerField(), default=list)
+    uid = UUIDField()
+
+    def validate_name(self, value):
+        if value == 'foo':
+            raise FieldValidationError('"foo" is invalid')
+
+
+class CompiledV(V):
+    COMPILED = True
+
+
+class InterpretedV(V):
+    COMPILED = False
+
+
+DATA = [
+    {'name': 'bob'},
+    {'name': 'bob', 'nick': 123, 'age': 30, 'score': 1.5, 'amount': 7, 'active': True,
+     'sex': 'f', 'extra': object(), 'tags': [1, 2], 'uid': '41e40df1ef1246d292904d3d9dbfe24f'},
+    {},
+    {'name': 'foo'},
+    {'name': 'b'},
+    {'name': 'Bob'},
+    {'name': 'abcdefghijklmn'},
+    {'name': 123},
+    {'name': None, 'age': None},
+    {'name': 'bob', 'age': 0},
+    {'name': 'bob', 'age': '30'},
+    {'name': 'bob', 'age': True},
+    {'name': 'bob', 'score': -1.0},
+    {'name': 'bob', 'score': 1},
+    {'name': 'bob', 'amount': 101.5},
+    {'name': 'bob', 'active': 1},
+    {'name': 'bob', 'sex': 'x'},
+    {'name': 'bob', 'sex': ['f']},
+    {'name': 'bob', 'tags': [1, 'a']},
+    {'name': 'bob', 'uid': 'not a uuid'},
+]
+
+
+def test_compiled():
+    assert hasattr(CompiledV._validate_fields, '__source__')
+    assert not hasattr(InterpretedV._validate_fields, '__source__')
+
+
+def test_same_result():
+    for data in DATA:
+        v1 = CompiledV(data)
+        v2 = InterpretedV(data)
+        assert v1.is_valid() == v2.is_valid(), data
+        assert v1.str_errors == v2.str_errors, data
+        assert v1.validated_data == v2.validated_data, data
+        assert sorted(v1.errors) == sorted(v2.errors)
+        for name in v1.errors:
+            assert type(v1.errors[name]) is type(v2.errors[name])
+
+        v1 = CompiledV(data)
+        v2 = InterpretedV(data)
+        assert v1.is_valid(fail_fast=True) == v2.is_valid(fail_fast=True), data
+        assert v1.str_errors == v2.str_errors, data
+
+
+def test_create_validator():
+    data = {
+        'name': {'type': 'string', 'max_length': 10},
+        'age': {'type': 'integer', 'min_value': 1, 'max_value': 120},
+    }
+    V = create_validator(data, compiled=True)
+    assert hasattr(V._validate_fields, '__source__')
+    assert V({'name': 'bob', 'age': 30}).is_valid()
+    assert not V({'name': 'bob', 'age': 300}).is_valid()
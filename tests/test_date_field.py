@@ -42,3 +42,47 @@ def test_to_dict():
     assert field_info['type'] == DateField.FIELD_TYPE_NAME
     assert field_info['dt_format'] == DateField.DEFAULT_FORMAT
 
+
+def test_fast_parser():
+    import datetime
+
+    for dt_format, value in (('%Y/%m/%d', '2018/07/01'), ('%Y-%m-%d', '2018-07-01'), ('%d.%m.%Y', '01.07.2018')):
+        class V2(Validator):
+            create_at = DateField(dt_format=dt_format)
+
+        v = V2({'create_at': value})
+        assert v.is_valid()
+        assert v.validated_data['create_at'] == datetime.date(2018, 7, 1)
+        assert not V2({'create_at': value.replace('07', '13')}).is_valid()
+
+
+def test_cache():
+    import datetime
+
+    field = DateField(cache_size=2)
+    assert field.cache_info() == (0, 0, 2, 0)
+    first = field.validate('2018/07/01')
+    assert first == datetime.date(2018, 7, 1)
+    assert field.validate('2018/07/01') is first
+    assert field.cache_info() == (1, 1, 2, 1)
+
+    # errors are not cached
+    for _ in range(2):
+        value, error = field._check('2018/13/01')
+        assert error is not None
+    assert field.cache_info().currsize == 1
+
+    field.validate('2018/07/02')
+    field.validate('2018/07/03')
+    # the least recently used '2018/07/01' is discarded
+    assert field.validate('2018/07/01') is not first
+    assert field.cache_info().currsize == 2
+
+    # non-string values are not cached
+    field.validate(1532339910)
+    assert field.cache_info().currsize == 2
+
+    field.cache_clear()
+    assert field.cache_info() == (0, 0, 2, 0)
+    assert DateField().cache_info() is None
+    assert DateField.from_dict(field.to_dict()).cache_info() == (0, 0, 2, 0)
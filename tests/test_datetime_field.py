@@ -54,4 +54,59 @@ def test_create_valiadtor():
     data = {'create_at': '2018/07/01 17:01:20'}
     v = V(data)
     assert v.is_valid(), v.str_errors
-    
\ No newline at end of file
+    
+
+def test_fast_parser_same_as_strptime():
+    import random
+    import datetime
+    from validator.dtparse import get_parser
+
+    formats = [
+        '%Y/%m/%d %H:%M:%S', '%Y/%m/%d', '%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S.%f',
+        '%Y%m%d', '%d.%m.%Y %H:%M', '%H:%M', '%%Y %Y', '%m/%d',
+    ]
+    alphabet = '0123456789/-:. T+_t%\u0663Y'
+    rnd = random.Random(0)
+    for dt_format in formats:
+        parse = get_parser(dt_format)
+        assert parse is not None
+        for _ in range(3000):
+            dt = datetime.datetime(rnd.randint(1000, 9999), rnd.randint(1, 12), rnd.randint(1, 28),
+                                   rnd.randint(0, 23), rnd.randint(0, 59), rnd.randint(0, 59),
+                                   rnd.randint(0, 999999))
+            value = dt.strftime(dt_format)
+            # well-formed values are parsed by the fast parser
+            assert parse(value) == datetime.datetime.strptime(value, dt_format)
+
+            value = list(value)
+            for _ in range(rnd.randint(1, 2)):
+                i = rnd.randrange(len(value) + 1)
+                op = rnd.random()
+                if op < 0.5 and i < len(value):
+                    value[i] = rnd.choice(alphabet)
+                elif op < 0.75:
+                    value.insert(i, rnd.choice(alphabet))
+                elif i < len(value):
+                    del value[i]
+            value = ''.join(value)
+            result = parse(value)
+            if result is not None:
+                assert result == datetime.datetime.strptime(value, dt_format), (dt_format, value)
+
+    assert get_parser('%b %d') is None
+    assert get_parser('%Y %Y') is None
+
+
+def test_fast_parser_field():
+    class V2(Validator):
+        create_at = DatetimeField(dt_format='%Y-%m-%dT%H:%M:%S')
+
+    v = V2({'create_at': '2018-07-01T17:01:20'})
+    assert v.is_valid()
+    import datetime
+    assert v.validated_data['create_at'] == datetime.datetime(2018, 7, 1, 17, 1, 20)
+    for value in ('2018-07-01t17:01:20', '2018-7-1T17:01:20'):
+        assert V2({'create_at': value}).is_valid()
+    v = V2({'create_at': '2018-13-01T17:01:20'})
+    assert not v.is_valid()
+    assert 'does not match format' in str(v.errors['create_at'])
@@ -100,4 +100,28 @@ def test_errors():
     assert not v.is_valid()
     print(v.errors)
     print(v.str_errors)
-    
\ No newline at end of file
+    
+
+def test_copy():
+    class V(Validator):
+        deep = DictField()
+        shallow = DictField(copy='shallow')
+        none = DictField(copy='none')
+
+    blob = {'items': [1, 2, 3]}
+    v = V({'deep': blob, 'shallow': blob, 'none': blob})
+    assert v.is_valid()
+    data = v.validated_data
+    assert data['deep'] == blob and data['deep']['items'] is not blob['items']
+    assert data['shallow'] is not blob and data['shallow']['items'] is blob['items']
+    assert data['none'] is blob
+
+    assert V.to_dict()['shallow']['copy'] == 'shallow'
+    V2 = create_validator(V.to_dict())
+    assert V2({'none': blob}).is_valid()
+
+
+def test_wrong_copy():
+    import pytest
+    with pytest.raises(ValueError):
+        DictField(copy='foo')
@@ -29,4 +29,49 @@ def test_to_dict():
         assert p in field_info
     assert field_info['type'] == EmailField.FIELD_TYPE_NAME
     assert field_info['strict'] == True
-    assert field_info['regex'].pattern == EmailField.REGEX
\ No newline at end of file
+    assert field_info['regex'].pattern == EmailField.REGEX
+
+def test_match_email_same_as_regex():
+    import re
+    import random
+    from validator.fields import _match_email
+
+    regex = re.compile(EmailField.REGEX)
+    cases = [
+        'foo@example.com', 'foo@example.com\n', 'foo@example.com\n\n', '\nfoo@example.com',
+        'foo@example', 'foo@-example.com', 'foo@example-.com', 'foo@ex-ample.com', 'foo@example..com',
+        'foo@.example.com', 'foo@example.com.', '@example.com', 'foo@', 'foo', '', '\n', 'a@b',
+        'foo@@example.com', 'f@o@example.com', "a.!#$%&'*+/=?^_`{|}~-@b", 'foo bar@example.com',
+        'foo@' + 'a' * 63 + '.com', 'foo@' + 'a' * 64 + '.com', 'f\xf6o@example.com', 'foo@ex\xe4mple.com',
+        'foo@example.c\xf6m', 'foo@١.com', 'foo@exam_ple.com',
+    ]
+    alphabet = 'aZ09-._@!+\n \xe9'
+    rnd = random.Random(0)
+    for _ in range(20000):
+        cases.append(''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12))))
+    labels = ['a', 'a-b', '-a', 'a-', 'a' * 63, 'a' * 64, 'a' * 62 + '-', '', 'x9']
+    for _ in range(2000):
+        domain = '.'.join(rnd.choice(labels) for _ in range(rnd.randint(1, 4)))
+        cases.append('foo@' + domain + rnd.choice(['', '\n', '.', '!']))
+    # long values are checked by _match_email in EmailField
+    cases.append('foo@' + 'ab.' * 100 + 'com')
+    cases.append('foo@' + 'ab.' * 100 + 'com!')
+    cases.append('foo@' + ('a' * 63 + '.') * 4 + 'a' * 64)
+    cases.append('f' * 300 + '@example.com\n')
+    cases.append('a@' + 'a' * 5000 + '!')
+    cases.append('a@' + ('a' * 63 + '.') * 100 + 'com')
+
+    for value in cases:
+        assert _match_email(value) == (regex.match(value) is not None), repr(value)
+        assert V({'email': value}).is_valid() == (regex.match(value) is not None), repr(value)
+
+
+def test_subclass_regex():
+    class LowerEmailField(EmailField):
+        REGEX = r'^[a-z]+@[a-z]+\.com$'
+
+    class V2(Validator):
+        email = LowerEmailField()
+
+    assert V2({'email': 'foo@example.com'}).is_valid()
+    assert not V2({'email': 'Foo@example.com'}).is_valid()
@@ -38,3 +38,32 @@ def test_to_dict():
         assert p in field_info
     assert field_info['type'] == EnumField.FIELD_TYPE_NAME
     assert field_info['choices'] == [1, 2, 3]
+
+
+def test_many_choices():
+    choices = ['C{}'.format(i) for i in range(10000)]
+    for compiled in (False, True):
+        class V2(Validator):
+            COMPILED = compiled
+            code = EnumField(choices=choices)
+
+        assert V2({'code': 'C9999'}).is_valid()
+        assert not V2({'code': 'C10000'}).is_valid()
+        assert V2.to_dict()['code']['choices'] is choices
+
+
+def test_unhashable():
+    nan = float('nan')
+    for compiled in (False, True):
+        class V2(Validator):
+            COMPILED = compiled
+            value = EnumField(choices=[1, 'a', [1, 2], {'k': 1}, nan])
+
+        for value in (1, 1.0, True, 'a', [1, 2], {'k': 1}, nan):
+            v = V2({'value': value})
+            assert v.is_valid(), value
+            assert v.validated_data['value'] == value or value is nan
+        for value in (2, 'b', [1], {'k': 2}, (1, 2), ([1, 2], ), float('nan'), b'a'):
+            v = V2({'value': value})
+            assert not v.is_valid(), value
+            assert str(v.errors['value']) == '{!r} not in the choices'.format(value)
@@ -0,0 +1,72 @@
+from validator import Validator, StringField, IntegerField, FieldValidationError, ValidationError
+
+
+class V(Validator):
+    name = StringField(max_length=3)
+    age = IntegerField(min_value=1, max_value=120)
+
+
+def test_lazy_detail():
+    v = V({'name': 'abcd', 'age': 0})
+    assert not v.is_valid()
+    for error in v.errors.values():
+        assert not error._rendered
+    assert v.str_errors == {
+        'name': 'string is too long, max-lenght is 3',
+        'age': 'value is too small, min-value is 1',
+    }
+    assert str(v.errors['name']) == 'string is too long, max-lenght is 3'
+
+
+def test_params():
+    e = FieldValidationError('{0} and {1}', params=(1, 2))
+    assert e.detail == '1 and 2'
+    e = FieldValidationError('{a} and {b}', params={'a': 1, 'b': 2})
+    assert e.get_detail() == '1 and 2'
+    e = FieldValidationError('{0} is kept')
+    assert e.detail == '{0} is kept'
+    e.detail = 'changed'
+    assert str(e) == 'changed'
+
+
+def test_nested_detail():
+    v = V({'name': 'abcd'})
+    v.is_valid()
+    e = ValidationError(v.errors)
+    assert e.detail == {'name': 'string is too long, max-lenght is 3'}
+
+
+def test_pickle():
+    import pickle
+
+    v = V({'name': 'abcd', 'age': 0})
+    v.is_valid()
+    for error in v.errors.values():
+        e = pickle.loads(pickle.dumps(error))
+        assert type(e) is type(error)
+        assert e.detail == error.detail
+    e = pickle.loads(pickle.dumps(ValidationError(v.errors)))
+    assert e.detail == {'name': 'string is too long, max-lenght is 3', 'age': 'value is too small, min-value is 1'}
+
+
+def test_params_snapshot():
+    from validator import EnumField, IntegerField, IPAddressField
+
+    class V2(Validator):
+        sex = EnumField(choices=['f', 'm'])
+        age = IntegerField(strict=False)
+        ip = IPAddressField(engine='ipaddress')
+
+    value = ['f']
+    v = V2({'sex': value, 'age': 'x', 'ip': 'bad'})
+    assert not v.is_valid()
+    # a later change of the input doesn't change the message
+    value.append('m')
+    assert str(v.errors['sex']) == "['f'] not in the choices"
+    # the caught exceptions are not kept
+    for error in v.errors.values():
+        params = error.params or ()
+        assert not any(isinstance(p, BaseException) for p in params)
+        assert not isinstance(error._detail, BaseException)
+    assert str(v.errors['age']).startswith('type convertion(str -> integer) is failed: ')
+    assert 'does not appear to be an IPv4 or IPv6 address' in str(v.errors['ip'])
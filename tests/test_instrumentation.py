@@ -0,0 +1,82 @@
+import threading
+
+from validator import Validator, StringField, IntegerField, FieldValidationError
+
+
+class V(Validator):
+    name = StringField(max_length=5, required=True)
+    age = IntegerField(min_value=1, max_value=120, default=20)
+    nick = StringField()
+
+    def validate_nick(self, value):
+        if value == 'foo':
+            raise FieldValidationError('foo is forbidden')
+
+
+class CompiledV(V):
+    COMPILED = True
+
+
+def _run(validator_class):
+    results = []
+    for data in ({'name': 'Bob'}, {'name': 'toolong', 'age': 0}, {'nick': 'foo'}, {'name': 'Bob', 'nick': None}):
+        v = validator_class(data)
+        results.append((v.is_valid(), sorted(v.errors), v.validated_data))
+    return results
+
+
+def test_instrumentation():
+    for validator_class in (V, CompiledV):
+        expected = _run(validator_class)
+        original = validator_class._validate_fields
+        assert validator_class.instrumentation_snapshot() is None
+
+        calls = []
+        validator_class.enable_instrumentation(lambda name, elapsed, error: calls.append((name, error is None)))
+        assert _run(validator_class) == expected
+        snapshot = validator_class.instrumentation_snapshot()
+        assert sorted(snapshot) == ['age', 'name', 'nick']
+        assert snapshot['name']['calls'] == 4
+        assert snapshot['name']['failures'] == 2
+        assert snapshot['age']['failures'] == 1
+        assert snapshot['nick']['failures'] == 1
+        assert all(s['time_ns'] >= 0 for s in snapshot.values())
+        assert len(calls) == 12
+        assert ('nick', False) in calls
+
+        validator_class.check({'name': 'Bob'})
+        assert validator_class.instrumentation_snapshot()['name']['calls'] == 5
+        validator_class.reset_instrumentation()
+        assert validator_class.instrumentation_snapshot()['name'] == {'calls': 0, 'failures': 0, 'time_ns': 0}
+
+        validator_class.disable_instrumentation()
+        assert validator_class.instrumentation_snapshot() is None
+        assert validator_class._validate_fields is original
+        assert _run(validator_class) == expected
+
+
+def test_instrumentation_per_class():
+    V.enable_instrumentation()
+    try:
+        CompiledV({'name': 'Bob'}).is_valid()
+        assert CompiledV.instrumentation_snapshot() is None
+        assert V.instrumentation_snapshot()['name']['calls'] == 0
+    finally:
+        V.disable_instrumentation()
+
+
+def test_instrumentation_threads():
+    V.enable_instrumentation()
+    try:
+        def worker():
+            for _ in range(500):
+                V({'name': 'Bob'}).is_valid()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert V.instrumentation_snapshot()['name']['calls'] == 4000
+    finally:
+        V.disable_instrumentation()
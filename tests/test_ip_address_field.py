@@ -35,4 +35,61 @@ def test_to_dict():
     for p in IPAddressField.PARAMS:
         assert p in field_info
     assert field_info['type'] == IPAddressField.FIELD_TYPE_NAME
-    assert field_info['version'] == 'both'
\ No newline at end of file
+    assert field_info['version'] == 'both'
+
+
+def test_cache():
+    field = IPAddressField(version='ipv4', cache_size=10)
+    first = field.validate('127.0.0.1')
+    assert field.validate('127.0.0.1') is first
+    assert field.cache_info() == (1, 1, 10, 1)
+
+    for _ in range(2):
+        value, error = field._check('::1')
+        assert error is not None
+    assert field.cache_info().currsize == 1
+    assert IPAddressField.from_dict(field.to_dict()).cache_size == 10
+
+
+def test_ipaddress_engine():
+    import ipaddress
+    import pytest
+
+    class V2(Validator):
+        ip = IPAddressField(engine='ipaddress')
+        ipv4 = IPAddressField(version='ipv4', engine='ipaddress', required=False)
+        ipv6 = IPAddressField(version='ipv6', engine='ipaddress', required=False)
+
+    v = V2({'ip': '127.0.0.1'})
+    assert v.is_valid()
+    assert v.validated_data['ip'] == ipaddress.IPv4Address('127.0.0.1')
+    for value in ['::1234:1234', 0x7f000001, ipaddress.IPv6Address('::1')]:
+        assert V2({'ip': value}).is_valid(), value
+    for value in ['127.0.0.300', '10.0.0.0/8', '', 1.5, []]:
+        assert not V2({'ip': value}).is_valid(), value
+
+    assert V2({'ip': '::1', 'ipv4': '1.2.3.4', 'ipv6': '::1'}).is_valid()
+    v = V2({'ip': '::1', 'ipv4': '::1', 'ipv6': '1.2.3.4'})
+    assert not v.is_valid()
+    assert set(v.errors) == {'ipv4', 'ipv6'}
+    assert str(v.errors['ipv4']) == 'expected an ipv4 address, got ::1'
+
+    field = V2._FIELDS_MAP['ip']
+    assert field.to_presentation(ipaddress.ip_address('::0:1')) == '::1'
+    assert field.to_dict()['engine'] == 'ipaddress'
+    for _ in range(10):
+        assert V2(V2.mock_data()).is_valid()
+        assert isinstance(field.mock_data(), (ipaddress.IPv4Address, ipaddress.IPv6Address))
+
+    with pytest.raises(ValueError):
+        IPAddressField(engine='socket')
+
+
+def test_ipy_is_imported_lazily():
+    import subprocess
+    import sys
+
+    code = ('import sys, validator; assert "IPy" not in sys.modules; '
+            'validator.IPAddressField(engine="ipaddress"); assert "IPy" not in sys.modules; '
+            'validator.IPAddressField(); assert "IPy" in sys.modules')
+    subprocess.check_call([sys.executable, '-c', code])
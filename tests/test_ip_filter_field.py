@@ -0,0 +1,79 @@
+import ipaddress
+import pytest
+from validator import Validator, IPFilterField, create_validator
+from validator.compactset import IntervalSet
+
+ALLOW = ['10.0.0.0/8', '192.168.1.0/24', '172.16.0.1', '2001:db8::/32']
+DENY = ['10.1.0.0/16', '2001:db8:dead::/48']
+
+
+@pytest.mark.parametrize('engine', IPFilterField.SUPPORT_ENGINES)
+def test_ok(engine):
+    class V(Validator):
+        ip = IPFilterField(allow=ALLOW, deny=DENY, engine=engine)
+
+    for value in ['10.2.3.4', '10.255.255.255', '192.168.1.1', '172.16.0.1', '2001:db8::1']:
+        assert V({'ip': value}).is_valid(), value
+    for value in ['10.1.2.3', '11.0.0.0', '172.16.0.2', '2001:db8:dead::1', '::1', 'bad']:
+        assert not V({'ip': value}).is_valid(), value
+
+    v = V({'ip': '10.1.0.1'})
+    assert not v.is_valid()
+    assert str(v.errors['ip']) == '10.1.0.1 is in a denied network'
+    v = V({'ip': '11.0.0.1'})
+    assert not v.is_valid()
+    assert str(v.errors['ip']) == '11.0.0.1 is not in the allowed networks'
+
+    for _ in range(20):
+        assert V(V.mock_data()).is_valid()
+
+
+def test_deny_only():
+    field = IPFilterField(deny=['0.0.0.0/0'], engine='ipaddress')
+    assert field._check('1.2.3.4')[1] is not None
+    assert field._check('::1') == (ipaddress.ip_address('::1'), None)
+
+
+def test_ipy_networks():
+    field = IPFilterField(allow=['10.0.0.0/9', '10.128.0.0/9'], deny=['10.200.0.0/16'])
+    # a network value must be inside the allowed networks and can't overlap a denied one
+    assert field._check('10.0.0.0/10')[1] is None
+    assert field._check('10.0.0.0/7')[1] is not None
+    assert field._check('10.192.0.0/10')[1] is not None
+
+
+def test_to_dict():
+    class V(Validator):
+        ip = IPFilterField(allow=['10.0.0.1/8', '::1'], deny=['10.1.0.0/16'], version='ipv4', cache_size=8)
+
+    data_dict = V.to_dict()
+    field_info = data_dict['ip']
+    assert field_info['type'] == IPFilterField.FIELD_TYPE_NAME
+    assert field_info['allow'] == ['10.0.0.0/8', '::1/128']
+    assert field_info['deny'] == ['10.1.0.0/16']
+
+    V2 = create_validator(data_dict)
+    assert V2.to_dict() == data_dict
+    assert V2({'ip': '10.2.0.1'}).is_valid()
+    assert not V2({'ip': '10.1.0.1'}).is_valid()
+    assert not V2({'ip': '::1'}).is_valid()
+    assert IPFilterField().to_dict()['allow'] is None
+
+
+def test_invalid_networks():
+    with pytest.raises(ValueError):
+        IPFilterField(allow=['10.0.0.0/33'])
+    with pytest.raises(ValueError):
+        IPFilterField(allow=[], engine='ipaddress').mock_data()
+
+
+def test_interval_set():
+    intervals = IntervalSet([(10, 20), (21, 30), (5, 12), (40, 50), (2 ** 100, 2 ** 101)])
+    assert list(intervals) == [(5, 30), (40, 50), (2 ** 100, 2 ** 101)]
+    assert 5 in intervals and 30 in intervals and 2 ** 100 in intervals
+    assert 4 not in intervals and 31 not in intervals and 2 ** 101 + 1 not in intervals
+    assert intervals.covers(6, 29)
+    assert not intervals.covers(25, 45)
+    assert intervals.overlaps(25, 45)
+    assert not intervals.overlaps(31, 39)
+    assert not IntervalSet([]).overlaps(0, 10)
@@ -95,3 +95,89 @@ def test_no_field():
 
     data['cards'][0] = 2
     assert validated_data['cards'][0] != 2
+
+
+def test_copy():
+    class V(Validator):
+        deep = ListField()
+        shallow = ListField(copy='shallow')
+        none = ListField(copy='none')
+
+    items = [{'a': 1}]
+    v = V({'deep': items, 'shallow': items, 'none': items})
+    assert v.is_valid()
+    data = v.validated_data
+    assert data['deep'] == items and data['deep'][0] is not items[0]
+    assert data['shallow'] is not items and data['shallow'][0] is items[0]
+    assert data['none'] is items
+
+
+def _check_items(field, items):
+    # the item by item check of ListField
+    result = []
+    for item in items:
+        item, error = field._check_value(item)
+        if error is not None:
+            return None, error
+        result.append(item)
+    return result, None
+
+
+def test_items_fast_path():
+    import random
+    from validator import FloatField, NumberField, BoolField, StringField
+
+    class MyInt(int):
+        pass
+
+    nan = float('nan')
+    fields = [
+        IntegerField(min_value=0, max_value=100),
+        IntegerField(),
+        FloatField(min_value=-1.5, max_value=1.5),
+        NumberField(min_value=0, max_value=10),
+        BoolField(),
+        StringField(min_length=1, max_length=3),
+        StringField(regex='^a'),
+        IntegerField(min_value=0, max_value=100, validators=[lambda v: None]),
+    ]
+    pool = [0, 1, 50, 100, 101, -1, True, False, 0.5, 1.5, 2.0, -1.5, -2.0, nan, float('inf'),
+            10 ** 400, MyInt(5), '', 'a', 'ab', 'abcd', 'b', None, [1]]
+    rnd = random.Random(0)
+    for field in fields:
+        list_field = ListField(field=field)
+        for _ in range(3000):
+            items = [rnd.choice(pool) for _ in range(rnd.randint(0, 12))]
+            if rnd.random() < 0.5:
+                # mostly valid lists
+                items = [item for item in items if _check_items(field, [item])[1] is None]
+            value, error = list_field._check_value(items)
+            expected_value, expected_error = _check_items(field, items)
+            assert value == expected_value or (value is not None and len(value) == len(expected_value))
+            assert str(error) == str(expected_error), (field, items)
+            if value is not None:
+                assert all(type(a) is type(b) and (a == b or a != a) for a, b in zip(value, expected_value))
+
+
+def test_items_fast_path_large():
+    class V(Validator):
+        values = ListField(field=IntegerField(min_value=0, max_value=1000))
+
+    data = list(range(1001))
+    v = V({'values': data})
+    assert v.is_valid()
+    assert v.validated_data['values'] == data
+    assert v.validated_data['values'] is not data
+
+    data[500] = -1
+    v = V({'values': data})
+    assert not v.is_valid()
+    assert str(v.errors['values']) == 'value is too small, min-value is 0'
+    assert v.errors['values'].index == 500
+
+
+def test_error_index():
+    field = ListField(field=IntegerField(min_value=0))
+    for items in ([1, 2, -1, -2], [1] * 20 + [-1] + [-2] * 5, [1, 'a']):
+        error = field._check_value(items)[1]
+        assert error.index == next(i for i, item in enumerate(items) if field.field._check_value(item)[1])
@@ -0,0 +1,110 @@
+import pytest
+from validator import Validator, MembershipField, create_validator
+
+
+@pytest.fixture
+def str_source(tmp_path):
+    path = tmp_path / 'names.txt'
+    path.write_bytes('\n'.join(sorted(['alice', 'bob', 'carol', 'd\xe9sir\xe9e'], key=lambda s: s.encode('utf-8'))).encode('utf-8') + b'\n')
+    return str(path)
+
+
+@pytest.fixture
+def int_source(tmp_path):
+    path = tmp_path / 'ids.txt'
+    path.write_text('\n'.join(str(i) for i in range(0, 30000, 3)) + '\n\n')
+    return str(path)
+
+
+def test_str(str_source):
+    for use_mmap in (False, True):
+        for bloom_bits in (0, 10):
+            class V(Validator):
+                name = MembershipField(source=str_source, use_mmap=use_mmap, bloom_bits=bloom_bits)
+
+            for name in ('alice', 'bob', 'carol', 'd\xe9sir\xe9e'):
+                assert V({'name': name}).is_valid()
+            for name in ('', 'al', 'alicea', 'zed', 'Bob', '\ud800', 'bob\n'):
+                v = V({'name': name})
+                assert not v.is_valid()
+                assert str(v.errors['name']) == '{!r} is not an allowed value'.format(name)
+            assert not V({'name': 1}).is_valid()
+            assert V(V.mock_data()).is_valid()
+            usage = V._FIELDS_MAP['name'].memory_usage()
+            assert usage['count'] == 4
+            assert usage['mapped'] == use_mmap
+            assert (usage['bloom'] > 0) == bool(bloom_bits)
+
+
+def test_int(int_source):
+    class V(Validator):
+        id = MembershipField(source=int_source, value_type='int', bloom_bits=8)
+
+    assert V({'id': 0}).is_valid()
+    assert V({'id': 29997}).is_valid()
+    assert not V({'id': 1}).is_valid()
+    assert not V({'id': 30000}).is_valid()
+    assert not V({'id': 2 ** 70}).is_valid()
+    assert not V({'id': -2 ** 70}).is_valid()
+    assert not V({'id': '3'}).is_valid()
+    assert not V({'id': True}).is_valid()
+    usage = V._FIELDS_MAP['id'].memory_usage()
+    assert usage['count'] == 10000
+    assert usage['values'] == 10000 * 8
+
+
+def test_values():
+    field = MembershipField(values=[3, 1, 2, 3], value_type='int')
+    assert field._check(2) == (2, None)
+    assert field.memory_usage()['count'] == 3
+    assert MembershipField(values=['b', 'a'])._check('a') == ('a', None)
+
+
+def test_big_int():
+    field = MembershipField(values=[2 ** 64, 1, -2 ** 70], value_type='int')
+    assert field._check(2 ** 64) == (2 ** 64, None)
+    assert field._check(-2 ** 70) == (-2 ** 70, None)
+    assert field._check(1) == (1, None)
+    assert field._check(2) != (2, None)
+    assert field.memory_usage()['count'] == 3
+
+
+def test_empty(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    for field in (MembershipField(values=[]), MembershipField(values=[], value_type='int'),
+                  MembershipField(source=str(path), use_mmap=True)):
+        assert field._check('a')[1] is not None
+        with pytest.raises(ValueError):
+            field.mock_data()
+
+
+def test_params():
+    with pytest.raises(ValueError):
+        MembershipField()
+    with pytest.raises(ValueError):
+        MembershipField(values=[1], value_type='float')
+    with pytest.raises(ValueError):
+        MembershipField(values=['a'], use_mmap=True)
+
+
+def test_mmap_unsorted(tmp_path):
+    path = tmp_path / 'unsorted.txt'
+    path.write_bytes(b'b\na\n')
+    with pytest.raises(ValueError):
+        MembershipField(source=str(path), use_mmap=True)
+    assert MembershipField(source=str(path))._check('a') == ('a', None)
+
+
+def test_to_dict(int_source):
+    class V(Validator):
+        id = MembershipField(source=int_source, value_type='int')
+
+    field_info = V.to_dict()['id']
+    assert field_info['type'] == 'membership'
+    assert field_info['source'] == int_source
+    assert 'values' not in field_info
+    assert field_info['use_mmap'] is False
+    V2 = create_validator(V.to_dict())
+    assert V2({'id': 3}).is_valid()
+    assert not V2({'id': 4}).is_valid()
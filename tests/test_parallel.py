@@ -0,0 +1,105 @@
+from validator import Validator, StringField, IntegerField, FieldValidationError, create_validator
+import pytest
+from validator import DictField, ListField
+from validator import parallel
+from validator.parallel import validate_parallel
+
+
+class V(Validator):
+    name = StringField(max_length=50, required=True)
+    age = IntegerField(min_value=1, max_value=120, default=20)
+
+    def validate_name(self, value):
+        if value == 'foo':
+            raise FieldValidationError('"foo" is invalid')
+
+
+RECORDS = [
+    {'name': 'name{}'.format(i), 'age': i % 150} if i % 7 else {'name': 'foo'}
+    for i in range(100)
+]
+
+
+def check_result(validator_class, result):
+    expected = validator_class.validate_many(RECORDS)
+    assert result.validated_data == expected.validated_data
+    assert sorted(result.errors) == sorted(expected.errors)
+    for i, errors in result.errors.items():
+        assert {k: str(e) for k, e in errors.items()} == {k: str(e) for k, e in expected.errors[i].items()}
+
+
+def test_validator_class():
+    result = validate_parallel(V, RECORDS, chunksize=7, max_workers=2)
+    check_result(V, result)
+    assert 0 in result.errors
+
+
+def test_create_validator():
+    V2 = create_validator(V.to_dict())
+    result = validate_parallel(V2, iter(RECORDS), chunksize=30, max_workers=2)
+    check_result(V2, result)
+    assert 0 not in result.errors
+
+
+def test_local_class():
+    class Local(Validator):
+        name = StringField()
+
+        def validate_name(self, value):
+            if value == 'foo':
+                raise FieldValidationError('"foo" is invalid')
+
+    assert 0 in Local.validate_many(RECORDS).errors
+    # rebuilding it from to_dict() would drop validate_name
+    with pytest.raises(ValueError):
+        validate_parallel(Local, RECORDS, max_workers=2)
+
+    class Sub(create_validator(V.to_dict())):
+        def validate(self, data):
+            return data
+
+    with pytest.raises(ValueError):
+        validate_parallel(Sub, RECORDS, max_workers=2)
+
+
+def test_nested_local_class():
+    class Inner(Validator):
+        name = StringField()
+
+        def validate_name(self, value):
+            if value == 'foo':
+                raise FieldValidationError('"foo" is invalid')
+
+    # a DictField validator with hooks can't be rebuilt from to_dict()
+    for field_info in ({'type': 'dict', 'validator': Inner},
+                       {'type': 'list', 'field': DictField(validator=Inner)}):
+        Outer = create_validator({'inner': field_info})
+        with pytest.raises(ValueError):
+            validate_parallel(Outer, [{'inner': {'name': 'foo'}}], max_workers=1)
+
+    # Inner is created by create_validator too, it is rebuilt from to_dict()
+    Outer = create_validator({'inner': DictField(validator=Inner).to_dict()})
+    result = validate_parallel(Outer, [{'inner': {'name': 'foo'}}], max_workers=1)
+    assert result.validated_data == [{'inner': {'name': 'foo'}}]
+
+
+def test_bounded_read_ahead(monkeypatch):
+    consumed = []
+    merged = []
+    merge = parallel._merge
+
+    def records():
+        for record in RECORDS:
+            consumed.append(record)
+            yield record
+
+    def counting_merge(result, offset, validated_data, errors):
+        # at most 2 chunks per worker are read ahead of the merged ones
+        assert len(consumed) - len(merged) <= 5 * 2 * 2 + 5
+        merged.extend(range(len(result.validated_data) + len(result.errors)))
+        return merge(result, offset, validated_data, errors)
+
+    monkeypatch.setattr(parallel, '_merge', counting_merge)
+    result = validate_parallel(V, records(), chunksize=5, max_workers=2)
+    check_result(V, result)
+    assert len(merged) == len(RECORDS)
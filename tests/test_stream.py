@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import io
+from validator import Validator, StringField, IntegerField, ValidationError, validate_ndjson
+
+
+class V(Validator):
+    name = StringField(max_length=50, required=True)
+    age = IntegerField(min_value=1, max_value=120, default=20)
+
+
+LINES = '\n'.join([
+    '{"name": "Bob"}',
+    '{"age": 30}',
+    '',
+    'not json',
+    '[1, 2]',
+    '{"name": "Alice", "age": 40}',
+]) + '\n'
+
+
+def test_ok():
+    results = list(validate_ndjson(V, io.StringIO(LINES)))
+    assert [line_no for line_no, _ in results] == [1, 2, 4, 5, 6]
+    assert results[0][1] == {'name': 'Bob', 'age': 20}
+    assert isinstance(results[1][1], ValidationError)
+    assert 'name' in results[1][1].detail
+    assert '__data_error__' in results[2][1].detail
+    assert '__data_error__' in results[3][1].detail
+    assert results[4][1] == {'name': 'Alice', 'age': 40}
+
+
+def test_skip_invalid_and_rejects():
+    rejects = io.StringIO()
+    results = list(validate_ndjson(V, io.BytesIO(LINES.encode('utf-8')), skip_invalid=True, rejects=rejects))
+    assert [line_no for line_no, _ in results] == [1, 6]
+    assert rejects.getvalue() == '{"age": 30}\nnot json\n[1, 2]\n'
+
+
+def test_max_errors():
+    results = list(validate_ndjson(V, io.StringIO(LINES), max_errors=2))
+    assert [line_no for line_no, _ in results] == [1, 2, 4]
+
+
+def test_path(tmpdir):
+    path = tmpdir.join('data.ndjson')
+    path.write(LINES)
+    rejects = tmpdir.join('rejects.ndjson')
+    results = list(validate_ndjson(V, str(path), skip_invalid=True, rejects=str(rejects)))
+    assert len(results) == 2
+    assert len(rejects.readlines()) == 3
@@ -70,3 +70,25 @@ def test_to_dict():
     assert field_info['min_length'] == 0
     assert field_info['max_length'] is None
     assert field_info['regex'] is None
+
+
+def test_regex_cache():
+    from validator import EmailField, MD5Field, SHAField
+    from validator.utils import compile_regex
+
+    assert StringField(regex='^my').regex is StringField(regex='^my').regex
+    info = compile_regex.cache_info()
+    StringField(regex='^my')
+    assert compile_regex.cache_info().hits == info.hits + 1
+
+    # class-level patterns are compiled at class definition
+    assert EmailField().regex is EmailField._REGEX_PATTERN
+    assert MD5Field().regex is MD5Field().regex
+    assert SHAField(version=1).regex is SHAField(version=1).regex
+    assert SHAField(version=1).regex is not SHAField(version=256).regex
+
+    class LowerEmailField(EmailField):
+        REGEX = r'^[a-z]+@[a-z]+\.com$'
+
+    assert LowerEmailField().regex.pattern == LowerEmailField.REGEX
+    assert EmailField().regex.pattern == EmailField.REGEX
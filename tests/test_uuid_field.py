@@ -55,4 +55,17 @@ def test_presentation():
     assert value == uid.bytes
 
     value = UUIDField(format='bytes_le').to_presentation(uid)
-    assert value == uid.bytes_le
\ No newline at end of file
+    assert value == uid.bytes_le
+
+
+def test_cache():
+    field = UUIDField(cache_size=10)
+    value = str(uuid.uuid4())
+    first = field.validate(value)
+    assert first == uuid.UUID(value)
+    assert field.validate(value) is first
+    assert field.cache_info() == (1, 1, 10, 1)
+    assert not V({'uid': '0' * 10}).is_valid()
+
+    with pytest.raises(ValueError):
+        UUIDField(cache_size=-1)
@@ -1,3 +1,4 @@
+import pytest
 from validator import Validator, StringField, IntegerField, EnumField, FieldValidationError, ValidationError
 
 
@@ -61,3 +62,303 @@ def test_missed_field():
     v = V(data)
     v.is_valid()
     assert 'age' not in v.validated_data
+
+
+def test_fields_plan():
+    class V(Validator):
+        name = StringField(max_length=50, required=True)
+        age = IntegerField(min_value=1, max_value=120, default=lambda: 20)
+
+    plan = V._FIELDS_PLAN
+    assert [item[0] for item in plan] == list(V._FIELDS_MAP)
+
+    v = V({'name': 'Bob'})
+    assert v.is_valid()
+    assert v.validated_data == {'name': 'Bob', 'age': 20}
+
+    v = V({})
+    assert not v.is_valid()
+    assert 'name' in v.errors
+
+
+def test_inherited_field_validator():
+    class V(Validator):
+        name = StringField(max_length=50)
+
+        def validate_name(self, value):
+            raise FieldValidationError('parent hook')
+
+    class V2(V):
+        @staticmethod
+        def validate_name(value):
+            if value == 'foo':
+                raise FieldValidationError('"foo" is invalid')
+
+    assert not V({'name': 'Bob'}).is_valid()
+    assert V2({'name': 'Bob'}).is_valid()
+    assert not V2({'name': 'foo'}).is_valid()
+
+
+def test_validate_many():
+    class V(Validator):
+        name = StringField(max_length=50, required=True)
+        age = IntegerField(min_value=1, max_value=120, default=20)
+
+        def validate_name(self, value):
+            if value == self.raw_data.get('forbidden'):
+                raise FieldValidationError('forbidden name')
+
+        def validate(self, data):
+            if data['name'] == 'bar':
+                raise ValidationError('bar is invalid')
+            return data
+
+    records = [
+        {'name': 'Bob'},
+        {'age': 30},
+        {'name': 'Alice', 'age': 300},
+        {'name': 'foo', 'forbidden': 'foo'},
+        {'name': 'bar'},
+        {'name': 'Carol', 'age': 40},
+    ]
+    result = V.validate_many(iter(records))
+    assert result.validated_data == [{'name': 'Bob', 'age': 20}, {'name': 'Carol', 'age': 40}]
+    assert sorted(result.errors) == [1, 2, 3, 4]
+    assert list(result.errors[1]) == ['name']
+    assert list(result.errors[2]) == ['age']
+    assert list(result.errors[3]) == ['name']
+    assert list(result.errors[4]) == ['__data_error__']
+    for i, record in enumerate(records):
+        v = V(record)
+        assert v.is_valid() == (i not in result.errors)
+
+
+def test_field_named_many():
+    # `validate_many` of Validator is not the hook of a field named `many`
+    class V(Validator):
+        many = IntegerField()
+
+    assert V._FIELDS_PLAN[0][3] is None
+    v = V({'many': 3})
+    assert v.is_valid()
+    assert v.validated_data == {'many': 3}
+    assert V.validate_many([{'many': 3}]).validated_data == [{'many': 3}]
+
+    # a hook defined by the class itself still works
+    class V2(Validator):
+        many = IntegerField()
+
+        def validate_many(self, value):
+            if value > 10:
+                raise FieldValidationError('too many')
+
+    assert V2({'many': 3}).is_valid()
+    assert not V2({'many': 11}).is_valid()
+
+
+def test_fail_fast():
+    calls = []
+
+    class V(Validator):
+        name = StringField(max_length=50, required=True)
+        age = IntegerField(min_value=1, max_value=120, default=20)
+        sex = EnumField(choices=['f', 'm'])
+
+        def validate_sex(self, value):
+            calls.append(value)
+
+        def validate(self, data):
+            calls.append(data)
+            return data
+
+    data = {'age': 200, 'sex': 'f'}
+    v = V(data)
+    assert not v.is_valid()
+    assert sorted(v.errors) == ['age', 'name']
+    assert calls == ['f']
+
+    del calls[:]
+    v = V(data)
+    assert not v.is_valid(fail_fast=True)
+    assert list(v.errors) == ['name']
+    assert calls == []
+
+    result = V.validate_many([data, {'name': 'Bob'}], fail_fast=True)
+    assert list(result.errors[0]) == ['name']
+    assert result.validated_data == [{'name': 'Bob', 'age': 20}]
+
+
+def test_slots():
+    from validator import create_validator
+
+    class V(Validator):
+        name = StringField(max_length=50)
+
+    v = V({'name': 'Bob'})
+    v.foo = 'bar'
+    assert not hasattr(StringField(), '__dict__')
+
+    V2 = create_validator(V.to_dict())
+    v = V2({'name': 'Bob'})
+    assert v.is_valid()
+    assert not hasattr(v, '__dict__')
+
+
+def test_check():
+    import threading
+
+    class V(Validator):
+        name = StringField(max_length=50, required=True)
+        age = IntegerField(min_value=1, max_value=120, default=20)
+
+        def validate_name(self, value):
+            if value == self.raw_data.get('forbidden'):
+                raise FieldValidationError('forbidden name')
+
+        def validate(self, data):
+            if data['name'] == 'bar':
+                raise ValidationError('bar is invalid')
+            return data
+
+    result = V.check({'name': 'Bob'})
+    assert result.is_valid and result
+    assert result.validated_data == {'name': 'Bob', 'age': 20}
+    assert dict(result.errors) == {}
+
+    result = V.check({'name': 'foo', 'forbidden': 'foo', 'age': 0})
+    assert not result.is_valid and not result
+    assert result.validated_data is None
+    assert sorted(result.errors) == ['age', 'name']
+    with pytest.raises(TypeError):
+        result.errors['name'] = None
+    with pytest.raises(AttributeError):
+        result.validated_data = {}
+
+    assert list(V.check({'name': 'bar'}).errors) == ['__data_error__']
+    assert list(V.check({'age': 0}, fail_fast=True).errors) == ['name']
+
+    records = [{'name': 'n{}'.format(i), 'forbidden': 'n{}'.format(i % 3 * i)} for i in range(200)]
+    expected = [V(dict(r)).is_valid() for r in records]
+    failures = []
+
+    def worker():
+        for _ in range(20):
+            for record, valid in zip(records, expected):
+                if V.check(record).is_valid != valid:
+                    failures.append(record)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert failures == []
+
+
+def test_check_reentrant():
+    class Node(Validator):
+        name = StringField(max_length=50, required=True)
+
+        def validate_name(self, value):
+            child = self.raw_data.get('child')
+            if child is not None and not Node.check(child).is_valid:
+                raise FieldValidationError('invalid child')
+            # raw_data is restored after the nested check
+            assert self.raw_data.get('name') == value
+
+    assert Node.check({'name': 'a', 'child': {'name': 'b', 'child': {'name': 'c'}}}).is_valid
+    assert not Node.check({'name': 'a', 'child': {'name': 'b', 'child': {}}}).is_valid
+
+
+def test_check_custom_init():
+    class V(Validator):
+        name = StringField(max_length=50, required=True)
+
+        def __init__(self, raw_data, forbidden='foo'):
+            super(V, self).__init__(raw_data)
+            self.forbidden = forbidden
+
+        def validate_name(self, value):
+            if value == self.forbidden:
+                raise FieldValidationError('forbidden name')
+
+    records = [{'name': 'Bob'}, {'name': 'foo'}, {}]
+    expected = [V(record).is_valid() for record in records]
+    assert expected == [True, False, False]
+    assert [V.check(record).is_valid for record in records] == expected
+    result = V.validate_many(records)
+    assert sorted(result.errors) == [1, 2]
+    assert result.validated_data == [{'name': 'Bob'}]
+    assert V.validate_columns({'name': ['Bob', 'foo']}).mask == [True, False]
+
+
+def test_create_validator_cache():
+    import copy
+    from validator import create_validator
+
+    schema = {
+        'name': {'type': 'string', 'max_length': 50, 'required': True},
+        'sex': {'type': 'enum', 'choices': ['f', 'm'], 'default': 'f'},
+        'info': {'type': 'dict', 'validator': {'age': {'type': 'integer', 'min_value': 1}}},
+    }
+    original = copy.deepcopy(schema)
+    create_validator.cache_clear()
+
+    V = create_validator(schema, cache=True)
+    assert schema == original
+    assert create_validator.cache_info().misses > 0
+
+    info = create_validator.cache_info()
+    # same schema in a different order
+    reordered = dict(reversed(list(copy.deepcopy(schema).items())))
+    assert create_validator(reordered, cache=True) is V
+    assert create_validator.cache_info().hits == info.hits + 1
+    assert V({'name': 'Bob', 'info': {'age': 20}}).is_valid()
+    assert not V({'name': 'Bob', 'info': {'age': 0}}).is_valid()
+
+    assert create_validator(schema, name='Other', cache=True) is not V
+    assert create_validator(schema, compiled=True, cache=True) is not V
+    assert create_validator(schema, cache=False) is not V
+    assert create_validator(schema) is not V
+    # 1 and True are different defaults
+    V1 = create_validator({'n': {'type': 'integer', 'default': 1}}, cache=True)
+    V2 = create_validator({'n': {'type': 'integer', 'default': True}}, cache=True)
+    assert V1 is not V2
+    # unhashable values are not cached
+    default = bytearray(b'x')
+    assert create_validator({'n': {'type': 'string', 'default': default}}, cache=True) is not \
+        create_validator({'n': {'type': 'string', 'default': default}}, cache=True)
+
+    create_validator.cache_clear()
+    assert create_validator.cache_info() == (0, 0, 256, 0)
+
+
+def test_create_validator_not_shared():
+    from validator import create_validator
+
+    schema = {'name': {'type': 'string', 'max_length': 5}}
+    V1 = create_validator(schema)
+    V2 = create_validator(schema)
+    assert V1 is not V2
+
+    V1.enable_instrumentation()
+    V1.extra = 1
+    assert V1({'name': 'Bob'}).is_valid()
+    assert V1.instrumentation_snapshot()['name']['calls'] == 1
+    assert V2.instrumentation_snapshot() is None
+    assert not hasattr(V2, 'extra')
+    assert V2._validate_fields is not V1._validate_fields
+
+
+def test_lru_cache():
+    from validator.utils import LRUCache
+
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.info() == (2, 1, 2, 2)
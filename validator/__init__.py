@@ -2,4 +2,5 @@ __version__ = '0.0.8'
 
 from .validator import Validator, create_validator
 from .fields import *
-from .exceptions import *
\ No newline at end of file
+from .exceptions import *
+from .stream import validate_ndjson
\ No newline at end of file
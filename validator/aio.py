@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio support: validate data with async field validators and `validate_<name>` hooks.
+"""
+import asyncio
+import copy
+import inspect
+from . import exceptions
+from .fields import EMPTY_VALUE
+from .validator import _is_async_callable
+
+
+def _close(awaitables):
+    for aw in awaitables:
+        if inspect.iscoroutine(aw):
+            aw.close()
+
+
+def _split_async_validators(field):
+    """
+    return (check, async_validators) of a field which overrides `validate`:
+    `check` is the `_check_value` of a copy of the field without the async validators,
+    since the overridden `validate` would call them without awaiting them.
+    """
+    async_validators = [v for v in field.validators if _is_async_callable(v)]
+    if not async_validators:
+        return field._check_value, ()
+    sync_field = copy.copy(field)
+    sync_field.validators = [v for v in field.validators if not _is_async_callable(v)]
+    return sync_field._check_value, async_validators
+
+
+def _async_checks(validator_class):
+    """
+    return a dict maps the name of every field which overrides `validate` to
+    `_split_async_validators(field)`, computed once per class.
+    """
+    checks = vars(validator_class).get('_ASYNC_CHECKS')
+    if checks is None:
+        checks = {}
+        for name, field in validator_class._FIELDS_MAP.items():
+            if not field._NATIVE_CHECK:
+                checks[name] = _split_async_validators(field)
+        validator_class._ASYNC_CHECKS = checks
+    return checks
+
+
+def _validate_fields(validator):
+    """
+    validate fields synchronously, collect the awaitables returned by field validators and hooks.
+
+    return (data, errors, pending), `pending` is a list of (name, awaitables).
+    """
+    raw_data = validator.raw_data
+    fields_map = validator._FIELDS_MAP
+    async_checks = _async_checks(type(validator))
+    data = {}
+    errors = {}
+    pending = []
+    for name, check, to_internal, hook, default, default_factory, required in validator._FIELDS_PLAN:
+        if name in raw_data:
+            value = raw_data[name]
+        elif default_factory is None:
+            value = default
+        else:
+            value = default_factory()
+
+        if value is EMPTY_VALUE:
+            if required:
+                errors[name] = exceptions.FieldRequiredError()
+            continue
+
+        if value is None:
+            data[name] = None
+            continue
+
+        field = fields_map[name]
+        awaitables = []
+        try:
+            if field._NATIVE_CHECK:
+                value = field._validate(value)
+                for v in field.validators:
+                    result = v(value)
+                    if inspect.isawaitable(result):
+                        awaitables.append(result)
+            else:
+                # `validate` is overridden, call it like `_check_value` does,
+                # then run the async validators which it can't await, once
+                sync_check, async_validators = async_checks[name]
+                value, error = sync_check(value)
+                if error is not None:
+                    raise error
+                for v in async_validators:
+                    awaitables.append(v(value))
+            value = to_internal(value)
+            if hook is not None:
+                result = hook(validator, value)
+                if inspect.isawaitable(result):
+                    awaitables.append(result)
+        except exceptions.FieldValidationError as e:
+            _close(awaitables)
+            errors[name] = e
+            continue
+        except BaseException:
+            _close(awaitables)
+            raise
+        data[name] = value
+        if awaitables:
+            pending.append((name, awaitables))
+    return data, errors, pending
+
+
+async def _gather(pending, concurrency):
+    """
+    run all awaitables concurrently, at most `concurrency` at a time.
+    return a dict maps field name to its first FieldValidationError.
+    """
+    semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+    async def run(aw):
+        if semaphore is None:
+            return await aw
+        async with semaphore:
+            return await aw
+
+    tasks = [run(aw) for name, awaitables in pending for aw in awaitables]
+    results = iter(await asyncio.gather(*tasks, return_exceptions=True))
+    errors = {}
+    for name, awaitables in pending:
+        for _ in awaitables:
+            result = next(results)
+            if isinstance(result, exceptions.FieldValidationError):
+                errors.setdefault(name, result)
+            elif isinstance(result, BaseException):
+                raise result
+    return errors
+
+
+async def validate_async(validator, concurrency=None):
+    """
+    async version of `Validator._validate`.
+
+    field values are validated synchronously first, then the awaitables returned by field validators
+    and `validate_<name>` hooks of all fields run concurrently with `asyncio.gather`, at most
+    `concurrency` at a time (None means no limit). If a field has several failed validators,
+    the error of the first one is kept. `validate` may be a coroutine function too.
+    """
+    if not validator._HAS_ASYNC:
+        validator._validate()
+        return
+
+    data, errors, pending = _validate_fields(validator)
+    if pending:
+        async_errors = await _gather(pending, concurrency)
+        for name, e in async_errors.items():
+            errors[name] = e
+            data.pop(name, None)
+
+    if errors:
+        validator.errors.update(errors)
+        return
+    try:
+        data = validator.validate(data)
+        if inspect.isawaitable(data):
+            data = await data
+    except exceptions.ValidationError as e:
+        validator.errors['__data_error__'] = e
+
+    if not validator.errors:
+        validator.validated_data = data
+
+
+async def is_valid_async(validator, raise_error=False, concurrency=None):
+    """
+    see `Validator.is_valid_async`
+    """
+    await validate_async(validator, concurrency)
+    if raise_error and validator.errors:
+        raise exceptions.ValidationError(validator.errors)
+    return False if validator.errors else True
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar validation: validate `{field_name: sequence}` without building a dict for every row.
+
+every column is checked as a whole: range checks of number fields, length checks of StringField
+and membership of EnumField are done by builtins over the whole column, or by NumPy if the column
+is a `numpy.ndarray`. Only the values which may be invalid are checked one by one, so the errors
+are the same as the errors of `Validator(row).is_valid()`.
+
+NumPy is optional, it is never imported unless a column is a `numpy.ndarray`.
+"""
+from __future__ import unicode_literals
+from functools import partial
+from operator import is_not
+import six
+from six.moves import range
+from . import exceptions
+from .fields import (EMPTY_VALUE, ITEMS_VALID_FUNCTIONS, EnumField, StringField, BoolField,
+                     NumberField, IntegerField, FloatField, TimestampField)
+from .validator import Validator, ColumnsResult, _find_class_attr
+
+_is_not_none = partial(is_not, None)
+
+
+def _enum_values_valid(field, values):
+    try:
+        return all(map(field._index.__contains__, values))
+    except TypeError:
+        # unhashable value
+        return False
+
+
+# field class -> function `values_valid(field, values)`, True if all values are valid.
+VALUES_VALID_FUNCTIONS = dict(ITEMS_VALID_FUNCTIONS)
+VALUES_VALID_FUNCTIONS[EnumField] = _enum_values_valid
+
+# dtype kinds of numpy arrays whose items are accepted by the number fields
+_NUMBER_KINDS = {
+    IntegerField: 'biu',
+    TimestampField: 'biu',
+    FloatField: 'f',
+    NumberField: 'biuf',
+}
+
+
+def _is_ndarray(column):
+    return type(column).__name__ == 'ndarray' and type(column).__module__ == 'numpy'
+
+
+def _exact_bound(kind, bound):
+    """
+    whether numpy compares `bound` with the items of a column of `kind` exactly like python.
+    float columns are cast to float64, so the bound must be a float or an int which is a float64.
+    """
+    if kind == 'f':
+        return isinstance(bound, float) or (isinstance(bound, six.integer_types) and float(bound) == bound)
+    return isinstance(bound, six.integer_types)
+
+
+def _ndarray_ok(field, column):
+    """
+    return a boolean array, False for the rows which may be invalid, or None if the column
+    can't be checked by numpy.
+    """
+    import numpy
+
+    kind = column.dtype.kind
+    if kind == 'f':
+        # python compares the exact value of an item, e.g. 0.1 of float32 is greater than 0.1,
+        # float64 holds every float16/float32 value exactly. longdouble items aren't python floats
+        if column.dtype.itemsize > 8:
+            return None
+        column = column.astype(numpy.float64)
+    field_class = type(field)
+    if field_class in _NUMBER_KINDS:
+        if kind not in _NUMBER_KINDS[field_class]:
+            return None
+        bounds = [b for b in (field.min_value, field.max_value) if b is not None]
+        if not all(_exact_bound(kind, b) for b in bounds):
+            return None
+        ok = numpy.ones(len(column), dtype=bool)
+        # NaN is not less or greater than anything, it is valid like in NumberField._check
+        if field.min_value is not None:
+            ok &= ~(column < field.min_value)
+        if field.max_value is not None:
+            ok &= ~(column > field.max_value)
+        return ok
+    if field_class is BoolField:
+        return numpy.ones(len(column), dtype=bool) if kind == 'b' else None
+    if field_class is StringField:
+        if kind != 'U' or field.regex is not None:
+            return None
+        lengths = numpy.char.str_len(column)
+        ok = lengths >= field.min_length
+        if field.max_length:
+            ok &= lengths <= field.max_length
+        return ok
+    if field_class is EnumField:
+        if kind in 'biuf':
+            # a choice which numpy would round could match a different item
+            choices = [c for c in field._index
+                       if isinstance(c, six.integer_types + (float, )) and _exact_bound(kind, c)]
+        elif kind == 'U':
+            choices = [c for c in field._index if isinstance(c, six.string_types)]
+        else:
+            return None
+        return numpy.isin(column, choices)
+    return None
+
+
+def _failed_rows(field, check, to_internal, column):
+    """
+    yield (row, error) for the invalid values of column, None is valid.
+    """
+    if _is_ndarray(column):
+        ok = None
+        if column.ndim == 1 and not field.validators:
+            try:
+                ok = _ndarray_ok(field, column)
+            except (TypeError, OverflowError):
+                ok = None
+        if ok is not None:
+            import numpy
+            rows = numpy.flatnonzero(~ok).tolist()
+            for row in rows:
+                error = _check(check, to_internal, column.item(row))
+                if error is not None:
+                    yield row, error
+            return
+        column = column.tolist()
+
+    values_valid = VALUES_VALID_FUNCTIONS.get(type(field))
+    if values_valid is not None and not field.validators:
+        values = column
+        if None in values:
+            values = list(filter(_is_not_none, values))
+        if values_valid(field, values):
+            return
+
+    for row, value in enumerate(column):
+        if value is not None:
+            error = _check(check, to_internal, value)
+            if error is not None:
+                yield row, error
+
+
+def _check(check, to_internal, value):
+    value, error = check(value)
+    if error is None:
+        try:
+            to_internal(value)
+        except exceptions.FieldValidationError as e:
+            error = e
+    return error
+
+
+def _failed_default_rows(check, to_internal, default_factory, required, n_rows):
+    for row in range(n_rows):
+        value = default_factory()
+        if value is EMPTY_VALUE:
+            if required:
+                yield row, exceptions.FieldRequiredError()
+        elif value is not None:
+            error = _check(check, to_internal, value)
+            if error is not None:
+                yield row, error
+
+
+def _has_row_hooks(validator_class):
+    """
+    whether validator_class has `validate_<name>` hooks or overrides `validate`
+    """
+    if _find_class_attr(validator_class, 'validate') is not vars(Validator)['validate']:
+        return True
+    return any(item[3] is not None for item in validator_class._FIELDS_PLAN)
+
+
+def _validate_rows(validator_class, columns, n_rows, mask, errors):
+    """
+    validate row by row, a dict is built for one row at a time.
+    """
+    batch_validate = validator_class._make_batch_validate()
+    getters = []
+    for name, column in six.iteritems(columns):
+        getters.append((name, column.item if _is_ndarray(column) else column.__getitem__))
+    for row in range(n_rows):
+        _, row_errors = batch_validate(dict((name, get(row)) for name, get in getters))
+        if row_errors:
+            mask[row] = False
+            for name, error in six.iteritems(row_errors):
+                errors[(row, name)] = error
+
+
+def validate_columns(validator_class, columns):
+    """
+    see `Validator.validate_columns`
+    """
+    lengths = set(len(column) for column in columns.values())
+    if len(lengths) > 1:
+        raise ValueError('columns have different lengths: {}'.format(sorted(lengths)))
+    n_rows = lengths.pop() if lengths else 0
+    mask = [True] * n_rows
+    errors = {}
+
+    if _has_row_hooks(validator_class):
+        _validate_rows(validator_class, columns, n_rows, mask, errors)
+        return ColumnsResult(mask, errors)
+
+    for name, check, to_internal, hook, default, default_factory, required in validator_class._FIELDS_PLAN:
+        if name in columns:
+            field = validator_class._FIELDS_MAP[name]
+            failures = _failed_rows(field, check, to_internal, columns[name])
+        elif default_factory is not None:
+            failures = _failed_default_rows(check, to_internal, default_factory, required, n_rows)
+        elif default is EMPTY_VALUE:
+            if not required:
+                continue
+            failures = ((row, exceptions.FieldRequiredError()) for row in range(n_rows))
+        elif default is None:
+            continue
+        else:
+            error = _check(check, to_internal, default)
+            if error is None:
+                continue
+            failures = ((row, error) for row in range(n_rows))
+
+        for row, error in failures:
+            mask[row] = False
+            errors[(row, name)] = error
+    return ColumnsResult(mask, errors)
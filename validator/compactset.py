@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Compact read-only sets for huge allowlists, used by `MembershipField`.
+
+- `IntSet`: sorted `array('q')`, 8 bytes per value, lookup by bisect.
+  a sorted list is used instead if a value doesn't fit in 64 bits.
+- `BytesSet`: sorted values in one buffer (bytes or mmap) separated by newlines,
+  plus an `array('q')` of offsets, lookup by binary search.
+- `BloomFilter`: optional prefilter rejecting most absent values without a search.
+- `IntervalSet`: disjoint sorted intervals of integers, e.g. the address ranges of CIDR networks
+  used by `IPFilterField`, lookup by bisect.
+"""
+from __future__ import unicode_literals
+import math
+import mmap
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from six.moves import range
+
+_MASK64 = (1 << 64) - 1
+# odd constant used to spread the bits of hash()
+_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def _compact_ints(values):
+    """
+    return an `array('q')` of `values`, or the list itself if a value doesn't fit in 64 bits (e.g. IPv6)
+    """
+    try:
+        return array('q', values)
+    except OverflowError:
+        return values
+
+
+class IntSet(object):
+    __slots__ = ('values', )
+
+    def __init__(self, values):
+        self.values = _compact_ints(sorted(set(values)))
+
+    def __contains__(self, value):
+        values = self.values
+        i = bisect_left(values, value)
+        return i != len(values) and values[i] == value
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        return self.values[i]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def memory_usage(self):
+        values = self.values
+        if isinstance(values, array):
+            return {'values': values.itemsize * len(values), 'offsets': 0}
+        return {'values': sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values), 'offsets': 0}
+
+
+class BytesSet(object):
+    """
+    `buffer` contains the values sorted and separated by b'\\n', `offsets[i]` is the start of
+    the i-th value and `offsets[-1]` is the end of the buffer plus one.
+    """
+    __slots__ = ('buffer', 'offsets')
+
+    def __init__(self, buffer, offsets):
+        self.buffer = buffer
+        self.offsets = offsets
+
+    @classmethod
+    def from_values(cls, values):
+        values = sorted(set(values))
+        offsets = array('q', [0])
+        position = 0
+        for value in values:
+            position += len(value) + 1
+            offsets.append(position)
+        return cls(b'\n'.join(values) + b'\n' if values else b'', offsets)
+
+    @classmethod
+    def from_sorted_buffer(cls, buffer):
+        """
+        use `buffer` (e.g. a mmap of a file) directly, its lines must be sorted, unique and not empty.
+        raise ValueError otherwise.
+        """
+        offsets = array('q', [0])
+        find = buffer.find
+        size = len(buffer)
+        start = 0
+        previous = None
+        while start < size:
+            end = find(b'\n', start)
+            if end == -1:
+                end = size
+            value = buffer[start:end]
+            if not value or value.endswith(b'\r') or (previous is not None and value <= previous):
+                raise ValueError('line {} is empty, ends with "\\r" or is not greater than '
+                                 'the previous line'.format(len(offsets)))
+            previous = value
+            start = end + 1
+            offsets.append(start)
+        return cls(buffer, offsets)
+
+    def __getitem__(self, i):
+        offsets = self.offsets
+        return self.buffer[offsets[i]:offsets[i + 1] - 1]
+
+    def __contains__(self, value):
+        buffer = self.buffer
+        offsets = self.offsets
+        lo = 0
+        hi = len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            item = buffer[offsets[mid]:offsets[mid + 1] - 1]
+            if item < value:
+                lo = mid + 1
+            elif item > value:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def memory_usage(self):
+        return {'values': len(self.buffer), 'offsets': self.offsets.itemsize * len(self.offsets)}
+
+    def is_mapped(self):
+        return isinstance(self.buffer, mmap.mmap)
+
+
+class BloomFilter(object):
+    """
+    a Bloom filter of hashable values, `bits_per_value` bits are used for every value.
+    positions are derived from `hash()`, so a filter can't be shared between processes.
+    """
+    __slots__ = ('bits', 'size', 'n_hashes')
+
+    def __init__(self, values, count, bits_per_value=10):
+        self.size = max(count * bits_per_value, 8)
+        self.n_hashes = max(1, int(round(bits_per_value * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        bits = self.bits
+        for value in values:
+            for position in self._positions(value):
+                bits[position >> 3] |= 1 << (position & 7)
+
+    def _positions(self, value):
+        h = (hash(value) * _MULTIPLIER) & _MASK64
+        h1 = h & 0xffffffff
+        h2 = (h >> 32) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.n_hashes)]
+
+    def __contains__(self, value):
+        bits = self.bits
+        for position in self._positions(value):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def memory_usage(self):
+        return len(self.bits)
+
+
+class IntervalSet(object):
+    """
+    a set of closed intervals `[start, end]` of integers.
+    overlapping and adjacent intervals are merged, so `starts` and `ends` are sorted
+    and a lookup is a single bisect.
+    """
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, intervals):
+        starts = []
+        ends = []
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1] + 1:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        self.starts = _compact_ints(starts)
+        self.ends = _compact_ints(ends)
+
+    def covers(self, start, end):
+        """
+        whether `[start, end]` is inside the set
+        """
+        i = bisect_right(self.starts, start) - 1
+        return i >= 0 and end <= self.ends[i]
+
+    def overlaps(self, start, end):
+        """
+        whether `[start, end]` and the set have a common integer
+        """
+        i = bisect_right(self.starts, end) - 1
+        return i >= 0 and start <= self.ends[i]
+
+    def __contains__(self, value):
+        return self.covers(value, value)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Generate a specialized `_validate_fields` function for a Validator class.
+
+The generated function inlines the checks of the common built-in fields
+(isinstance, length and range comparisons, enum membership) and the
+required/default handling, so a valid value never goes through
+`BaseField.validate` -> `_validate` -> `_validate_type`.
+
+Whenever an inlined check fails, the generated code falls back to
+`field._check_value(value)`, which converts the value (non-strict fields) or
+returns the same `FieldValidationError` as the interpreted path.
+"""
+from __future__ import unicode_literals
+import os
+import linecache
+import six
+from . import exceptions
+from .fields import (BaseField, EMPTY_VALUE, StringField, NumberField, IntegerField,
+                     FloatField, BoolField, EnumField)
+
+ENV_COMPILED = 'PYTHON_VALIDATOR_COMPILED'
+
+# default value of `Validator.COMPILED`, set PYTHON_VALIDATOR_COMPILED=1 to compile every Validator
+DEFAULT_COMPILED = os.environ.get(ENV_COMPILED, '0') not in ('', '0')
+
+
+def _const_literal(value):
+    """
+    return a source literal for simple constants, or None
+    """
+    if isinstance(value, bool) or value is None:
+        return repr(value)
+    if isinstance(value, six.integer_types):
+        return repr(int(value))
+    if isinstance(value, float) and value == value and value not in (float('inf'), float('-inf')):
+        return repr(value)
+    return None
+
+
+class _Emitter(object):
+    """
+    collect source lines and the namespace of a generated function
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.namespace = {
+            'EMPTY_VALUE': EMPTY_VALUE,
+            'FieldValidationError': exceptions.FieldValidationError,
+            'FieldRequiredError': exceptions.FieldRequiredError,
+            'text_type': six.text_type,
+        }
+        self._counter = 0
+
+    def emit(self, indent, line):
+        self.lines.append('    ' * indent + line)
+
+    def ref(self, prefix, value):
+        """
+        put `value` into the namespace and return its name
+        """
+        self._counter += 1
+        name = '{0}{1}'.format(prefix, self._counter)
+        self.namespace[name] = value
+        return name
+
+    def const(self, prefix, value):
+        literal = _const_literal(value)
+        if literal is not None:
+            return literal
+        return self.ref(prefix, value)
+
+
+def _string_predicate(em, field, value):
+    conds = ['isinstance({0}, {1})'.format(value, em.ref('T', field.INTERNAL_TYPE))]
+    if field.min_length:
+        conds.append('len({0}) >= {1}'.format(value, em.const('c', field.min_length)))
+    if field.max_length:
+        conds.append('len({0}) <= {1}'.format(value, em.const('c', field.max_length)))
+    if field.regex is not None:
+        conds.append('{0}({1}) is not None'.format(em.ref('rx', field.regex.match), value))
+    return conds
+
+
+def _number_predicate(em, field, value):
+    conds = ['isinstance({0}, {1})'.format(value, em.ref('T', field.INTERNAL_TYPE))]
+    if field.min_value is not None:
+        conds.append('{0} >= {1}'.format(value, em.const('c', field.min_value)))
+    if field.max_value is not None:
+        conds.append('{0} <= {1}'.format(value, em.const('c', field.max_value)))
+    return conds
+
+
+def _bool_predicate(em, field, value):
+    return ['isinstance({0}, bool)'.format(value)]
+
+
+# values of these types are hashable, they can be looked up in the index of EnumField
+HASHABLE_TYPES = frozenset(six.string_types + six.integer_types + (six.binary_type, float, bool))
+
+
+def _enum_predicate(em, field, value):
+    return [
+        'type({0}) in {1}'.format(value, em.ref('H', HASHABLE_TYPES)),
+        '{0} in {1}'.format(value, em.ref('choices', field._index)),
+    ]
+
+
+def _base_predicate(em, field, value):
+    return []
+
+
+# field class -> function returning the conditions of a valid value
+PREDICATES = {
+    BaseField: _base_predicate,
+    StringField: _string_predicate,
+    NumberField: _number_predicate,
+    IntegerField: _number_predicate,
+    FloatField: _number_predicate,
+    BoolField: _bool_predicate,
+    EnumField: _enum_predicate,
+}
+
+
+def _emit_field_body(em, indent, name, field, hook):
+    """
+    emit the code validating `value`, a failure is left in `error`
+    """
+    predicate = PREDICATES.get(type(field))
+    check = em.ref('check', field._check_value)
+    if predicate is None:
+        em.emit(indent, 'value, error = {0}(value)'.format(check))
+    else:
+        conds = predicate(em, field, 'value')
+        validators = [em.ref('v', v) for v in field.validators]
+        if conds and validators:
+            em.emit(indent, 'if {0}:'.format(' and '.join(conds)))
+            for v in validators:
+                em.emit(indent + 1, '{0}(value)'.format(v))
+            em.emit(indent, 'else:')
+            em.emit(indent + 1, 'value, error = {0}(value)'.format(check))
+        elif conds:
+            em.emit(indent, 'if not ({0}):'.format(' and '.join(conds)))
+            em.emit(indent + 1, 'value, error = {0}(value)'.format(check))
+        else:
+            for v in validators:
+                em.emit(indent, '{0}(value)'.format(v))
+
+    em.emit(indent, 'if error is None:')
+    if type(field) is StringField:
+        em.emit(indent + 1, 'value = text_type(value)')
+    elif type(field).to_internal != BaseField.to_internal:
+        em.emit(indent + 1, 'value = {0}(value)'.format(em.ref('to_internal', field.to_internal)))
+    if hook is not None:
+        em.emit(indent + 1, '{0}(self, value)'.format(em.ref('hook', hook)))
+    em.emit(indent + 1, 'data[{0}] = value'.format(name))
+
+
+def _emit_validate_block(em, indent, name, field, hook, required):
+    em.emit(indent, 'if value is EMPTY_VALUE:')
+    _emit_missing_block(em, indent + 1, name, required, EMPTY_VALUE)
+    em.emit(indent, 'elif value is None:')
+    em.emit(indent + 1, 'data[{0}] = None'.format(name))
+    em.emit(indent, 'else:')
+    em.emit(indent + 1, 'error = None')
+    em.emit(indent + 1, 'try:')
+    _emit_field_body(em, indent + 2, name, field, hook)
+    em.emit(indent + 1, 'except FieldValidationError as e:')
+    em.emit(indent + 2, 'error = e')
+    em.emit(indent + 1, 'if error is not None:')
+    em.emit(indent + 2, 'if errors is None:')
+    em.emit(indent + 3, 'errors = {}')
+    em.emit(indent + 2, 'errors[{0}] = error'.format(name))
+    em.emit(indent + 2, 'if fail_fast:')
+    em.emit(indent + 3, 'return data, errors')
+
+
+def _emit_missing_block(em, indent, name, required, default):
+    """
+    emit the code for a missing value whose default is EMPTY_VALUE or None
+    """
+    if default is None:
+        em.emit(indent, 'data[{0}] = None'.format(name))
+    elif required:
+        em.emit(indent, 'if errors is None:')
+        em.emit(indent + 1, 'errors = {}')
+        em.emit(indent, 'errors[{0}] = FieldRequiredError()'.format(name))
+        em.emit(indent, 'if fail_fast:')
+        em.emit(indent + 1, 'return data, errors')
+    else:
+        em.emit(indent, 'pass')
+
+
+def generate_fields_validator(clazz):
+    """
+    return (source, namespace) of the `_validate_fields` function of `clazz`
+    """
+    em = _Emitter()
+    em.emit(0, 'def _validate_fields(self, raw_data, fail_fast=False):')
+    em.emit(1, 'data = {}')
+    em.emit(1, 'errors = None')
+    for name, validate, to_internal, hook, default, default_factory, required in clazz._FIELDS_PLAN:
+        field = clazz._FIELDS_MAP[name]
+        name_ref = em.ref('name', name)
+        em.emit(1, '# {0!r}: {1}'.format(name, type(field).__name__))
+        em.emit(1, 'if {0} in raw_data:'.format(name_ref))
+        em.emit(2, 'value = raw_data[{0}]'.format(name_ref))
+        _emit_validate_block(em, 2, name_ref, field, hook, required)
+        em.emit(1, 'else:')
+        if default_factory is not None:
+            em.emit(2, 'value = {0}()'.format(em.ref('default_factory', default_factory)))
+            _emit_validate_block(em, 2, name_ref, field, hook, required)
+        elif default is EMPTY_VALUE or default is None:
+            _emit_missing_block(em, 2, name_ref, required, default)
+        else:
+            em.emit(2, 'value = {0}'.format(em.const('default', default)))
+            _emit_validate_block(em, 2, name_ref, field, hook, required)
+    em.emit(1, 'return data, errors')
+    return '\n'.join(em.lines) + '\n', em.namespace
+
+
+def compile_fields_validator(clazz):
+    """
+    compile the `_validate_fields` function of `clazz`
+    """
+    source, namespace = generate_fields_validator(clazz)
+    filename = '<validator-compiled {0}.{1}>'.format(clazz.__module__, clazz.__name__)
+    code = compile(source, filename, 'exec')
+    # make tracebacks of the generated code readable
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    six.exec_(code, namespace)
+    func = namespace['_validate_fields']
+    func.__source__ = source
+    return func
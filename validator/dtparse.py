@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Fast parsers of datetime strings for DatetimeField and DateField.
+
+`datetime.strptime` is slow, it matches a regular expression built from the format and
+converts every directive in python. For formats made of fixed-width numeric directives
+(`%Y %m %d %H %M %S %f`) and literal text, such as the default `'%Y/%m/%d %H:%M:%S'`,
+a parser slicing the string at precomputed positions is generated, ISO 8601 formats are parsed
+by `datetime.fromisoformat` when it is available.
+
+a parser returns None if it can't parse the value, the caller should call `strptime` then,
+so the errors are the errors of `strptime`. A parser never accepts a value which `strptime`
+rejects, and returns the same datetime as `strptime`.
+"""
+from __future__ import unicode_literals
+import datetime
+import six
+from .utils import LRUCache
+
+_ASCII_DIGITS = frozenset('0123456789')
+
+# directive -> (position in datetime arguments, width)
+_DIRECTIVES = {
+    'Y': (0, 4),
+    'm': (1, 2),
+    'd': (2, 2),
+    'H': (3, 2),
+    'M': (4, 2),
+    'S': (5, 2),
+    'f': (6, 6),
+}
+
+# default values of `strptime`: 1900-01-01 00:00:00
+_DEFAULTS = (1900, 1, 1, 0, 0, 0, 0)
+
+# formats whose values are parsed by `datetime.fromisoformat` after their shape is checked
+ISO_FORMATS = frozenset([
+    '%Y-%m-%d',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S.%f',
+])
+
+_PARSERS = LRUCache(maxsize=128)
+
+
+def _scan(dt_format):
+    """
+    return (length, fields, literals) of a fixed-width format, or None if it is not supported.
+    fields: a list of (start, end, argument index)
+    literals: a list of (start, end, text)
+    """
+    fields = []
+    literals = []
+    seen = set()
+    position = 0
+    i = 0
+    while i < len(dt_format):
+        char = dt_format[i]
+        if char == '%':
+            directive = dt_format[i + 1:i + 2]
+            if directive == '%':
+                literals.append((position, position + 1, '%'))
+                position += 1
+                i += 2
+                continue
+            elif directive in _DIRECTIVES and directive not in seen:
+                seen.add(directive)
+                index, width = _DIRECTIVES[directive]
+                fields.append((position, position + width, index))
+                position += width
+            else:
+                return None
+            i += 2
+        else:
+            if literals and literals[-1][1] == position:
+                # merge with the previous literal
+                start, _, text = literals.pop()
+                literals.append((start, position + 1, text + char))
+            else:
+                literals.append((position, position + 1, char))
+            position += 1
+            i += 1
+    return position, tuple(fields), tuple(literals)
+
+
+# `int()` accepts signs, spaces, underscores and non-ascii digits, only ascii digits are allowed
+_HAS_ISASCII = hasattr(str, 'isascii')
+
+
+def _generate_source(length, fields, literals, iso):
+    """
+    return the source of `parse(value)`, the checks are unrolled since a parser is called
+    for every value.
+    """
+    checks = ['len(value) != {0}'.format(length)]
+    for start, end, text in literals:
+        checks.append('value[{0}:{1}] != {2!r}'.format(start, end, text))
+    if _HAS_ISASCII:
+        checks.append('not value.isascii()')
+    lines = [
+        'def parse(value):',
+        '    if {0}:'.format(' or '.join(checks)),
+        '        return None',
+    ]
+    digits = []
+    for start, end, index in fields:
+        lines.append('    v{0} = value[{1}:{2}]'.format(index, start, end))
+        if _HAS_ISASCII:
+            digits.append('v{0}.isdigit()'.format(index))
+        else:
+            digits.append('_ASCII_DIGITS.issuperset(v{0})'.format(index))
+    if digits:
+        lines.append('    if not ({0}):'.format(' and '.join(digits)))
+        lines.append('        return None')
+    if iso:
+        call = 'fromisoformat(value)'
+    else:
+        indexes = dict((index, 'int(v{0})'.format(index)) for _, _, index in fields)
+        args = [indexes.get(i, repr(default)) for i, default in enumerate(_DEFAULTS)]
+        call = 'datetime({0})'.format(', '.join(args))
+    lines.extend([
+        '    try:',
+        '        return {0}'.format(call),
+        '    except ValueError:',
+        '        return None',
+    ])
+    return '\n'.join(lines) + '\n'
+
+
+def _make_parser(dt_format, length, fields, literals, iso):
+    source = _generate_source(length, fields, literals, iso)
+    namespace = {'_ASCII_DIGITS': _ASCII_DIGITS, 'datetime': datetime.datetime}
+    if iso:
+        namespace['fromisoformat'] = datetime.datetime.fromisoformat
+    code = compile(source, '<dtparse {0!r}>'.format(dt_format), 'exec')
+    six.exec_(code, namespace)
+    parse = namespace['parse']
+    parse.__source__ = source
+    return parse
+
+
+def get_parser(dt_format):
+    """
+    return a function `parse(value) -> datetime or None` for dt_format,
+    or None if dt_format is not supported.
+    """
+    parser = _PARSERS.get(dt_format)
+    if parser is None:
+        # False means dt_format is not supported
+        parser = _build_parser(dt_format) or False
+        _PARSERS.set(dt_format, parser)
+    return parser or None
+
+
+def _build_parser(dt_format):
+    scanned = _scan(dt_format)
+    if scanned is None:
+        return None
+    iso = dt_format in ISO_FORMATS and hasattr(datetime.datetime, 'fromisoformat')
+    return _make_parser(dt_format, *scanned, iso=iso)
@@ -17,24 +17,84 @@ def _flat_error_detail(detail):
         return force_text(detail)
 
 
+# values of these types can't change, they are kept in the params of lazy errors as is
+_IMMUTABLE_TYPES = frozenset(
+    list(six.string_types) + list(six.integer_types) + [six.text_type, six.binary_type, float, bool, type(None)])
+
+
+class _ReprText(six.text_type):
+    """
+    a text whose repr is itself, it keeps the repr of a value for `{!r}` in a message template
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return force_str(self)
+
+
+def text_param(value):
+    """
+    return a param of a lazy error for `{}`: `value` if it is immutable, otherwise its text,
+    so the message doesn't change if value is modified after the error is created.
+    """
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    return force_text(value)
+
+
+def repr_param(value):
+    """
+    like `text_param`, for `{!r}`
+    """
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    return _ReprText(repr(value))
+
+
 class BaseValidationError(Exception):
 
     default_detail = _('Base validation error')
     default_code = _('error')
 
-    def __init__(self, detail=None, code=None):
+    def __init__(self, detail=None, code=None, params=None):
         """
         :param detail: `detail` maybe a string, a dict or a list.
         :param code: error code, it not used for now.
+        :param params: a tuple or a dict. if it is not None, `detail` is a untranslated message template,
+                       it will be translated and formatted with `params` when the detail is read.
+
+        the detail is rendered lazily, the first time `detail` is accessed.
         """
         if detail is None:
             detail = self.default_detail
         if code is None:
             code = self.default_code
 
-        self.detail = _flat_error_detail(detail)
+        self._detail = detail
+        self._rendered = False
+        self.params = params
         self.code = code
 
+    @property
+    def detail(self):
+        if not self._rendered:
+            detail = self._detail
+            params = self.params
+            if params is not None:
+                if isinstance(params, dict):
+                    detail = _(detail).format(**params)
+                else:
+                    detail = _(detail).format(*params)
+            self._detail = _flat_error_detail(detail)
+            self._rendered = True
+        return self._detail
+
+    @detail.setter
+    def detail(self, detail):
+        self._detail = detail
+        self._rendered = True
+        self.params = None
+
     def get_detail(self):
         return self.detail
 
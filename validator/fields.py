@@ -5,15 +5,17 @@ import random
 import string
 import sys
 import uuid
-import re
 import copy
 import datetime
+import ipaddress
+import math
+import mmap
 from collections import OrderedDict
 from six.moves import urllib_parse as urlparse, range
-from IPy import IP, MAX_IPV4_ADDRESS, MAX_IPV6_ADDRESS
 from . import exceptions
-from .utils import force_text
-from .translation import gettext as _
+from .utils import force_text, force_bytes, compile_regex, LRUCache
+from . import compactset, dtparse
+from .translation import gettext as _, gettext_noop as N_
 
 __all__ = [
     # Don't need to add field to here by hand,
@@ -57,11 +59,102 @@ class EmptyValue(object):
 EMPTY_VALUE = EmptyValue()
 
 
+# copy modes of DictField and ListField
+COPY_FUNCTIONS = {
+    'deep': copy.deepcopy,
+    'shallow': copy.copy,
+    'none': None,
+}
+
+
+def _get_copy_function(mode):
+    if mode not in COPY_FUNCTIONS:
+        raise ValueError(_('not supports copy mode: {}').format(mode))
+    return COPY_FUNCTIONS[mode]
+
+
+def _check_type_via_validate_type(self, value):
+    """
+    `_check_type` of the fields which override `_validate_type`
+    """
+    try:
+        return self._validate_type(value), None
+    except exceptions.FieldValidationError as e:
+        return None, e
+
+
+def _is_native_check(clazz):
+    """
+    whether the validation of clazz is implemented by `_check`, i.e. neither `validate` nor `_validate`
+    is overridden by clazz or its bases after `_check`.
+    """
+    for klass in clazz.__mro__:
+        if klass.__name__ == 'BaseField' and klass.__module__ == __name__:
+            return True
+        attrs = vars(klass)
+        if 'validate' in attrs or '_validate' in attrs:
+            return False
+        if '_check' in attrs:
+            return True
+    return True
+
+
+def _make_parse_cache(cache_size):
+    """
+    return the parse cache of a field, or None if `cache_size` is 0
+    """
+    if not cache_size:
+        return None
+    if cache_size < 0:
+        raise ValueError(_('cache_size must be greater than or equal to 0, got {}').format(cache_size))
+    return LRUCache(maxsize=cache_size)
+
+
+def _cached_check(cache, check, value):
+    """
+    memoize `check(value)` of a string value in `cache`, errors are not cached.
+    the validated values are shared by all hits, so they must be immutable.
+    """
+    # the type is part of the key, e.g. u'a' and b'a' are equal in python 2
+    key = (type(value), value)
+    result = cache.get(key)
+    if result is None:
+        result = check(value)
+        if result[1] is None:
+            cache.set(key, result)
+    return result
+
+
+class CachedParseMixin(object):
+    """
+    `cache_info` and `cache_clear` of the fields which have the `cache_size` param.
+    """
+    __slots__ = ()
+
+    def cache_info(self):
+        """
+        return `CacheInfo(hits, misses, maxsize, currsize)` of the parse cache, or None if it is disabled.
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def cache_clear(self):
+        if self._cache is not None:
+            self._cache.clear()
+
+
 class BaseFieldMetaClass(type):
 
     def __new__(cls, name, bases, attrs):
         __all__.append(name)
+        if '_validate_type' in attrs and '_check_type' not in attrs:
+            attrs['_check_type'] = _check_type_via_validate_type
         clazz = super(BaseFieldMetaClass, cls).__new__(cls, name, bases, attrs)
+        clazz._NATIVE_CHECK = _is_native_check(clazz)
+        # compile the class-level pattern once
+        if isinstance(attrs.get('REGEX'), six.string_types):
+            clazz._REGEX_PATTERN = compile_regex(attrs['REGEX'])
         field_name = attrs.get('FIELD_TYPE_NAME')
         if field_name is not None and field_name != 'object':
             FIELDS_NAME_MAP[field_name] = clazz
@@ -87,6 +180,9 @@ class BaseField(object):
         'strict', 'default', 'validators', 'required'
     ]
 
+    # sub-class which does not define __slots__ has a __dict__, so it can have any attributes
+    __slots__ = ('strict', 'default', 'validators', 'required')
+
     def __init__(self, strict=True, default=EMPTY_VALUE, validators=None, required=False, **kwargs):
         """
         :param strict: bool, if strict is True, value must be an instance of INTERVAL_TYPE,
@@ -150,28 +246,66 @@ class BaseField(object):
             v(value)
         return value
 
+    def _check_value(self, value):
+        """
+        like `validate`, but return (validated value, None) or (None, FieldValidationError) instead of
+        raising FieldValidationError. Validator uses this method to validate fields.
+        """
+        if not self._NATIVE_CHECK:
+            try:
+                return self.validate(value), None
+            except exceptions.FieldValidationError as e:
+                return None, e
+        value, error = self._check(value)
+        if error is None and self.validators:
+            try:
+                for v in self.validators:
+                    v(value)
+            except exceptions.FieldValidationError as e:
+                return None, e
+        return value, error
+
     def _validate(self, value):
         """
         return validated value or raise FieldValidationError.
+        sub-class can override this method, or override `_check` to avoid raising exceptions.
+        """
+        value, error = self._check(value)
+        if error is not None:
+            raise error
+        return value
+
+    def _check(self, value):
+        """
+        return (validated value, None) or (None, FieldValidationError).
         sub-class should override this method.
         """
-        return self._validate_type(value)
+        return self._check_type(value)
 
     def _validate_type(self, value):
         """
-        validate the type of value
+        validate the type of value, return validated value or raise FieldValidationError.
+        """
+        value, error = BaseField._check_type(self, value)
+        if error is not None:
+            raise error
+        return value
+
+    def _check_type(self, value):
+        """
+        validate the type of value, return (validated value, None) or (None, FieldValidationError).
         """
         if not isinstance(value, self.INTERNAL_TYPE):
             if self.strict:
-                raise exceptions.FieldValidationError(
-                    _('got a wrong type: {0}, expect {1}').format(type(value).__name__, self.FIELD_TYPE_NAME))
+                return None, exceptions.FieldValidationError(
+                    N_('got a wrong type: {0}, expect {1}'), params=(type(value).__name__, self.FIELD_TYPE_NAME))
             else:
                 try:
                     value = self._convert_type(value)
                 except (ValueError, TypeError) as e:
-                    raise exceptions.FieldValidationError(
-                        _('type convertion({0} -> {1}) is failed: {2}').format(type(value).__name__, self.FIELD_TYPE_NAME, str(e)))
-        return value
+                    return None, exceptions.FieldValidationError(
+                        N_('type convertion({0} -> {1}) is failed: {2}'), params=(type(value).__name__, self.FIELD_TYPE_NAME, force_text(e)))
+        return value, None
 
     def is_required(self):
         return self.required
@@ -244,6 +378,7 @@ class StringField(BaseField):
         INTERNAL_TYPE = str
     FIELD_TYPE_NAME = 'string'
     PARAMS = ['min_length', 'max_length', 'regex']
+    __slots__ = ('min_length', 'max_length', 'regex')
 
     def __init__(self, min_length=0, max_length=None, regex=None, **kwargs):
         if min_length < 0:
@@ -252,27 +387,27 @@ class StringField(BaseField):
         self.min_length = min_length
         self.max_length = max_length
 
-        if isinstance(regex, six.string_types):
-            regex = re.compile(regex)
-        self.regex = regex
+        self.regex = compile_regex(regex)
 
         super(StringField, self).__init__(**kwargs)
 
-    def _validate(self, value):
-        value = self._validate_type(value)
+    def _check(self, value):
+        value, error = self._check_type(value)
+        if error is not None:
+            return None, error
 
         if len(value) < self.min_length:
-            raise exceptions.FieldValidationError(
-                _('string is too short, min-lenght is {}').format(self.min_length))
+            return None, exceptions.FieldValidationError(
+                N_('string is too short, min-lenght is {}'), params=(self.min_length, ))
         if self.max_length and len(value) > self.max_length:
-            raise exceptions.FieldValidationError(
-                _('string is too long, max-lenght is {}').format(self.max_length))
+            return None, exceptions.FieldValidationError(
+                N_('string is too long, max-lenght is {}'), params=(self.max_length, ))
 
         if not self._match(value):
-            raise exceptions.FieldValidationError(
-                _('{0} not match {1}').format(self.regex.pattern, value))
+            return None, exceptions.FieldValidationError(
+                N_('{0} not match {1}'), params=(self.regex.pattern, exceptions.text_param(value)))
 
-        return value
+        return value, None
 
     def _match(self, value):
         if self.regex is None:
@@ -302,6 +437,7 @@ class NumberField(BaseField):
         INTERNAL_TYPE = (int, float)
     FIELD_TYPE_NAME = 'number'
     PARAMS = ['min_value', 'max_value']
+    __slots__ = ('min_value', 'max_value')
 
     def __init__(self, min_value=None, max_value=None, **kwargs):
         self._check_value_range(min_value, max_value)
@@ -310,18 +446,20 @@ class NumberField(BaseField):
 
         super(NumberField, self).__init__(**kwargs)
 
-    def _validate(self, value):
-        value = self._validate_type(value)
+    def _check(self, value):
+        value, error = self._check_type(value)
+        if error is not None:
+            return None, error
 
         if self.min_value is not None and value < self.min_value:
-            raise exceptions.FieldValidationError(
-                _('value is too small, min-value is {}').format(self.min_value))
+            return None, exceptions.FieldValidationError(
+                N_('value is too small, min-value is {}'), params=(self.min_value, ))
 
         if self.max_value is not None and value > self.max_value:
-            raise exceptions.FieldValidationError(
-                _('value is too big, max-value is {}').format(self.max_value))
+            return None, exceptions.FieldValidationError(
+                N_('value is too big, max-value is {}'), params=(self.max_value, ))
 
-        return value
+        return value, None
 
     def mock_data(self):
         min_ = self.min_value
@@ -337,6 +475,7 @@ class IntegerField(NumberField):
     INTERNAL_TYPE = int
     FIELD_TYPE_NAME = 'integer'
     PARAMS = []
+    __slots__ = ()
 
     def mock_data(self):
         d = super(IntegerField, self).mock_data()
@@ -347,21 +486,24 @@ class FloatField(NumberField):
     INTERNAL_TYPE = float
     FIELD_TYPE_NAME = 'float'
     PARAMS = []
+    __slots__ = ()
 
 
 class BoolField(BaseField):
     INTERNAL_TYPE = bool
     FIELD_TYPE_NAME = 'bool'
     PARAMS = []
+    __slots__ = ()
 
     def mock_data(self):
         return random.choice([True, False])
 
 
-class UUIDField(BaseField):
+class UUIDField(CachedParseMixin, BaseField):
     INTERNAL_TYPE = uuid.UUID
     FIELD_TYPE_NAME = 'UUID'
-    PARAMS = ['format']
+    PARAMS = ['format', 'cache_size']
+    __slots__ = ('format', 'cache_size', '_cache')
     SUPPORT_FORMATS = {
         'hex': 'hex',
         'str': '__str__',
@@ -370,20 +512,24 @@ class UUIDField(BaseField):
         'bytes_le': 'bytes_le'
     }
 
-    def __init__(self, format='hex', **kwargs):
+    def __init__(self, format='hex', cache_size=0, **kwargs):
         """
         format: what format used when to_presentation, supports 'hex', 'str', 'int', 'bytes', 'bytes_le'
+        cache_size: if not 0, the UUIDs parsed from strings are memoized by a LRU cache of this size
         """
         if format not in self.SUPPORT_FORMATS:
             raise ValueError(_('not supports format: {}').format(format))
         self.format = format
+        self.cache_size = cache_size
+        self._cache = _make_parse_cache(cache_size)
 
         kwargs.setdefault('strict', False)
         super(UUIDField, self).__init__(**kwargs)
 
-    def _validate(self, value):
-        value = self._validate_type(value)
-        return value
+    def _check(self, value):
+        if self._cache is not None and isinstance(value, six.string_types):
+            return _cached_check(self._cache, self._check_type, value)
+        return self._check_type(value)
 
     def to_presentation(self, value):
         assert isinstance(value, self.INTERNAL_TYPE)
@@ -399,21 +545,22 @@ class UUIDField(BaseField):
 class MD5Field(StringField):
     FIELD_TYPE_NAME = 'md5'
     PARAMS = []
+    __slots__ = ()
     REGEX = r'[\da-fA-F]{32}'
 
     def __init__(self, **kwargs):
         kwargs['strict'] = True
         super(MD5Field, self).__init__(min_length=32,
                                        max_length=32,
-                                       regex=self.REGEX,
+                                       regex=self._REGEX_PATTERN,
                                        **kwargs)
 
-    def _validate(self, value):
-        try:
-            return super(MD5Field, self)._validate(value)
-        except exceptions.FieldValidationError as e:
-            raise exceptions.FieldValidationError(
-                _('Got wrong md5 value: {}').format(value))
+    def _check(self, value):
+        validated_value, error = super(MD5Field, self)._check(value)
+        if error is not None:
+            return None, exceptions.FieldValidationError(
+                N_('Got wrong md5 value: {}'), params=(exceptions.text_param(value), ))
+        return validated_value, None
 
     def mock_data(self):
         return ''.join([random.choice(string.hexdigits) for i in range(32)])
@@ -423,6 +570,7 @@ class SHAField(StringField):
     FIELD_TYPE_NAME = 'sha'
     SUPPORT_VERSION = [1, 224, 256, 384, 512]
     PARAMS = ['version']
+    __slots__ = ('version', 'length')
 
     def __init__(self, version=256, **kwargs):
         if version not in self.SUPPORT_VERSION:
@@ -441,32 +589,74 @@ class SHAField(StringField):
                                        str(length) + '}',
                                        **kwargs)
 
-    def _validate(self, value):
-        try:
-            return super(SHAField, self)._validate(value)
-        except exceptions.FieldValidationError as e:
-            raise exceptions.FieldValidationError(
-                _('Got wrong sha{0} value: {1}').format(self.version, value))
+    def _check(self, value):
+        validated_value, error = super(SHAField, self)._check(value)
+        if error is not None:
+            return None, exceptions.FieldValidationError(
+                N_('Got wrong sha{0} value: {1}'), params=(self.version, exceptions.text_param(value)))
+        return validated_value, None
 
     def mock_data(self):
         return ''.join([random.choice(string.hexdigits) for i in range(self.length)])
 
 
+# a single character class can't backtrack, `search` stops at the first invalid character
+_EMAIL_LOCAL_INVALID = compile_regex(r"[^a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]")
+_EMAIL_DOMAIN_INVALID = compile_regex(r'[^a-zA-Z0-9.-]')
+
+
+def _match_email(value):
+    """
+    linear-time equivalent of `re.match(EmailField.REGEX, value) is not None`.
+
+    the cheapest checks go first, so that an invalid value is usually rejected
+    before all of its characters are scanned, like the regex does.
+    """
+    # `$` also matches before a newline at the end
+    if value.endswith('\n'):
+        value = value[:-1]
+    local, sep, domain = value.partition('@')
+    if not sep or not local or not domain:
+        return False
+    # labels are not empty, don't start or end with '-'
+    if domain[0] in '.-' or domain[-1] in '.-':
+        return False
+    # labels have at most 63 characters, so there are too few dots for a longer domain
+    dots = domain.count('.')
+    if len(domain) - dots > 63 * (dots + 1):
+        return False
+    if _EMAIL_LOCAL_INVALID.search(local) is not None or _EMAIL_DOMAIN_INVALID.search(domain) is not None:
+        return False
+    if '..' in domain or '.-' in domain or '-.' in domain:
+        return False
+    return len(domain) <= 63 or max(map(len, domain.split('.'))) <= 63
+
+
 class EmailField(StringField):
     FIELD_TYPE_NAME = 'email'
     REGEX = r'^[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
     PARAMS = []
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         kwargs['strict'] = True
-        super(EmailField, self).__init__(regex=self.REGEX, **kwargs)
+        super(EmailField, self).__init__(regex=self._REGEX_PATTERN, **kwargs)
 
-    def _validate(self, value):
-        try:
-            return super(EmailField, self)._validate(value)
-        except exceptions.FieldValidationError as e:
-            raise exceptions.FieldValidationError(
-                _('Got wrong email value: {}').format(value))
+    # the regex is faster for short values, its backtracking is bounded by the length
+    REGEX_MAX_LENGTH = 256
+
+    def _match(self, value):
+        # subclasses may override REGEX
+        if self.regex is EmailField._REGEX_PATTERN and len(value) > self.REGEX_MAX_LENGTH:
+            return _match_email(value)
+        return super(EmailField, self)._match(value)
+
+    def _check(self, value):
+        validated_value, error = super(EmailField, self)._check(value)
+        if error is not None:
+            return None, exceptions.FieldValidationError(
+                N_('Got wrong email value: {}'), params=(exceptions.text_param(value), ))
+        return validated_value, None
 
     def mock_data(self):
         name = ''.join(random.sample(string.ascii_lowercase, 5))
@@ -475,35 +665,104 @@ class EmailField(StringField):
         return '{0}@{1}'.format(name, domain)
 
 
-class IPAddressField(BaseField):
-    INTERNAL_TYPE = IP
+MAX_IPV4_ADDRESS = 2 ** 32 - 1
+MAX_IPV6_ADDRESS = 2 ** 128 - 1
+
+_IP_ADDRESS_TYPES = (ipaddress.IPv4Address, ipaddress.IPv6Address)
+
+# `IPy.IP`, set by `_import_ipy`
+_IP = None
+
+
+def _import_ipy():
+    """
+    IPy is only needed by IPAddressField(engine='IPy'), it is imported when such a field is created
+    """
+    global _IP
+    if _IP is None:
+        try:
+            from IPy import IP
+        except ImportError:
+            raise ValueError(_('Cant create IPAddressField instance with engine IPy, '
+                               'please install IPy or use the engine ipaddress'))
+        _IP = IP
+    return _IP
+
+
+class IPAddressField(CachedParseMixin, BaseField):
+    """
+    engine 'IPy' returns `IPy.IP` instances, engine 'ipaddress' returns
+    `ipaddress.IPv4Address` or `ipaddress.IPv6Address` instances, which is several times faster.
+    """
+    # depends on the engine
+    INTERNAL_TYPE = object
     FIELD_TYPE_NAME = 'ip_address'
-    PARAMS = ['version']
+    PARAMS = ['version', 'engine', 'cache_size']
+    __slots__ = ('version', 'engine', 'cache_size', '_cache', '_parse')
     SUPPORT_VERSIONS = ['ipv4', 'ipv6', 'both']
+    SUPPORT_ENGINES = ['IPy', 'ipaddress']
 
-    def __init__(self, version='both', **kwargs):
+    def __init__(self, version='both', engine='IPy', cache_size=0, **kwargs):
+        """
+        engine: 'IPy' or 'ipaddress'.
+        cache_size: if not 0, the addresses parsed from strings are memoized by a LRU cache of this size,
+                    the cached addresses are shared, `IPy.IP` objects must not be modified.
+        """
         if version not in self.SUPPORT_VERSIONS:
             raise ValueError(_('{} version is not supported').format(version))
+        if engine not in self.SUPPORT_ENGINES:
+            raise ValueError(_('{} engine is not supported').format(engine))
+        if engine == 'IPy':
+            _import_ipy()
+            self._parse = self._parse_ipy
+        else:
+            self._parse = self._parse_ipaddress
         self.version = version
+        self.engine = engine
+        self.cache_size = cache_size
+        self._cache = _make_parse_cache(cache_size)
 
         kwargs.setdefault('strict', False)
         super(IPAddressField, self).__init__(**kwargs)
 
-    def _validate(self, value):
+    def _check(self, value):
+        if self._cache is not None and isinstance(value, six.string_types):
+            return _cached_check(self._cache, self._parse, value)
+        return self._parse(value)
+
+    def _check_version(self, value, version, text):
+        if self.version == 'ipv4' and version != 4:
+            return None, exceptions.FieldValidationError(
+                N_('expected an ipv4 address, got {}'), params=(text, ))
+        if self.version == 'ipv6' and version != 6:
+            return None, exceptions.FieldValidationError(
+                N_('expected an ipv6 address, got {}'), params=(text, ))
+        return value, None
+
+    def _parse_ipy(self, value):
         try:
-            value = IP(value)
+            value = _IP(value)
         except ValueError as e:
-            raise exceptions.FieldValidationError(str(e))
-        if self.version == 'ipv4' and value.version() != 4:
-            raise exceptions.FieldValidationError(
-                _('expected an ipv4 address, got {}').format(value.strNormal()))
-        if self.version == 'ipv6' and value.version() != 6:
-            raise exceptions.FieldValidationError(
-                -('expected an ipv6 address, got {}').format(value.strNormal()))
-        return value
+            return None, exceptions.FieldValidationError(force_text(e))
+        return self._check_version(value, value.version(), value.strNormal())
+
+    def _parse_ipaddress(self, value):
+        if not isinstance(value, _IP_ADDRESS_TYPES):
+            if six.PY2 and isinstance(value, str):
+                # the ipaddress backport takes str as packed bytes
+                value = force_text(value)
+            try:
+                value = ipaddress.ip_address(value)
+            except (ValueError, TypeError) as e:
+                return None, exceptions.FieldValidationError(force_text(e))
+        if self.version == 'both':
+            return value, None
+        return self._check_version(value, value.version, value)
 
     def to_presentation(self, value):
-        return value.strNormal()
+        if self.engine == 'IPy':
+            return value.strNormal()
+        return str(value)
 
     def mock_data(self):
         v = self.version
@@ -512,29 +771,126 @@ class IPAddressField(BaseField):
 
         if v == 'ipv4':
             ip = random.randint(0, MAX_IPV4_ADDRESS)
-            return IP(ip)
+            address_class = ipaddress.IPv4Address
         else:
             ip = random.randint(0, MAX_IPV6_ADDRESS)
-            return IP(ip)
+            address_class = ipaddress.IPv6Address
+        if self.engine == 'IPy':
+            return _IP(ip)
+        return address_class(ip)
+
+
+def _parse_networks(networks):
+    """
+    return (normalized CIDR strings, {4: IntervalSet, 6: IntervalSet}) of a list of CIDR networks.
+    host bits are ignored, e.g. '10.0.0.1/8' is '10.0.0.0/8'.
+    """
+    texts = []
+    intervals = {4: [], 6: []}
+    for network in networks:
+        try:
+            network = ipaddress.ip_network(force_text(network), strict=False)
+        except ValueError as e:
+            raise ValueError(_('invalid network {0}: {1}').format(network, e))
+        texts.append(network.with_prefixlen)
+        start = int(network.network_address)
+        intervals[network.version].append((start, start + network.num_addresses - 1))
+    index = dict((version, compactset.IntervalSet(v)) for version, v in intervals.items())
+    return texts, index
+
+
+class IPFilterField(IPAddressField):
+    """
+    the address must be in one of the `allow` networks and must not be in any `deny` network.
+
+    the networks are compiled into sorted interval indexes (see `compactset.IntervalSet`),
+    so a lookup is a bisect whatever the number of networks. IPv4 and IPv6 networks can be mixed.
+    """
+    FIELD_TYPE_NAME = 'ip_filter'
+    PARAMS = ['allow', 'deny']
+    __slots__ = ('allow', 'deny', '_allow', '_deny')
+
+    def __init__(self, allow=None, deny=None, **kwargs):
+        """
+        allow: a list of CIDR networks like '10.0.0.0/8' or '2001:db8::/32', an address is a /32 or /128 network.
+               None allows all addresses which are not denied.
+        deny: a list of CIDR networks, deny takes precedence over allow.
+        """
+        if allow is None:
+            self.allow = None
+            self._allow = None
+        else:
+            self.allow, self._allow = _parse_networks(allow)
+        self.deny, self._deny = _parse_networks(deny or [])
+        super(IPFilterField, self).__init__(**kwargs)
+
+    def _address_range(self, value):
+        """
+        return (version, first, last) of an address, an `IPy.IP` can be a network
+        """
+        if self.engine == 'IPy':
+            first = value.int()
+            return value.version(), first, first + value.len() - 1
+        first = int(value)
+        return value.version, first, first
+
+    def _check(self, value):
+        value, error = super(IPFilterField, self)._check(value)
+        if error is not None:
+            return None, error
+        version, first, last = self._address_range(value)
+        if self._allow is not None and not self._allow[version].covers(first, last):
+            return None, exceptions.FieldValidationError(
+                N_('{} is not in the allowed networks'), params=(self.to_presentation(value), ))
+        if self._deny[version].overlaps(first, last):
+            return None, exceptions.FieldValidationError(
+                N_('{} is in a denied network'), params=(self.to_presentation(value), ))
+        return value, None
+
+    def mock_data(self):
+        intervals = None
+        if self._allow is not None:
+            intervals = [(version, start, end) for version, index in self._allow.items()
+                         if self.version in ('both', 'ipv{}'.format(version))
+                         for start, end in index]
+        if intervals != []:
+            for i in range(100):
+                if intervals is None:
+                    value = super(IPFilterField, self).mock_data()
+                else:
+                    value = self._mock_address(random.choice(intervals))
+                if self._check(value)[1] is None:
+                    return value
+        raise ValueError(_('cant find an allowed address'))
+
+    def _mock_address(self, interval):
+        version, start, end = interval
+        ip = random.randint(start, end)
+        if self.engine == 'IPy':
+            return _IP(ip, ipversion=version)
+        return ipaddress.ip_address(ip) if version == 4 else ipaddress.IPv6Address(ip)
 
 
 class URLField(StringField):
     FIELD_TYPE_NAME = 'url'
     PARAMS = []
+    __slots__ = ()
     SCHEMAS = ('http', 'https')
 
     def __init__(self, **kwargs):
         kwargs['strict'] = True
         super(URLField, self).__init__(min_length=0, **kwargs)
 
-    def _validate(self, value):
-        value = self._validate_type(value)
+    def _check(self, value):
+        value, error = self._check_type(value)
+        if error is not None:
+            return None, error
         url = urlparse.urlparse(value)
         if url.scheme not in self.SCHEMAS:
-            raise exceptions.FieldValidationError(_('schema is lost'))
+            return None, exceptions.FieldValidationError(N_('schema is lost'), params=())
         if url.hostname == '':
-            raise exceptions.FieldValidationError(_('hostname is lost'))
-        return url.geturl()
+            return None, exceptions.FieldValidationError(N_('hostname is lost'), params=())
+        return url.geturl(), None
 
     def mock_data(self):
         return 'http://www.example.com/media/image/demo.jpg'
@@ -544,19 +900,43 @@ class EnumField(BaseField):
     INTERNAL_TYPE = object
     FIELD_TYPE_NAME = 'enum'
     PARAMS = ['choices']
+    __slots__ = ('choices', '_index', '_unhashable')
 
     def __init__(self, choices=None, **kwargs):
+        """
+        choices: a list of valid values, it should not be modified after the field is created.
+        hashable choices are looked up by a frozenset index, unhashable ones by a scan.
+        """
         if choices is None or len(choices) == 0:
             raise ValueError('choices cant be empty or None')
         self.choices = choices
+        index = []
+        unhashable = []
+        for choice in choices:
+            try:
+                hash(choice)
+            except TypeError:
+                unhashable.append(choice)
+            else:
+                index.append(choice)
+        self._index = frozenset(index)
+        self._unhashable = tuple(unhashable)
 
         super(EnumField, self).__init__(**kwargs)
 
-    def _validate(self, value):
-        if value not in self.choices:
-            raise exceptions.FieldValidationError(
-                _('{!r} not in the choices').format(value))
-        return value
+    def _check(self, value):
+        try:
+            found = value in self._index
+        except TypeError:
+            # unhashable value
+            found = value in self.choices
+        else:
+            if not found and self._unhashable:
+                found = value in self._unhashable
+        if not found:
+            return None, exceptions.FieldValidationError(
+                N_('{!r} not in the choices'), params=(exceptions.repr_param(value), ))
+        return value, None
 
     def mock_data(self):
         return random.choice(self.choices)
@@ -565,27 +945,34 @@ class EnumField(BaseField):
 class DictField(BaseField):
     INTERNAL_TYPE = dict
     FIELD_TYPE_NAME = 'dict'
-    PARAMS = ['validator']
+    PARAMS = ['validator', 'copy']
+    __slots__ = ('validator', 'copy', '_copy')
 
-    def __init__(self, validator=None, **kwargs):
+    def __init__(self, validator=None, copy='deep', **kwargs):
         """
         :param validator: Validator object
+        :param copy: how to copy the value when `validator` is None, 'deep', 'shallow' or 'none'.
+                     with 'shallow' or 'none', the validated data shares objects with the raw data.
         """
         self.validator = validator
+        self._copy = _get_copy_function(copy)
+        self.copy = copy
         super(DictField, self).__init__(**kwargs)
 
-    def _validate(self, value):
-        value = self._validate_type(value)
+    def _check(self, value):
+        value, error = self._check_type(value)
+        if error is not None:
+            return None, error
 
         if self.validator:
             v = self.validator(value)
             if v.is_valid():
                 value = v.validated_data
             else:
-                raise exceptions.FieldValidationError(v.errors)
-        else:
-            value = copy.deepcopy(value)
-        return value
+                return None, exceptions.FieldValidationError(v.errors)
+        elif self._copy is not None:
+            value = self._copy(value)
+        return value, None
 
     def to_dict(self):
         d = super(DictField, self).to_dict()
@@ -600,16 +987,91 @@ class DictField(BaseField):
             return {}
 
 
+def _number_items_valid(field, items, types):
+    if not items:
+        return True
+    item_types = set(map(type, items))
+    if not item_types <= types:
+        return False
+    try:
+        # NaN breaks min and max
+        if float in item_types and any(map(math.isnan, items)):
+            return False
+    except OverflowError:
+        return False
+    if field.min_value is not None and min(items) < field.min_value:
+        return False
+    if field.max_value is not None and max(items) > field.max_value:
+        return False
+    return True
+
+
+def _integer_items_valid(field, items):
+    return _number_items_valid(field, items, _INTEGER_TYPES)
+
+
+def _float_items_valid(field, items):
+    return _number_items_valid(field, items, _FLOAT_TYPES)
+
+
+def _any_number_items_valid(field, items):
+    return _number_items_valid(field, items, _INTEGER_TYPES | _FLOAT_TYPES)
+
+
+def _bool_items_valid(field, items):
+    return set(map(type, items)) <= _BOOL_TYPES
+
+
+def _string_items_valid(field, items):
+    if not items:
+        return True
+    if field.regex is not None or not set(map(type, items)) <= _STRING_TYPES:
+        return False
+    if field.min_length and min(map(len, items)) < field.min_length:
+        return False
+    if field.max_length and max(map(len, items)) > field.max_length:
+        return False
+    return True
+
+
+# the exact types of items which the scalar fields return unchanged
+_INTEGER_TYPES = frozenset(six.integer_types + (bool, ))
+_FLOAT_TYPES = frozenset([float])
+_BOOL_TYPES = frozenset([bool])
+_STRING_TYPES = frozenset(StringField.INTERNAL_TYPE if six.PY2 else [StringField.INTERNAL_TYPE])
+
+# field class -> function `items_valid(field, items)` checking all items of a list at once,
+# it returns True only if `field` accepts every item unchanged. see `ListField._check`
+ITEMS_VALID_FUNCTIONS = {
+    IntegerField: _integer_items_valid,
+    FloatField: _float_items_valid,
+    NumberField: _any_number_items_valid,
+    BoolField: _bool_items_valid,
+    StringField: _string_items_valid,
+}
+
+
 class ListField(BaseField):
     INTERNAL_TYPE = (list, tuple)
     FIELD_TYPE_NAME = 'list'
-    PARAMS = ['field', 'min_length', 'max_length']
+    PARAMS = ['field', 'min_length', 'max_length', 'copy']
+    __slots__ = ('field', 'min_length', 'max_length', 'copy', '_copy', '_items_valid')
+    # lists shorter than this are always checked item by item
+    ITEMS_VALID_MIN_LENGTH = 8
 
-    def __init__(self, field=None, min_length=0, max_length=None, **kwargs):
+    def __init__(self, field=None, min_length=0, max_length=None, copy='deep', **kwargs):
+        """
+        :param field: field of the list items
+        :param copy: how to copy the value when `field` is None, 'deep', 'shallow' or 'none'.
+                     with 'shallow' or 'none', the validated data shares objects with the raw data.
+        """
         if field is not None and not isinstance(field, BaseField):
             raise ValueError(
                 _('field param expect a instance of BaseField, but got {!r}').format(field))
         self.field = field
+        self._items_valid = ITEMS_VALID_FUNCTIONS.get(type(field))
+        self._copy = _get_copy_function(copy)
+        self.copy = copy
 
         self._check_value_range(min_length, max_length)
         self.min_length = min_length
@@ -617,25 +1079,38 @@ class ListField(BaseField):
 
         super(ListField, self).__init__(**kwargs)
 
-    def _validate(self, value):
-        value = self._validate_type(value)
+    def _check(self, value):
+        value, error = self._check_type(value)
+        if error is not None:
+            return None, error
+
         if self.min_length is not None and len(value) < self.min_length:
-            raise exceptions.FieldValidationError(
-                _('this list has too few elements, min length is {}').format(self.min_length))
+            return None, exceptions.FieldValidationError(
+                N_('this list has too few elements, min length is {}'), params=(self.min_length, ))
 
         if self.max_length is not None and len(value) > self.max_length:
-            raise exceptions.FieldValidationError(
-                _('this list has too many elements, max length is {}').format(self.max_length))
+            return None, exceptions.FieldValidationError(
+                N_('this list has too many elements, max length is {}'), params=(self.max_length, ))
 
         if self.field:
+            # check all items at once, the item by item loop runs if any item may be invalid,
+            # so the error is the error of the first invalid item, its `index` is the index of the item
+            items_valid = self._items_valid
+            if items_valid is not None and len(value) >= self.ITEMS_VALID_MIN_LENGTH \
+                    and not self.field.validators and items_valid(self.field, value):
+                return list(value), None
+            check_item = self.field._check_value
             new_value = []
-            for item in value:
-                new_item = self.field.validate(item)
+            for index, item in enumerate(value):
+                new_item, error = check_item(item)
+                if error is not None:
+                    error.index = index
+                    return None, error
                 new_value.append(new_item)
             value = new_value
-        else:
-            value = copy.deepcopy(value)
-        return value
+        elif self._copy is not None:
+            value = self._copy(value)
+        return value, None
 
     def to_dict(self):
         d = super(ListField, self).to_dict()
@@ -668,29 +1143,42 @@ class ListField(BaseField):
 class TimestampField(IntegerField):
     FIELD_TYPE_NAME = 'timestamp'
     PARAMS = []
+    __slots__ = ()
 
     def __init__(self, **kwargs):
         super(TimestampField, self).__init__(
             min_value=0, max_value=2 ** 32 - 1, **kwargs)
 
-    def _validate(self, value):
-        try:
-            return super(TimestampField, self)._validate(value)
-        except exceptions.FieldValidationError as e:
-            raise exceptions.FieldValidationError(
-                _('Got wrong timestamp: {}').format(value))
+    def _check(self, value):
+        validated_value, error = super(TimestampField, self)._check(value)
+        if error is not None:
+            return None, exceptions.FieldValidationError(
+                N_('Got wrong timestamp: {}'), params=(exceptions.text_param(value), ))
+        return validated_value, None
+
 
+# TimestampField accepts the same values as IntegerField(min_value=0, max_value=2 ** 32 - 1)
+ITEMS_VALID_FUNCTIONS[TimestampField] = _integer_items_valid
 
-class DatetimeField(BaseField):
+
+class DatetimeField(CachedParseMixin, BaseField):
     INTERNAL_TYPE = datetime.datetime
     FIELD_TYPE_NAME = 'datetime'
-    PARAMS = ['dt_format', 'tzinfo']
+    PARAMS = ['dt_format', 'tzinfo', 'cache_size']
+    __slots__ = ('dt_format', 'tzinfo', 'cache_size', '_parse', '_cache')
     DEFAULT_FORMAT = '%Y/%m/%d %H:%M:%S'
 
-    def __init__(self, dt_format=None, tzinfo=None, **kwargs):
+    def __init__(self, dt_format=None, tzinfo=None, cache_size=0, **kwargs):
+        """
+        cache_size: if not 0, the datetimes parsed from strings are memoized by a LRU cache of this size
+        """
         if dt_format is None:
             dt_format = self.DEFAULT_FORMAT
         self.dt_format = dt_format
+        self.cache_size = cache_size
+        self._cache = _make_parse_cache(cache_size)
+        # fast parser of dt_format, see `validator.dtparse`
+        self._parse = dtparse.get_parser(dt_format) if self.INTERNAL_TYPE is datetime.datetime else None
         if isinstance(tzinfo, six.string_types):
             try:
                 import pytz
@@ -709,7 +1197,11 @@ class DatetimeField(BaseField):
                 value = int(value)
                 return self.INTERNAL_TYPE.fromtimestamp(value, tz=self.tzinfo)
             else:
-                dt = self.INTERNAL_TYPE.strptime(value, self.dt_format)
+                dt = None
+                if self._parse is not None:
+                    dt = self._parse(value)
+                if dt is None:
+                    dt = self.INTERNAL_TYPE.strptime(value, self.dt_format)
                 if self.tzinfo:
                     dt = dt.replace(tzinfo=self.tzinfo)
                 return dt
@@ -718,9 +1210,17 @@ class DatetimeField(BaseField):
         else:
             raise ValueError(_('Got wrong datetime value: {}').format(value))
 
-    def _validate(self, value):
-        value = self._validate_type(value)
-        return copy.copy(value)
+    def _check(self, value):
+        if isinstance(value, six.string_types):
+            # a new object is parsed from a string, it needs no copy.
+            # dates and datetimes are immutable, so a cached one can be shared
+            if self._cache is not None:
+                return _cached_check(self._cache, self._check_type, value)
+            return self._check_type(value)
+        value, error = self._check_type(value)
+        if error is not None:
+            return None, error
+        return copy.copy(value), None
 
     def to_presentation(self, value):
         return value.strftime(self.dt_format)
@@ -735,16 +1235,24 @@ class DatetimeField(BaseField):
         return self.INTERNAL_TYPE.fromtimestamp(random.randint(0, 2 ** 32 - 1))
 
 
-class DateField(BaseField):
+class DateField(CachedParseMixin, BaseField):
     INTERNAL_TYPE = datetime.date
     FIELD_TYPE_NAME = 'date'
-    PARAMS = ['dt_format']
+    PARAMS = ['dt_format', 'cache_size']
+    __slots__ = ('dt_format', 'cache_size', '_parse', '_cache')
     DEFAULT_FORMAT = '%Y/%m/%d'
 
-    def __init__(self, dt_format=None, **kwargs):
+    def __init__(self, dt_format=None, cache_size=0, **kwargs):
+        """
+        cache_size: if not 0, the dates parsed from strings are memoized by a LRU cache of this size
+        """
         if dt_format is None:
             dt_format = self.DEFAULT_FORMAT
         self.dt_format = dt_format
+        self.cache_size = cache_size
+        self._cache = _make_parse_cache(cache_size)
+        # fast parser of dt_format, see `validator.dtparse`
+        self._parse = dtparse.get_parser(dt_format)
         kwargs.setdefault('strict', False)
         super(DateField, self).__init__(**kwargs)
 
@@ -755,19 +1263,134 @@ class DateField(BaseField):
                 value = int(value)
                 return self.INTERNAL_TYPE.fromtimestamp(value)
             else:
-                dt = datetime.datetime.strptime(value, self.dt_format)
+                dt = None
+                if self._parse is not None:
+                    dt = self._parse(value)
+                if dt is None:
+                    dt = datetime.datetime.strptime(value, self.dt_format)
                 return dt.date()
         elif isinstance(value, six.integer_types):
             return self.INTERNAL_TYPE.fromtimestamp(value)
         else:
             raise ValueError()
 
-    def _validate(self, value):
-        value = self._validate_type(value)
-        return copy.copy(value)
+    def _check(self, value):
+        if isinstance(value, six.string_types):
+            # a new object is parsed from a string, it needs no copy.
+            # dates and datetimes are immutable, so a cached one can be shared
+            if self._cache is not None:
+                return _cached_check(self._cache, self._check_type, value)
+            return self._check_type(value)
+        value, error = self._check_type(value)
+        if error is not None:
+            return None, error
+        return copy.copy(value), None
 
     def to_presentation(self, value):
         return value.strftime(self.dt_format)
 
     def mock_data(self):
         return self.INTERNAL_TYPE.fromtimestamp(random.randint(0, 2 ** 32 - 1))
+
+
+class MembershipField(BaseField):
+    """
+    the value must be a member of a huge allowlist, e.g. millions of IDs.
+
+    the allowlist is kept in a compact structure instead of a list of python objects,
+    see `validator.compactset`. `to_dict` returns the `source` of the allowlist instead of its values.
+    """
+    INTERNAL_TYPE = object
+    FIELD_TYPE_NAME = 'membership'
+    PARAMS = ['source', 'value_type', 'use_mmap', 'bloom_bits']
+    __slots__ = ('source', 'value_type', 'use_mmap', 'bloom_bits', '_values', '_bloom')
+    VALUE_TYPES = ('str', 'int')
+
+    def __init__(self, source=None, value_type='str', use_mmap=False, bloom_bits=0, values=None, **kwargs):
+        """
+        source: path of a text file, one value per line, empty lines are ignored.
+        value_type: 'str' or 'int'.
+        use_mmap: map the file into memory instead of loading it, only for 'str' values,
+                  the lines of the file must be sorted (as utf-8 bytes), unique and not empty.
+        bloom_bits: if not 0, a Bloom filter of `bloom_bits` bits per value rejects
+                    most absent values before searching the allowlist.
+        values: an iterable of values, used instead of `source`. the field can't be
+                recreated by `create_field(field.to_dict())` in this case.
+        """
+        if value_type not in self.VALUE_TYPES:
+            raise ValueError(_('not supports value type: {}').format(value_type))
+        if (source is None) == (values is None):
+            raise ValueError(_('one of source and values is required'))
+        if use_mmap and (value_type != 'str' or source is None):
+            raise ValueError(_('use_mmap is only supported by a source of str values'))
+        self.source = source
+        self.value_type = value_type
+        self.use_mmap = use_mmap
+        self.bloom_bits = bloom_bits
+
+        if source is not None:
+            self._values = self._load(source)
+        elif value_type == 'int':
+            self._values = compactset.IntSet(values)
+        else:
+            self._values = compactset.BytesSet.from_values(force_bytes(v) for v in values)
+
+        self._bloom = None
+        if bloom_bits:
+            self._bloom = compactset.BloomFilter(self._values, len(self._values), bloom_bits)
+
+        kwargs.setdefault('strict', True)
+        super(MembershipField, self).__init__(**kwargs)
+
+    def _load(self, source):
+        if self.value_type == 'int':
+            with open(source, 'rb') as f:
+                return compactset.IntSet(int(line) for line in f if line.strip())
+        if self.use_mmap:
+            with open(source, 'rb') as f:
+                if not f.seek(0, 2):
+                    return compactset.BytesSet.from_values([])
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return compactset.BytesSet.from_sorted_buffer(buffer)
+        with open(source, 'rb') as f:
+            return compactset.BytesSet.from_values(
+                line.rstrip(b'\r\n') for line in f if line.rstrip(b'\r\n'))
+
+    def _check(self, value):
+        if self.value_type == 'int':
+            if not isinstance(value, six.integer_types) or isinstance(value, bool):
+                return None, exceptions.FieldValidationError(
+                    N_('got a wrong type: {0}, expect {1}'), params=(type(value).__name__, 'int'))
+            key = value
+        else:
+            if not isinstance(value, six.string_types):
+                return None, exceptions.FieldValidationError(
+                    N_('got a wrong type: {0}, expect {1}'), params=(type(value).__name__, 'str'))
+            try:
+                key = force_bytes(value)
+            except UnicodeError:
+                key = None
+        if key is None or (self._bloom is not None and key not in self._bloom) or key not in self._values:
+            return None, exceptions.FieldValidationError(N_('{!r} is not an allowed value'), params=(exceptions.repr_param(value), ))
+        return value, None
+
+    def memory_usage(self):
+        """
+        return the bytes used by the allowlist: {'values', 'offsets', 'bloom', 'total', 'mapped', 'count'},
+        'mapped' is True if 'values' is a memory-mapped file rather than memory of this process,
+        'count' is the number of values.
+        """
+        usage = self._values.memory_usage()
+        usage['bloom'] = self._bloom.memory_usage() if self._bloom is not None else 0
+        usage['total'] = usage['values'] + usage['offsets'] + usage['bloom']
+        usage['mapped'] = bool(self.use_mmap)
+        usage['count'] = len(self._values)
+        return usage
+
+    def mock_data(self):
+        if not len(self._values):
+            raise ValueError(_('the allowlist is empty'))
+        value = self._values[random.randrange(len(self._values))]
+        if self.value_type == 'str':
+            value = force_text(value)
+        return value
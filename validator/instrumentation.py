@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Per-field instrumentation: call counts, failure counts and cumulative time of every field.
+
+instrumentation is enabled per Validator class by `Validator.enable_instrumentation`,
+which replaces the `_validate_fields` of the class by `instrumented_validate_fields`.
+the regular (interpreted or compiled) function is put back by `disable_instrumentation`,
+so a class without instrumentation doesn't pay anything for it.
+"""
+from __future__ import unicode_literals
+import time
+import threading
+from . import exceptions
+from .fields import EMPTY_VALUE
+
+try:
+    perf_counter_ns = time.perf_counter_ns
+except AttributeError:
+    def perf_counter_ns():
+        return int(time.perf_counter() * 1e9)
+
+
+class Instrumentation(object):
+    """
+    statistics of a Validator class.
+
+    `stats` maps field name to a list [calls, failures, time_ns].
+    `callback` is called as `callback(name, elapsed_ns, error)` after every field,
+    `error` is None if the field is valid.
+    `validate_fields` is the `_validate_fields` to restore when instrumentation is disabled.
+    `lock` guards `stats`, the class may be validated by several threads at the same time.
+    """
+    __slots__ = ('stats', 'callback', 'validate_fields', 'lock')
+
+    def __init__(self, names, callback, validate_fields):
+        self.stats = dict((name, [0, 0, 0]) for name in names)
+        self.callback = callback
+        self.validate_fields = validate_fields
+        self.lock = threading.Lock()
+
+    def reset(self):
+        with self.lock:
+            for field_stats in self.stats.values():
+                field_stats[:] = [0, 0, 0]
+
+    def snapshot(self):
+        with self.lock:
+            return dict(
+                (name, {'calls': calls, 'failures': failures, 'time_ns': time_ns})
+                for name, (calls, failures, time_ns) in self.stats.items()
+            )
+
+
+def instrumented_validate_fields(self, raw_data, fail_fast=False):
+    """
+    same as `Validator._interpreted_validate_fields`, record the statistics of every field.
+    """
+    instrumentation = self._INSTRUMENTATION
+    stats = instrumentation.stats
+    callback = instrumentation.callback
+    lock = instrumentation.lock
+    data = {}
+    errors = None
+    for name, check, to_internal, hook, default, default_factory, required in self._FIELDS_PLAN:
+        start = perf_counter_ns()
+        error = None
+        if name in raw_data:
+            value = raw_data[name]
+        elif default_factory is None:
+            value = default
+        else:
+            value = default_factory()
+
+        if value is EMPTY_VALUE:
+            if required:
+                error = exceptions.FieldRequiredError()
+        elif value is None:
+            data[name] = None
+        else:
+            value, error = check(value)
+            if error is None:
+                try:
+                    value = to_internal(value)
+                    if hook is not None:
+                        hook(self, value)
+                    data[name] = value
+                except exceptions.FieldValidationError as e:
+                    error = e
+
+        elapsed = perf_counter_ns() - start
+        field_stats = stats[name]
+        with lock:
+            field_stats[0] += 1
+            field_stats[2] += elapsed
+            if error is not None:
+                field_stats[1] += 1
+        if callback is not None:
+            callback(name, elapsed, error)
+        if error is not None:
+            if errors is None:
+                errors = {}
+            errors[name] = error
+            if fail_fast:
+                return data, errors
+    return data, errors
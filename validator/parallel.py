@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Validate a large batch of records in a process pool.
+"""
+from __future__ import unicode_literals
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from .fields import DictField, ListField
+from .validator import Validator, BatchResult, create_validator, _find_class_attr
+
+# the Validator class of a worker process, set by `_init_worker`
+_worker_validator = None
+
+
+def _nested_validators(field):
+    """
+    yield the Validator classes of DictField, also inside ListField
+    """
+    while isinstance(field, ListField):
+        field = field.field
+    if isinstance(field, DictField) and field.validator is not None:
+        yield field.validator
+
+
+def _is_plain_dict_validator(validator_class):
+    """
+    whether validator_class and the Validator classes of its DictFields are created by
+    `create_validator` and have no `validate_<name>` hooks or custom `validate`,
+    so `to_dict()` describes them completely.
+    """
+    if not vars(validator_class).get('_FROM_DICT'):
+        return False
+    if _find_class_attr(validator_class, 'validate') is not vars(Validator)['validate']:
+        return False
+    if any(item[3] is not None for item in validator_class._FIELDS_PLAN):
+        return False
+    for field in validator_class._FIELDS_MAP.values():
+        for nested in _nested_validators(field):
+            if not _is_plain_dict_validator(nested):
+                return False
+    return True
+
+
+def _validator_spec(validator_class):
+    """
+    return a picklable spec to rebuild `validator_class` in worker processes.
+
+    a class which can be imported is pickled by reference, so hooks and `validate` are kept,
+    a plain class created by `create_validator` is rebuilt from `to_dict()`.
+    raise ValueError for other classes, e.g. a class defined in a function, or a class created by
+    `create_validator` whose DictField uses a Validator class with hooks.
+    """
+    try:
+        pickle.loads(pickle.dumps(validator_class))
+        return ('class', validator_class)
+    except (pickle.PicklingError, AttributeError, TypeError, ImportError):
+        if not _is_plain_dict_validator(validator_class):
+            raise ValueError(
+                '{} cant be pickled, it must be importable at module level to be used '
+                'by worker processes'.format(validator_class.__name__))
+        return ('dict', validator_class.to_dict(), validator_class.__name__, validator_class.COMPILED)
+
+
+def _build_validator(spec):
+    if spec[0] == 'class':
+        return spec[1]
+    _, data_struct_dict, name, compiled = spec
+    return create_validator(data_struct_dict, name=name, compiled=compiled)
+
+
+def _init_worker(spec):
+    global _worker_validator
+    _worker_validator = _build_validator(spec)
+
+
+def _validate_chunk(chunk, fail_fast):
+    return _worker_validator.validate_many(chunk, fail_fast)
+
+
+def _iter_chunks(records, chunksize):
+    chunk = []
+    for raw_data in records:
+        chunk.append(raw_data)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_parallel(validator_class, records, chunksize=1000, max_workers=None, fail_fast=False):
+    """
+    validate `records` in a process pool, return a `BatchResult` like `Validator.validate_many`.
+
+    `records` are split into chunks of `chunksize` records, the results of the chunks are
+    merged in input order. The Validator class is rebuilt once per worker process.
+    `records` is consumed lazily, at most two chunks per worker are read ahead.
+
+    :param validator_class: a Validator class
+    :param records: an iterable of raw data
+    :param chunksize: number of records sent to a worker at a time
+    :param max_workers: number of worker processes, defaults to the number of CPUs
+    :param fail_fast: see `Validator.validate_many`
+    """
+    if chunksize < 1:
+        raise ValueError('chunksize must be greater than 0')
+    spec = _validator_spec(validator_class)
+    validated_data = []
+    errors = {}
+    offset = 0
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # futures of the submitted chunks in input order
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(spec, )) as executor:
+        for chunk in _iter_chunks(records, chunksize):
+            pending.append(executor.submit(_validate_chunk, chunk, fail_fast))
+            if len(pending) >= max_workers * 2:
+                offset = _merge(pending.popleft().result(), offset, validated_data, errors)
+        while pending:
+            offset = _merge(pending.popleft().result(), offset, validated_data, errors)
+    return BatchResult(validated_data, errors)
+
+
+def _merge(result, offset, validated_data, errors):
+    """
+    add the BatchResult of the chunk starting at `offset`, return the offset of the next chunk
+    """
+    validated_data.extend(result.validated_data)
+    for i, data_errors in sorted(result.errors.items()):
+        errors[offset + i] = data_errors
+    # every record of a chunk is either valid or invalid
+    return offset + len(result.validated_data) + len(result.errors)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Validate newline-delimited JSON (NDJSON) lazily.
+"""
+from __future__ import unicode_literals
+import io
+import json
+import six
+from . import exceptions
+from .translation import gettext as _
+
+
+def _open(file, mode, encoding):
+    """
+    return (file object, should_close)
+    """
+    if isinstance(file, six.string_types):
+        return io.open(file, mode, encoding=encoding), True
+    return file, False
+
+
+def validate_ndjson(validator_class, file, skip_invalid=False, rejects=None, max_errors=None, encoding='utf-8',
+                    fail_fast=False):
+    """
+    validate every line of a NDJSON file with `validator_class`.
+
+    this is a generator, it yields `(line_no, result)` one line at a time, `line_no` starts from 1,
+    `result` is the validated data, or a `ValidationError` whose detail is the errors of the line.
+    blank lines are ignored.
+
+    :param validator_class: a Validator class
+    :param file: a path or a file object opened in text or binary mode
+    :param skip_invalid: if True, invalid lines are not yielded
+    :param rejects: a path or a file object opened in text mode, invalid lines are written to it
+    :param max_errors: stop after `max_errors` invalid lines, None means no limit
+    :param encoding: encoding used to open `file` and `rejects` when they are paths
+    :param fail_fast: stop validating a line at its first invalid field
+    """
+    batch_validate = validator_class._make_batch_validate(fail_fast)
+    fp, close_fp = _open(file, 'r', encoding)
+    rejects_fp, close_rejects = (None, False) if rejects is None else _open(rejects, 'w', encoding)
+    n_errors = 0
+    try:
+        for line_no, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                raw_data = json.loads(line)
+            except ValueError as e:
+                errors = {'__data_error__': _('invalid JSON: {}').format(e)}
+            else:
+                if isinstance(raw_data, dict):
+                    data, errors = batch_validate(raw_data)
+                else:
+                    errors = {'__data_error__': _('expected a JSON object, got {}').format(type(raw_data).__name__)}
+
+            if errors is None:
+                yield line_no, data
+                continue
+
+            n_errors += 1
+            if rejects_fp is not None:
+                if isinstance(line, six.binary_type):
+                    line = line.decode(encoding)
+                if not line.endswith('\n'):
+                    line += '\n'
+                rejects_fp.write(line)
+            if not skip_invalid:
+                yield line_no, exceptions.ValidationError(errors)
+            if max_errors is not None and n_errors >= max_errors:
+                break
+    finally:
+        if close_fp:
+            fp.close()
+        if close_rejects:
+            rejects_fp.close()
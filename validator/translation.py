@@ -37,3 +37,11 @@ except ImportError as e:
     
     def lngettext(singular, plural, n):
         return translation.lngettext(singular, plural, n)
+
+
+def gettext_noop(s):
+    """
+    mark `s` as a translation string without translating it,
+    it is translated when it is used, e.g. when the detail of a error is read.
+    """
+    return s
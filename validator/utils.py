@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+import re
+import threading
+from collections import OrderedDict, namedtuple
 import six
 
 def force_text(s, encoding='utf8', errors='strict'):
@@ -43,4 +46,80 @@ if six.PY3:
     force_str = force_text
 else:
     force_str = force_bytes
-    force_unicode = force_text
\ No newline at end of file
+    force_unicode = force_text
+
+
+# statistics of `LRUCache`, same as `functools.lru_cache`
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache(object):
+    """
+    a thread-safe bounded mapping which discards the least recently used item.
+    if `maxsize` is None the cache can grow without bound.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            # move it to the end
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+# compiled regular expressions shared by all fields, see `compile_regex`
+REGEX_CACHE = LRUCache(maxsize=512)
+
+
+def compile_regex(pattern, flags=0):
+    """
+    return the compiled `pattern`, identical patterns are compiled only once.
+    `pattern` can be a string or a compiled pattern, which is returned as is.
+    """
+    if not isinstance(pattern, (six.text_type, six.binary_type)):
+        return pattern
+    key = (type(pattern), pattern, flags)
+    regex = REGEX_CACHE.get(key)
+    if regex is None:
+        regex = re.compile(pattern, flags)
+        REGEX_CACHE.set(key, regex)
+    return regex
+
+
+compile_regex.cache_info = REGEX_CACHE.info
+compile_regex.cache_clear = REGEX_CACHE.clear
@@ -1,9 +1,46 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+import types
+import inspect
+import threading
+from collections import namedtuple
 import six
-from . import exceptions
-from .fields import BaseField, EMPTY_VALUE, create_field, DictField
-from .utils import force_str
+from . import exceptions, compiler, instrumentation
+from .fields import BaseField, EMPTY_VALUE, create_field, DictField, ListField
+from .utils import force_str, LRUCache
+
+# result of `Validator.validate_many`
+# validated_data: a list of validated data of the valid records, in input order
+# errors: a dict maps the position of a invalid record to its errors dict
+BatchResult = namedtuple('BatchResult', ['validated_data', 'errors'])
+
+# result of `Validator.validate_columns`
+# mask: a list of bool, True if the row is valid
+# errors: a dict maps (row, field name) to the error
+ColumnsResult = namedtuple('ColumnsResult', ['mask', 'errors'])
+
+
+class ValidationResult(namedtuple('ValidationResult', ['validated_data', 'errors'])):
+    """
+    immutable result of `Validator.check`.
+
+    validated_data: the validated data, None if the data is invalid
+    errors: a read-only mapping of field name to error, empty if the data is valid
+    """
+    __slots__ = ()
+
+    @property
+    def is_valid(self):
+        return not self.errors
+
+    def __bool__(self):
+        return not self.errors
+
+    __nonzero__ = __bool__
+
+
+_NO_ERRORS = types.MappingProxyType({})
+
 
 class ValidatorMetaClass(type):
 
@@ -25,7 +62,136 @@ class ValidatorMetaClass(type):
 
         attrs['_FIELDS_MAP'] = parent_fields_map
 
-        return super(ValidatorMetaClass, cls).__new__(cls, cls_name, bases, attrs)
+        clazz = super(ValidatorMetaClass, cls).__new__(cls, cls_name, bases, attrs)
+        clazz._FIELDS_PLAN = _build_fields_plan(clazz)
+        clazz._HAS_ASYNC = _has_async_validators(clazz)
+        # per thread shared instance used by `check`
+        clazz._LOCAL = threading.local()
+        # see `enable_instrumentation`
+        clazz._INSTRUMENTATION = None
+
+        compiled = clazz.COMPILED
+        if compiled is None:
+            compiled = compiler.DEFAULT_COMPILED
+        if compiled:
+            clazz._validate_fields = compiler.compile_fields_validator(clazz)
+        else:
+            clazz._validate_fields = clazz._interpreted_validate_fields
+        return clazz
+
+
+def _find_class_attr(clazz, name):
+    """
+    find `name` in the __dict__ of clazz and its bases, without invoking descriptors
+    """
+    for klass in clazz.__mro__:
+        if name in vars(klass):
+            return vars(klass)[name]
+    return None
+
+
+def _find_hook(clazz, hook_name):
+    """
+    find the `validate_<name>` hook in the __dict__ of clazz and its bases.
+    the methods of `Validator` itself (e.g. `validate_many`) are not hooks, so fields
+    can be named after them.
+    """
+    for klass in clazz.__mro__:
+        if hook_name in vars(klass):
+            if klass.__name__ == 'Validator' and klass.__module__ == __name__:
+                return None
+            return vars(klass)[hook_name]
+    return None
+
+
+def _make_hook(clazz, name):
+    """
+    return a function `hook(validator, value)` for the `validate_<name>` method, or None
+    """
+    hook_name = 'validate_{}'.format(name)
+    hook = _find_hook(clazz, hook_name)
+    if hook is None:
+        return None
+    if isinstance(hook, types.FunctionType):
+        # plain method, call it as hook(self, value)
+        return hook
+    if not callable(getattr(clazz, hook_name, None)):
+        return None
+
+    # staticmethod, classmethod or other descriptors, resolve them per instance
+    def _hook(validator, value):
+        return getattr(validator, hook_name)(value)
+    return _hook
+
+
+def _is_async_callable(func):
+    if not hasattr(inspect, 'iscoroutinefunction'):
+        return False
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(getattr(func, '__call__', None))
+
+
+def _nested_has_async(field):
+    """
+    whether the item field of a ListField or the Validator class of a DictField has
+    async validators, `validate_<name>` hooks or `validate`
+    """
+    if isinstance(field, ListField) and field.field is not None:
+        item = field.field
+        return any(_is_async_callable(v) for v in item.validators) or _nested_has_async(item)
+    if isinstance(field, DictField) and field.validator is not None:
+        return field.validator._HAS_ASYNC
+    return False
+
+
+def _has_async_validators(clazz):
+    """
+    whether any field validator, `validate_<name>` hook or `validate` of clazz is a coroutine function.
+    raise ValueError if a nested field has async validators, they can't be awaited.
+    """
+    for name, field in six.iteritems(clazz._FIELDS_MAP):
+        if _nested_has_async(field):
+            raise ValueError(
+                'field {} of {} has nested async validators, only the validators of top-level '
+                'fields can be async'.format(name, clazz.__name__))
+    if _is_async_callable(getattr(clazz, 'validate', None)):
+        return True
+    for name, field in six.iteritems(clazz._FIELDS_MAP):
+        hook_name = 'validate_{}'.format(name)
+        if _find_hook(clazz, hook_name) is not None and _is_async_callable(getattr(clazz, hook_name)):
+            return True
+        if any(_is_async_callable(v) for v in field.validators):
+            return True
+    return False
+
+
+def _build_fields_plan(clazz):
+    """
+    build a flat validation plan from `clazz._FIELDS_MAP`.
+
+    every item of the plan is a tuple:
+    (name, check, to_internal, hook, default, default_factory, required)
+
+    - `check` and `to_internal` are the bound `_check_value` and `to_internal` methods of the field.
+    - `hook` is the `validate_<name>` function or None.
+    - `default_factory` is a callable returning the default value, or None when
+      `default` can be used directly.
+    """
+    plan = []
+    for name, field in six.iteritems(clazz._FIELDS_MAP):
+        if callable(field.default) or type(field).get_default != BaseField.get_default:
+            default, default_factory = EMPTY_VALUE, field.get_default
+        else:
+            default, default_factory = field.default, None
+        plan.append((
+            name,
+            field._check_value,
+            field.to_internal,
+            _make_hook(clazz, name),
+            default,
+            default_factory,
+            field.is_required(),
+        ))
+    return tuple(plan)
 
 
 @six.add_metaclass(ValidatorMetaClass)
@@ -33,6 +199,13 @@ class Validator(object):
     """ a data validator like Django ORM
     """
 
+    # sub-class which does not define __slots__ has a __dict__, so it can have any attributes
+    __slots__ = ('raw_data', 'validated_data', 'errors')
+
+    # if COMPILED is True, a specialized `_validate_fields` function is generated for this class,
+    # None means using the default value which is set by environment variable PYTHON_VALIDATOR_COMPILED.
+    COMPILED = None
+
     def __init__(self, raw_data):
         """
         :param raw_data: unvalidate data
@@ -42,13 +215,29 @@ class Validator(object):
         self.validated_data = None
         self.errors = {}
 
-    def _validate(self):
+    def _interpreted_validate_fields(self, raw_data, fail_fast=False):
+        """
+        validate every field of `raw_data`, return (data, errors),
+        `errors` is None if all fields are valid.
+        if `fail_fast` is True, return at the first invalid field.
+        """
         data = {}
-        for name, field in six.iteritems(self._FIELDS_MAP):
-            value = self.raw_data.get(name, field.get_default())
+        errors = None
+        for name, check, to_internal, hook, default, default_factory, required in self._FIELDS_PLAN:
+            if name in raw_data:
+                value = raw_data[name]
+            elif default_factory is None:
+                value = default
+            else:
+                value = default_factory()
+
             if value is EMPTY_VALUE:
-                if field.is_required():
-                    self.errors[name] = exceptions.FieldRequiredError()
+                if required:
+                    if errors is None:
+                        errors = {}
+                    errors[name] = exceptions.FieldRequiredError()
+                    if fail_fast:
+                        return data, errors
                 continue
 
             # dont need to validate None
@@ -56,33 +245,227 @@ class Validator(object):
                 data[name] = None
                 continue
 
-            try:
-                validated_value = field.validate(value)
-                internal_value = field.to_internal(validated_value)
-                field_validator = getattr(
-                    self, 'validate_{}'.format(name), None)
-                if field_validator and callable(field_validator):
-                    field_validator(internal_value)
-                data[name] = internal_value
-            except exceptions.FieldValidationError as e:
-                self.errors[name] = e
-
-        if self.errors:
-            return
+            # built-in fields return errors instead of raising them
+            value, error = check(value)
+            if error is None:
+                try:
+                    value = to_internal(value)
+                    if hook is not None:
+                        hook(self, value)
+                    data[name] = value
+                    continue
+                except exceptions.FieldValidationError as e:
+                    error = e
+            if errors is None:
+                errors = {}
+            errors[name] = error
+            if fail_fast:
+                return data, errors
+        return data, errors
+
+    # replaced by ValidatorMetaClass
+    _validate_fields = _interpreted_validate_fields
+
+    def _validate_data(self, raw_data, fail_fast=False):
+        """
+        validate fields and call `validate`, return (validated_data, errors),
+        `errors` is None if raw_data is valid.
+        this doesn't touch `self.errors` and `self.validated_data`.
+        """
+        data, errors = self._validate_fields(raw_data, fail_fast)
+        if errors:
+            return None, errors
         try:
-            data = self.validate(data)
+            return self.validate(data), None
         except exceptions.ValidationError as e:
-            self.errors['__data_error__'] = e
+            return None, {'__data_error__': e}
 
-        if not self.errors:
+    def _validate(self, fail_fast=False):
+        data, errors = self._validate_data(self.raw_data, fail_fast)
+        if errors:
+            self.errors.update(errors)
+        else:
             self.validated_data = data
 
-    def is_valid(self, raise_error=False):
-        self._validate()
+    def is_valid(self, raise_error=False, fail_fast=False):
+        """
+        :param raise_error: raise ValidationError if data is invalid
+        :param fail_fast: stop at the first invalid field, `errors` contains only one error,
+                          the model-level `validate` is not called.
+        """
+        self._validate(fail_fast)
         if raise_error and self.errors:
             raise exceptions.ValidationError(self.errors)
         return False if self.errors else True
 
+    @classmethod
+    def _can_share_instance(cls):
+        """
+        whether an instance created without calling `__init__` can be shared by many raw data,
+        i.e. `__init__` is not overridden.
+        """
+        return _find_class_attr(cls, '__init__') is vars(Validator)['__init__']
+
+    @classmethod
+    def _new_shared_instance(cls):
+        """
+        create a instance without calling `__init__`, used to validate many raw data
+        """
+        validator = cls.__new__(cls)
+        validator.raw_data = None
+        validator.validated_data = None
+        validator.errors = {}
+        return validator
+
+    @classmethod
+    def check(cls, raw_data, fail_fast=False):
+        """
+        validate `raw_data`, return a immutable `ValidationResult`.
+
+        unlike `is_valid`, no instance is created per call: every thread uses its own
+        shared instance, its `raw_data` is set to the data being validated so
+        `validate_<name>` hooks and `validate` still work. it is safe to call `check`
+        concurrently from many threads.
+        if `__init__` is overridden, a instance is created by `cls(raw_data)` per call.
+        """
+        assert isinstance(raw_data, dict), '"raw_data" must be a dict, not "{}"'.format(type(raw_data).__name__)
+        if not cls._can_share_instance():
+            data, errors = cls(raw_data)._validate_data(raw_data, fail_fast)
+            return cls._make_result(data, errors)
+        local = cls._LOCAL
+        try:
+            validator = local.validator
+        except AttributeError:
+            validator = local.validator = cls._new_shared_instance()
+        # `check` may be called again by a hook of the same class
+        previous = validator.raw_data
+        validator.raw_data = raw_data
+        try:
+            data, errors = validator._validate_data(raw_data, fail_fast)
+        finally:
+            validator.raw_data = previous
+        return cls._make_result(data, errors)
+
+    @staticmethod
+    def _make_result(data, errors):
+        if errors is None:
+            return ValidationResult(data, _NO_ERRORS)
+        return ValidationResult(None, types.MappingProxyType(errors))
+
+    @classmethod
+    def _make_batch_validate(cls, fail_fast=False):
+        """
+        return a function `batch_validate(raw_data) -> (validated_data, errors)`,
+        `errors` is None if raw_data is valid.
+
+        only one Validator instance is created for all calls (without calling `__init__`),
+        its `raw_data` is set to the data being validated, so `validate_<name>` hooks and
+        `validate` still work. A errors dict is only created for invalid data.
+        if `__init__` is overridden, a instance is created by `cls(raw_data)` per call.
+        """
+        if not cls._can_share_instance():
+            def batch_validate(raw_data):
+                assert isinstance(raw_data, dict), '"raw_data" must be a dict, not "{}"'.format(type(raw_data).__name__)
+                return cls(raw_data)._validate_data(raw_data, fail_fast)
+            return batch_validate
+
+        validator = cls._new_shared_instance()
+        validate_data = validator._validate_data
+
+        def batch_validate(raw_data):
+            assert isinstance(raw_data, dict), '"raw_data" must be a dict, not "{}"'.format(type(raw_data).__name__)
+            validator.raw_data = raw_data
+            return validate_data(raw_data, fail_fast)
+        return batch_validate
+
+    @classmethod
+    def validate_many(cls, records, fail_fast=False):
+        """
+        validate an iterable of raw data, return a `BatchResult`.
+        see `_make_batch_validate`.
+        if `fail_fast` is True, the errors of a invalid record contain only its first invalid field.
+        """
+        batch_validate = cls._make_batch_validate(fail_fast)
+        validated_data = []
+        errors = {}
+        for i, raw_data in enumerate(records):
+            data, data_errors = batch_validate(raw_data)
+            if data_errors is None:
+                validated_data.append(data)
+            else:
+                errors[i] = data_errors
+        return BatchResult(validated_data, errors)
+
+    @classmethod
+    def enable_instrumentation(cls, callback=None):
+        """
+        record per-field call counts, failure counts and cumulative time (in nanoseconds)
+        of this class, see `instrumentation_snapshot`.
+
+        :param callback: optional, called as `callback(name, elapsed_ns, error)` after every
+                         field is validated, `error` is None if the field is valid.
+
+        while instrumentation is enabled, compiled classes use the interpreted validation.
+        when it is disabled, validation doesn't pay anything for it.
+        """
+        current = vars(cls)['_INSTRUMENTATION']
+        if current is not None:
+            current.callback = callback
+            return
+        cls._INSTRUMENTATION = instrumentation.Instrumentation(
+            cls._FIELDS_MAP, callback, vars(cls)['_validate_fields'])
+        cls._validate_fields = instrumentation.instrumented_validate_fields
+
+    @classmethod
+    def disable_instrumentation(cls):
+        """
+        stop recording and drop the statistics
+        """
+        current = vars(cls)['_INSTRUMENTATION']
+        if current is not None:
+            cls._validate_fields = current.validate_fields
+            cls._INSTRUMENTATION = None
+
+    @classmethod
+    def reset_instrumentation(cls):
+        current = vars(cls)['_INSTRUMENTATION']
+        if current is not None:
+            current.reset()
+
+    @classmethod
+    def instrumentation_snapshot(cls):
+        """
+        return a dict `{name: {'calls': int, 'failures': int, 'time_ns': int}}`,
+        or None if instrumentation is disabled.
+        """
+        current = vars(cls)['_INSTRUMENTATION']
+        if current is None:
+            return None
+        return current.snapshot()
+
+    @classmethod
+    def validate_columns(cls, columns):
+        """
+        validate column-wise data `{field_name: sequence}`, every sequence holds the values
+        of a field for all rows, it can be a list, a tuple, an `array.array` or a `numpy.ndarray`.
+        return a `ColumnsResult(mask, errors)`. see `validator.columnar`.
+
+        the values are checked column by column, without building a dict for every row.
+        classes with `validate_<name>` hooks or a custom `validate` are validated row by row.
+        """
+        from .columnar import validate_columns
+        return validate_columns(cls, columns)
+
+    def is_valid_async(self, raise_error=False, concurrency=None):
+        """
+        coroutine version of `is_valid`, supports async field validators, `validate_<name>` hooks
+        and `validate`. see `validator.aio.is_valid_async`.
+
+        usage: `await v.is_valid_async()`
+        """
+        from .aio import is_valid_async
+        return is_valid_async(self, raise_error=raise_error, concurrency=concurrency)
+
     def validate(self, data):
         """
         model-level validate.
@@ -135,23 +518,78 @@ class Validator(object):
         return self._format()
 
 
-def create_validator(data_struct_dict, name=None):
+def _schema_key(value):
+    """
+    return a hashable canonical key of a schema value, dicts with the same items
+    have the same key regardless of their order.
+    the type of scalar values is part of the key, so `1`, `1.0` and `True` are different.
+    raise TypeError if value contains unhashable objects of unknown type.
     """
-    create a Validator instance from data_struct_dict
+    if isinstance(value, dict):
+        return (dict, tuple(sorted(
+            ((_schema_key(k), _schema_key(v)) for k, v in six.iteritems(value)),
+            key=repr,
+        )))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_schema_key(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), tuple(sorted((_schema_key(v) for v in value), key=repr)))
+    hash(value)
+    return (type(value), value)
+
+
+# generated Validator classes, keyed by the schema key, see `create_validator`
+_VALIDATOR_CACHE = LRUCache(maxsize=256)
+
+
+def create_validator(data_struct_dict, name=None, compiled=None, cache=False):
+    """
+    create a Validator class from data_struct_dict
 
     :param data_struct_dict: a dict describe validator's fields, like the dict `to_dict()` method returned.
+                             it is not modified.
     :param name: name of Validator class 
+    :param compiled: whether to generate a specialized validate function, see `Validator.COMPILED`
+    :param cache: return the cached class if a class was created from the same arguments,
+                  see `create_validator.cache_info()` and `create_validator.cache_clear()`.
+                  the cached class is shared by all callers, it must not be modified,
+                  e.g. by `enable_instrumentation` or setting attributes.
 
-    :return: Validator instance
+    :return: Validator class
     """
 
+    key = None
+    if cache:
+        try:
+            key = _schema_key((data_struct_dict, name, compiled))
+        except TypeError:
+            # unhashable params, dont cache
+            pass
+        else:
+            clazz = _VALIDATOR_CACHE.get(key)
+            if clazz is not None:
+                return clazz
+
     if name is None:
         name = 'FromDictValidator'
     attrs = {}
     for field_name, field_info in six.iteritems(data_struct_dict):
         field_type = field_info['type']
         if field_type == DictField.FIELD_TYPE_NAME and isinstance(field_info.get('validator'), dict):
-            field_info['validator'] = create_validator(field_info['validator'])
+            field_info = dict(field_info)
+            field_info['validator'] = create_validator(field_info['validator'], compiled=compiled, cache=cache)
         attrs[field_name] = create_field(field_info)
+    attrs['COMPILED'] = compiled
+    # the generated class has no custom method which may need instance attributes
+    attrs['__slots__'] = ()
+    # it can be rebuilt from `to_dict()`, see `validator.parallel`
+    attrs['_FROM_DICT'] = True
     name = force_str(name)
-    return type(name, (Validator, ), attrs)
+    clazz = type(name, (Validator, ), attrs)
+    if key is not None:
+        _VALIDATOR_CACHE.set(key, clazz)
+    return clazz
+
+
+create_validator.cache_info = _VALIDATOR_CACHE.info
+create_validator.cache_clear = _VALIDATOR_CACHE.clear